@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Iterable
 import contextlib
 from datetime import datetime
 import logging
@@ -35,7 +36,11 @@ from homeassistant.setup import (
 from homeassistant.util.async_ import gather_with_concurrency
 import homeassistant.util.dt as dt_util
 from homeassistant.util.logging import async_activate_log_queue_handler
-from homeassistant.util.package import async_get_user_site, is_virtual_env
+from homeassistant.util.package import (
+    async_get_user_site,
+    is_installed,
+    is_virtual_env,
+)
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -428,12 +433,23 @@ async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
     config: dict[str, Any],
+    timeline: SetupTimeline | None = None,
 ) -> None:
     """Set up multiple domains. Log on failure."""
-    futures = {
-        domain: hass.async_create_task(async_setup_component(hass, domain, config))
-        for domain in domains
-    }
+    if timeline is None:
+        futures = {
+            domain: hass.async_create_task(async_setup_component(hass, domain, config))
+            for domain in domains
+        }
+    else:
+        futures = {
+            domain: hass.async_create_task(
+                timeline.async_track(
+                    domain, async_setup_component(hass, domain, config)
+                )
+            )
+            for domain in domains
+        }
     await asyncio.wait(futures.values())
     errors = [domain for domain in domains if futures[domain].exception()]
     for domain in errors:
@@ -446,6 +462,115 @@ async def async_setup_multi_components(
         )
 
 
+def _requirements_installed(requirements: Iterable[str]) -> bool:
+    """Return if all requirements are installed in the expected version."""
+    return all(is_installed(req) for req in requirements)
+
+
+async def _async_preload_components(
+    hass: core.HomeAssistant,
+    integrations: Iterable[loader.Integration],
+    integration_cache: dict[str, loader.Integration],
+) -> None:
+    """Import components in the executor ahead of their setup."""
+
+    async def _async_preload(integration: loader.Integration) -> None:
+        if not hass.config.skip_pip:
+            requirements = list(integration.requirements)
+            for dep in integration.all_dependencies:
+                if dep_itg := integration_cache.get(dep):
+                    requirements.extend(dep_itg.requirements)
+            # Importing before the requirements are installed or upgraded
+            # would leave the outdated modules behind in sys.modules
+            if requirements and not await hass.async_add_executor_job(
+                _requirements_installed, requirements
+            ):
+                _LOGGER.debug(
+                    "Not preloading %s, requirements are not installed",
+                    integration.domain,
+                )
+                return
+
+        try:
+            await integration.async_get_component()
+        except Exception:  # pylint: disable=broad-except
+            # The error is reported again when the integration is set up,
+            # possibly after its requirements have been installed
+            _LOGGER.debug("Unable to preload %s", integration.domain, exc_info=True)
+
+    await gather_with_concurrency(
+        MAX_LOAD_CONCURRENTLY,
+        *(
+            _async_preload(integration)
+            for integration in integrations
+            if not integration.disabled
+        ),
+    )
+
+
+class SetupTimeline:
+    """Track when integrations finish setting up during bootstrap."""
+
+    def __init__(self, integrations: dict[str, loader.Integration]) -> None:
+        """Initialize the timeline."""
+        self._integrations = integrations
+        self._started: dict[str, float] = {}
+        self._finished: dict[str, float] = {}
+
+    async def async_track(self, domain: str, setup: Awaitable[bool]) -> bool:
+        """Track the setup of a domain."""
+        self._started[domain] = monotonic()
+        try:
+            return await setup
+        finally:
+            self._finished[domain] = monotonic()
+
+    def critical_path(self) -> list[tuple[str, float]]:
+        """Return the chain of setups that gated the end of bootstrap.
+
+        Starting from the setup that finished last, each step goes back to
+        the dependency it waited on longest or, if it did not wait on any,
+        to the setup that finished last before it was started. The seconds
+        for each domain are measured from when it was no longer waiting.
+        """
+        path: list[tuple[str, float]] = []
+        finished = self._finished
+        domain = max(finished, key=finished.__getitem__, default=None)
+        seen = set()
+        while domain is not None:
+            seen.add(domain)
+            started = self._started[domain]
+            dependencies = []
+            if (integration := self._integrations.get(domain)) is not None:
+                dependencies = [
+                    dep
+                    for dep in (
+                        *integration.dependencies,
+                        *integration.after_dependencies,
+                    )
+                    if dep not in seen and finished.get(dep, started) > started
+                ]
+            if dependencies:
+                previous = max(dependencies, key=finished.__getitem__)
+                ready = finished[previous]
+            else:
+                previous = max(
+                    (
+                        other
+                        for other, end in finished.items()
+                        if end <= started and other not in seen
+                    ),
+                    key=finished.__getitem__,
+                    default=None,
+                )
+                ready = started
+            path.append((domain, finished[domain] - ready))
+            domain = previous
+
+        path.reverse()
+        return path
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -498,15 +623,17 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    timeline = SetupTimeline(integration_cache)
+
     # Load logging as soon as possible
     if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
         _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config)
+        await async_setup_multi_components(hass, logging_domains, config, timeline)
 
     # Start up debuggers. Start these first in case they want to wait.
     if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config)
+        await async_setup_multi_components(hass, debuggers, config, timeline)
 
     # calculate what components to setup in what stage
     stage_1_domains = set()
@@ -531,6 +658,19 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
 
+    # Import the stage 2 components while the earlier stages are set up
+    hass.async_create_task(
+        _async_preload_components(
+            hass,
+            (
+                integration_cache[domain]
+                for domain in stage_2_domains
+                if domain in integration_cache
+            ),
+            integration_cache,
+        )
+    )
+
     # Load the registries
     await asyncio.gather(
         device_registry.async_load(hass),
@@ -545,7 +685,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_1_domains, config, timeline
+                )
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
 
@@ -558,7 +700,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_2_domains, config, timeline
+                )
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
@@ -573,6 +717,14 @@ async def _async_set_up_integrations(
     watch_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATONS, {})
 
+    if critical_path := timeline.critical_path():
+        _LOGGER.info(
+            "Integrations gating startup: %s",
+            " -> ".join(
+                f"{domain} ({seconds:.2f}s)" for domain, seconds in critical_path
+            ),
+        )
+
     _LOGGER.debug(
         "Integration setup times: %s",
         {
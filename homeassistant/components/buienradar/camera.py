@@ -142,6 +142,11 @@ class BuienradarCam(Camera):
             _LOGGER.error("Failed to fetch image, %s", type(err))
             return False
 
+    @property
+    def snapshot_cache_ttl(self) -> float:
+        """Return 0, the camera caches the radar image itself."""
+        return 0
+
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
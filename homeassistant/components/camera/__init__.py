@@ -14,6 +14,7 @@ import inspect
 import logging
 import os
 from random import SystemRandom
+import time
 from typing import Final, cast, final
 
 from aiohttp import web
@@ -101,6 +102,10 @@ _RND: Final = SystemRandom()
 
 MIN_STREAM_INTERVAL: Final = 0.5  # seconds
 
+MAX_CACHED_IMAGES: Final = 8
+# Below the 10 seconds between refreshes of a camera card
+DEFAULT_SNAPSHOT_CACHE_TTL: Final = 5  # seconds
+
 CAMERA_SERVICE_SNAPSHOT: Final = {vol.Required(ATTR_FILENAME): cv.template}
 
 CAMERA_SERVICE_PLAY_STREAM: Final = {
@@ -143,11 +148,133 @@ async def async_request_stream(hass: HomeAssistant, entity_id: str, fmt: str) ->
     return await _async_stream_endpoint_url(hass, camera, fmt)
 
 
+class CameraImageCache:
+    """Share snapshot fetches of a camera and cache the images.
+
+    Concurrent requests for the same size share one fetch. Snapshots for
+    the camera proxy and thumbnails are kept for the snapshot_cache_ttl of
+    the camera and scaled images are reused as long as the snapshot they
+    were made from did not change.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._fetches: dict[
+            tuple[int | None, int | None], asyncio.Future[Image | None]
+        ] = {}
+        self._snapshots: dict[tuple[int | None, int | None], tuple[float, Image]] = {}
+        self._scaled: dict[tuple[int, int], tuple[bytes, bytes]] = {}
+        self.snapshot_hits = 0
+        self.snapshot_misses = 0
+        self.scaled_hits = 0
+        self.scaled_misses = 0
+
+    @property
+    def snapshot_hit_rate(self) -> float | None:
+        """Return the percentage of snapshots served without a fetch."""
+        return _hit_rate(self.snapshot_hits, self.snapshot_misses)
+
+    @property
+    def scaled_hit_rate(self) -> float | None:
+        """Return the percentage of scaled images served without scaling."""
+        return _hit_rate(self.scaled_hits, self.scaled_misses)
+
+    async def async_get_snapshot(
+        self,
+        hass: HomeAssistant,
+        key: tuple[int | None, int | None],
+        fetch: Callable[[], Awaitable[Image | None]],
+        ttl: float,
+    ) -> Image | None:
+        """Return a snapshot from the cache, a running fetch or a new fetch."""
+        if (
+            ttl
+            and (cached := self._snapshots.get(key)) is not None
+            and time.monotonic() - cached[0] < ttl
+        ):
+            self.snapshot_hits += 1
+            return cached[1]
+
+        if (future := self._fetches.get(key)) is not None:
+            self.snapshot_hits += 1
+        else:
+            self.snapshot_misses += 1
+            future = self._fetches[key] = hass.async_create_task(
+                self._async_fetch(key, fetch, ttl)
+            )
+            # Nobody may be waiting anymore when the fetch fails
+            future.add_done_callback(lambda fut: fut.cancelled() or fut.exception())
+        return await asyncio.shield(future)
+
+    async def _async_fetch(
+        self,
+        key: tuple[int | None, int | None],
+        fetch: Callable[[], Awaitable[Image | None]],
+        ttl: float,
+    ) -> Image | None:
+        """Fetch a snapshot and cache it."""
+        try:
+            image = await fetch()
+        finally:
+            del self._fetches[key]
+        if image and ttl:
+            _store(self._snapshots, key, (time.monotonic(), image))
+        return image
+
+    def scale(self, image: Image, width: int, height: int) -> Image:
+        """Scale a jpeg snapshot, reusing the result for the same snapshot."""
+        key = (width, height)
+        if (cached := self._scaled.get(key)) is not None and cached[0] == image.content:
+            self.scaled_hits += 1
+            return Image(image.content_type, cached[1])
+
+        self.scaled_misses += 1
+        content = scale_jpeg_camera_image(image, width, height)
+        _store(self._scaled, key, (image.content, content))
+        return Image(image.content_type, content)
+
+
+def _hit_rate(hits: int, misses: int) -> float | None:
+    """Return the hit rate as a percentage."""
+    if not (total := hits + misses):
+        return None
+    return round(hits / total * 100, 1)
+
+
+def _store(cache: dict, key: tuple, value: tuple) -> None:
+    """Store a value in a cache, evicting the least recently stored value."""
+    cache.pop(key, None)
+    if len(cache) >= MAX_CACHED_IMAGES:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+async def _async_fetch_image(
+    camera: Camera,
+    timeout: int,
+    width: int | None,
+    height: int | None,
+    legacy_signature: bool,
+) -> Image | None:
+    """Fetch a snapshot image from the camera itself."""
+    async with async_timeout.timeout(timeout):
+        if legacy_signature:
+            camera.async_warn_old_async_camera_image_signature()
+            image_bytes = await camera.async_camera_image()
+        else:
+            image_bytes = await camera.async_camera_image(width=width, height=height)
+
+    if not image_bytes:
+        return None
+    return Image(camera.content_type, image_bytes)
+
+
 async def _async_get_image(
     camera: Camera,
     timeout: int = 10,
     width: int | None = None,
     height: int | None = None,
+    cache_ttl: float = 0,
 ) -> Image:
     """Fetch a snapshot image from a camera.
 
@@ -156,33 +283,41 @@ async def _async_get_image(
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
     are handled.
+
+    A snapshot fetched less than cache_ttl seconds ago is reused.
     """
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
             # Calling inspect will be removed in 2022.1 after all
             # custom components have had a chance to change their signature
             sig = inspect.signature(camera.async_camera_image)
-            if "height" in sig.parameters and "width" in sig.parameters:
-                image_bytes = await camera.async_camera_image(
-                    width=width, height=height
-                )
-            else:
-                camera.async_warn_old_async_camera_image_signature()
-                image_bytes = await camera.async_camera_image()
-
-            if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
+            legacy_signature = not (
+                "height" in sig.parameters and "width" in sig.parameters
+            )
+            # Cameras with the old signature return the same image for any size
+            key = (None, None) if legacy_signature else (width, height)
+            image = await camera.image_cache.async_get_snapshot(
+                camera.hass,
+                key,
+                partial(
+                    _async_fetch_image,
+                    camera,
+                    timeout,
+                    width,
+                    height,
+                    legacy_signature,
+                ),
+                cache_ttl,
+            )
+
+            if image:
+                content_type = image.content_type
                 if (
                     width is not None
                     and height is not None
                     and ("jpeg" in content_type or "jpg" in content_type)
                 ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
+                    return camera.image_cache.scale(image, width, height)
 
                 return image
 
@@ -305,6 +440,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.components.websocket_api.async_register_command(ws_camera_web_rtc_offer)
     hass.components.websocket_api.async_register_command(websocket_get_prefs)
     hass.components.websocket_api.async_register_command(websocket_update_prefs)
+    hass.components.websocket_api.async_register_command(websocket_image_cache)
 
     await component.async_setup(config)
 
@@ -379,6 +515,7 @@ class Camera(Entity):
         self.content_type: str = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
         self._warned_old_signature = False
+        self.image_cache = CameraImageCache()
         self.async_update_token()
 
     @property
@@ -421,6 +558,15 @@ class Camera(Entity):
         """Return the interval between frames of the mjpeg stream."""
         return MIN_STREAM_INTERVAL
 
+    @property
+    def snapshot_cache_ttl(self) -> float:
+        """Return how many seconds the camera proxy and thumbnails reuse a snapshot.
+
+        Other users of the image, like image processing, always get a new
+        snapshot. Concurrent requests share a single fetch either way.
+        """
+        return DEFAULT_SNAPSHOT_CACHE_TTL
+
     @property
     def frontend_stream_type(self) -> str | None:
         """Return the type of stream supported by this camera.
@@ -638,6 +784,7 @@ class CameraImageView(CameraView):
                 CAMERA_IMAGE_TIMEOUT,
                 int(width) if width else None,
                 int(height) if height else None,
+                camera.snapshot_cache_ttl,
             )
         except (HomeAssistantError, ValueError) as ex:
             raise web.HTTPInternalServerError() from ex
@@ -679,7 +826,8 @@ async def websocket_camera_thumbnail(
     """
     _LOGGER.warning("The websocket command 'camera_thumbnail' has been deprecated")
     try:
-        image = await async_get_image(hass, msg["entity_id"])
+        camera = _get_camera_from_entity_id(hass, msg["entity_id"])
+        image = await _async_get_image(camera, cache_ttl=camera.snapshot_cache_ttl)
         await connection.send_big_result(
             msg["id"],
             {
@@ -804,6 +952,32 @@ async def websocket_update_prefs(
     connection.send_result(msg["id"], prefs.get(entity_id).as_dict())
 
 
+@callback
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "camera/image_cache",
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+def websocket_image_cache(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict
+) -> None:
+    """Handle request for the image cache hit rates of a camera."""
+    if (camera := hass.data[DOMAIN].get_entity(msg["entity_id"])) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Camera not found"
+        )
+        return
+
+    connection.send_result(
+        msg["id"],
+        {
+            "snapshot_hit_rate": camera.image_cache.snapshot_hit_rate,
+            "scaled_image_hit_rate": camera.image_cache.scaled_hit_rate,
+        },
+    )
+
+
 async def async_handle_snapshot_service(
     camera: Camera, service_call: ServiceCall
 ) -> None:
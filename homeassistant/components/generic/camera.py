@@ -120,6 +120,11 @@ class GenericCamera(Camera):
         """Return the interval between frames of the mjpeg stream."""
         return self._frame_interval
 
+    @property
+    def snapshot_cache_ttl(self):
+        """Return 0, limit_refetch_to_url_change decides when to fetch again."""
+        return 0
+
     def camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
@@ -1,26 +1,36 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
 from datetime import datetime as dt, timedelta
+from functools import partial
 from http import HTTPStatus
 import logging
+import threading
 import time
 from typing import cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from sqlalchemy import not_, or_
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder import history, models as history_models
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
+from homeassistant.const import (
+    CONF_DOMAINS,
+    CONF_ENTITIES,
+    CONF_EXCLUDE,
+    CONF_INCLUDE,
+    CONTENT_TYPE_JSON,
+)
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.deprecation import deprecated_class, deprecated_function
@@ -28,6 +38,7 @@ from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.helpers.json import json_bytes
 import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -37,6 +48,9 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "history"
 CONF_ORDER = "use_include_order"
 
+# The number of serialized entities waiting to be written to a streamed response
+STREAM_QUEUE_SIZE = 16
+
 GLOB_TO_SQL_CHARS = {
     42: "%",  # *
     46: "_",  # .
@@ -104,6 +118,7 @@ async def async_setup(hass, config):
         ws_get_statistics_during_period
     )
     hass.components.websocket_api.async_register_command(ws_get_list_statistic_ids)
+    hass.components.websocket_api.async_register_command(ws_get_history_during_period)
 
     return True
 
@@ -113,6 +128,59 @@ class LazyState(history_models.LazyState):
     """A lazy version of core State."""
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/history_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("entity_ids"): [cv.entity_id],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("minimal_response", default=False): bool,
+        vol.Optional("max_points"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+@websocket_api.async_response
+async def ws_get_history_during_period(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Handle history during period websocket command."""
+    start_time_str = msg["start_time"]
+    end_time_str = msg.get("end_time")
+
+    start_time = dt_util.parse_datetime(start_time_str)
+    if start_time:
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str:
+        end_time = dt_util.parse_datetime(end_time_str)
+        if end_time:
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = None
+
+    states = await hass.data[DATA_INSTANCE].async_add_executor_job(
+        partial(
+            history.get_significant_states,
+            hass,
+            start_time,
+            end_time,
+            msg["entity_ids"],
+            include_start_time_state=msg["include_start_time_state"],
+            significant_changes_only=msg["significant_changes_only"],
+            minimal_response=msg["minimal_response"],
+            max_points=msg.get("max_points"),
+        )
+    )
+    connection.send_result(msg["id"], states)
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/statistics_during_period",
@@ -147,7 +215,7 @@ async def ws_get_statistics_during_period(
     else:
         end_time = None
 
-    statistics = await hass.async_add_executor_job(
+    statistics = await hass.data[DATA_INSTANCE].async_add_executor_job(
         statistics_during_period,
         hass,
         start_time,
@@ -169,7 +237,7 @@ async def ws_get_list_statistic_ids(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """Fetch a list of available statistic_id."""
-    statistic_ids = await hass.async_add_executor_job(
+    statistic_ids = await hass.data[DATA_INSTANCE].async_add_executor_job(
         list_statistic_ids,
         hass,
         msg.get("statistic_type"),
@@ -191,7 +259,7 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         if datetime:
@@ -230,6 +298,15 @@ class HistoryPeriodView(HomeAssistantView):
 
         minimal_response = "minimal_response" in request.query
 
+        max_points = None
+        if max_points_str := request.query.get("max_points"):
+            try:
+                max_points = int(max_points_str)
+            except ValueError:
+                max_points = 0
+            if max_points < 1:
+                return self.json_message("Invalid max_points", HTTPStatus.BAD_REQUEST)
+
         hass = request.app["hass"]
 
         if (
@@ -239,9 +316,22 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
+        if "stream" in request.query:
+            return await self._stream_significant_states_json(
+                request,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                max_points,
+            )
+
         return cast(
             web.Response,
-            await hass.async_add_executor_job(
+            await hass.data[DATA_INSTANCE].async_add_executor_job(
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
@@ -250,6 +340,7 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                max_points,
             ),
         )
 
@@ -262,11 +353,12 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state,
         significant_changes_only,
         minimal_response,
+        max_points,
     ):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
 
-        with session_scope(hass=hass) as session:
+        with session_scope(hass=hass, read_only=True) as session:
             result = history.get_significant_states_with_session(
                 hass,
                 session,
@@ -277,6 +369,7 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                max_points,
             )
 
         result = list(result.values())
@@ -299,6 +392,89 @@ class HistoryPeriodView(HomeAssistantView):
 
         return self.json(result)
 
+    async def _stream_significant_states_json(
+        self,
+        request,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        max_points,
+    ):
+        """Stream significant states from the database as json.
+
+        The states are serialized one entity at a time in the executor and
+        written as they become available, so memory use does not grow with
+        the size of the requested period. The include order is not applied.
+        """
+        chunks: asyncio.Queue[bytes | Exception | None] = asyncio.Queue(
+            STREAM_QUEUE_SIZE
+        )
+        cancel = threading.Event()
+
+        def _put(chunk):
+            """Wait until the chunk fits in the queue."""
+            asyncio.run_coroutine_threadsafe(chunks.put(chunk), hass.loop).result()
+
+        def _serialize_significant_states():
+            """Serialize the significant states of each entity into the queue."""
+            timer_start = time.perf_counter()
+            try:
+                with session_scope(hass=hass, read_only=True) as session:
+                    for _, states in history.iter_significant_states_with_session(
+                        hass,
+                        session,
+                        start_time,
+                        end_time,
+                        entity_ids,
+                        self.filters,
+                        include_start_time_state,
+                        significant_changes_only,
+                        minimal_response,
+                        max_points,
+                    ):
+                        if cancel.is_set():
+                            return
+                        _put(json_bytes(states))
+            except Exception as err:  # pylint: disable=broad-except
+                _put(err)
+            else:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    elapsed = time.perf_counter() - timer_start
+                    _LOGGER.debug("Streamed states in %fs", elapsed)
+            finally:
+                _put(None)
+
+        response = web.StreamResponse(headers={hdrs.CONTENT_TYPE: CONTENT_TYPE_JSON})
+        response.enable_compression()
+        await response.prepare(request)
+
+        serialize_task = hass.data[DATA_INSTANCE].async_add_executor_job(
+            _serialize_significant_states
+        )
+        try:
+            await response.write(b"[")
+            separator = b""
+            while (chunk := await chunks.get()) is not None:
+                if isinstance(chunk, Exception):
+                    # Abort the response instead of sending an incomplete list
+                    raise chunk
+                await response.write(separator + chunk)
+                separator = b","
+            await response.write(b"]")
+        finally:
+            # Unblock the executor if the client went away
+            cancel.set()
+            while not chunks.empty():
+                chunks.get_nowait()
+
+        await serialize_task
+        await response.write_eof()
+        return response
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
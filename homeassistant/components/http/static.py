@@ -1,12 +1,18 @@
 """Static file handling for HTTP component."""
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass
+import hashlib
+import mimetypes
 from pathlib import Path
-from typing import Final
+import stat
+from typing import Any, Final
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 
@@ -15,37 +21,226 @@ CACHE_HEADERS: Final[Mapping[str, str]] = {
     hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"
 }
 
+# Pre-compressed siblings of a file, in order of preference
+ENCODINGS: Final = (("br", ".br"), ("gzip", ".gz"))
+MAX_HOT_FILE_SIZE: Final = 256 * 1024
+HOT_CACHE_SIZE: Final = 8 * 1024 * 1024
+# Requested paths remembered with the file they resolve to
+MAX_CACHED_PATHS: Final = 1024
+
+
+@dataclass
+class StaticFileVariant:
+    """A static file or one of its pre-compressed siblings."""
+
+    path: Path
+    size: int
+    etag: str
+
+
+@dataclass
+class StaticFile:
+    """A static file and its pre-compressed variants."""
+
+    path: Path
+    # What is compared to notice that the file or a sibling changed
+    stat_keys: tuple[tuple[int, int] | None, ...]
+    content_type: str
+    # Variant per content encoding, None is the file itself
+    variants: dict[str | None, StaticFileVariant]
+
+
+def _sibling_paths(filepath: Path) -> list[Path]:
+    """Return the file and the paths of its pre-compressed siblings."""
+    return [filepath] + [
+        filepath.with_name(filepath.name + suffix) for _, suffix in ENCODINGS
+    ]
+
+
+def _stat_keys(filepath: Path) -> tuple[tuple[int, int] | None, ...]:
+    """Return the modification time and size of a file and its siblings."""
+    stat_keys: list[tuple[int, int] | None] = []
+    for path in _sibling_paths(filepath):
+        try:
+            result = path.stat()
+        except OSError:
+            stat_keys.append(None)
+            continue
+        if stat.S_ISREG(result.st_mode):
+            stat_keys.append((result.st_mtime_ns, result.st_size))
+        else:
+            stat_keys.append(None)
+    return tuple(stat_keys)
+
+
+def _file_etag(path: Path) -> str:
+    """Return a strong etag of the content of a file."""
+    content_hash = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(65536):
+            content_hash.update(chunk)
+    return f'"{content_hash.hexdigest()[:32]}"'
+
+
+def _load_static_file(filepath: Path) -> StaticFile:
+    """Hash a file and its pre-compressed siblings.
+
+    This method must be run in the executor.
+    """
+    stat_keys = _stat_keys(filepath)
+    if stat_keys[0] is None:
+        raise FileNotFoundError(filepath)
+
+    variants: dict[str | None, StaticFileVariant] = {}
+    for encoding, path, stat_key in zip(
+        (None, *(encoding for encoding, _ in ENCODINGS)),
+        _sibling_paths(filepath),
+        stat_keys,
+    ):
+        if stat_key is not None:
+            variants[encoding] = StaticFileVariant(path, stat_key[1], _file_etag(path))
+
+    return StaticFile(
+        filepath,
+        stat_keys,
+        mimetypes.guess_type(str(filepath))[0] or "application/octet-stream",
+        variants,
+    )
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    """Return the content codings allowed by an Accept-Encoding header."""
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return if an If-None-Match header matches an ETag."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in ("*", etag):
+            return True
+    return False
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Files are served as a pre-compressed .br or .gz sibling when the client
+    accepts it. Small files are kept in memory.
+    """
+
+    def __init__(self, prefix: str, directory: str, **kwargs: Any) -> None:
+        """Initialize the static resource."""
+        super().__init__(prefix, directory, **kwargs)
+        self._paths: OrderedDict[str, Path] = OrderedDict()
+        self._files: dict[Path, StaticFile] = {}
+        self._hot_files: OrderedDict[tuple[Path, str], bytes] = OrderedDict()
+        self._hot_size = 0
 
     async def _handle(self, request: Request) -> StreamResponse:
         rel_url = request.match_info["filename"]
-        try:
-            filename = Path(rel_url)
-            if filename.anchor:
-                # rel_url is an absolute name like
-                # /static/\\machine_name\c$ or /static/D:\path
-                # where the static dir is totally different
-                raise HTTPForbidden()
-            filepath = self._directory.joinpath(filename).resolve()
-            if not self._follow_symlinks:
-                filepath.relative_to(self._directory)
-        except (ValueError, FileNotFoundError) as error:
-            # relatively safe
-            raise HTTPNotFound() from error
-        except Exception as error:
-            # perm error or other kind!
-            request.app.logger.exception(error)
-            raise HTTPNotFound() from error
-
-        # on opening a dir, load its contents if allowed
-        if filepath.is_dir():
-            return await super()._handle(request)
-        if filepath.is_file():
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                headers=CACHE_HEADERS,
+        if (filepath := self._paths.get(rel_url)) is None:
+            try:
+                filename = Path(rel_url)
+                if filename.anchor:
+                    # rel_url is an absolute name like
+                    # /static/\\machine_name\c$ or /static/D:\path
+                    # where the static dir is totally different
+                    raise HTTPForbidden()
+                filepath = self._directory.joinpath(filename).resolve()
+                if not self._follow_symlinks:
+                    filepath.relative_to(self._directory)
+            except (ValueError, FileNotFoundError) as error:
+                # relatively safe
+                raise HTTPNotFound() from error
+            except Exception as error:
+                # perm error or other kind!
+                request.app.logger.exception(error)
+                raise HTTPNotFound() from error
+
+            # on opening a dir, load its contents if allowed
+            if filepath.is_dir():
+                return await super()._handle(request)
+            if not filepath.is_file():
+                raise HTTPNotFound
+
+            # Different spellings of a path resolve to the same file
+            self._paths[rel_url] = filepath
+            if len(self._paths) > MAX_CACHED_PATHS:
+                self._paths.popitem(last=False)
+
+        static_file = self._files.get(filepath)
+        if static_file is not None and _stat_keys(filepath) != static_file.stat_keys:
+            static_file = None
+
+        if static_file is None:
+            try:
+                static_file = await asyncio.get_running_loop().run_in_executor(
+                    None, _load_static_file, filepath
+                )
+            except OSError as error:
+                self._paths.pop(rel_url, None)
+                self._files.pop(filepath, None)
+                raise HTTPNotFound() from error
+            self._files[filepath] = static_file
+
+        return await self._async_serve(request, static_file)
+
+    async def _async_serve(
+        self, request: Request, static_file: StaticFile
+    ) -> StreamResponse:
+        """Serve the variant of a file that fits the request best."""
+        accepted = _accepted_encodings(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        encoding = next(
+            (
+                encoding
+                for encoding, _ in ENCODINGS
+                if encoding in accepted and encoding in static_file.variants
+            ),
+            None,
+        )
+        variant = static_file.variants[encoding]
+        etag = variant.etag
+        headers = {**CACHE_HEADERS, hdrs.ETAG: etag}
+        if len(static_file.variants) > 1:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+        if if_none_match is not None and _etag_matches(if_none_match, etag):
+            return Response(status=304, headers=headers)
+
+        headers[hdrs.CONTENT_TYPE] = static_file.content_type
+        if encoding is not None:
+            headers[hdrs.CONTENT_ENCODING] = encoding
+
+        path = variant.path
+        if variant.size > MAX_HOT_FILE_SIZE or hdrs.RANGE in request.headers:
+            return FileResponse(path, chunk_size=self._chunk_size, headers=headers)
+
+        key = (path, etag)
+        if (body := self._hot_files.get(key)) is not None:
+            self._hot_files.move_to_end(key)
+        else:
+            body = await asyncio.get_running_loop().run_in_executor(
+                None, path.read_bytes
             )
-        raise HTTPNotFound
+            self._hot_files[key] = body
+            self._hot_size += len(body)
+            while self._hot_size > HOT_CACHE_SIZE:
+                _, evicted = self._hot_files.popitem(last=False)
+                self._hot_size -= len(evicted)
+
+        return Response(body=body, headers=headers)
@@ -1,11 +1,14 @@
 """Support for sending data to an Influx database."""
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 import logging
 import math
+import os
 import queue
 import threading
 import time
@@ -30,7 +33,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import callback
+from homeassistant.core import Event, callback
 from homeassistant.helpers import event as event_helper, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
@@ -38,6 +41,7 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+import homeassistant.util.dt as dt_util
 
 from .const import (
     API_VERSION_2,
@@ -57,6 +61,7 @@ from .const import (
     CONF_DEFAULT_MEASUREMENT,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
+    CONF_LINE_PROTOCOL,
     CONF_MEASUREMENT_ATTR,
     CONF_ORG,
     CONF_OVERRIDE_MEASUREMENT,
@@ -65,6 +70,7 @@ from .const import (
     CONF_PORT,
     CONF_PRECISION,
     CONF_RETRY_COUNT,
+    CONF_SPOOL_SIZE,
     CONF_SSL,
     CONF_SSL_CA_CERT,
     CONF_TAGS,
@@ -76,6 +82,7 @@ from .const import (
     DEFAULT_API_VERSION,
     DEFAULT_HOST_V2,
     DEFAULT_MEASUREMENT_ATTR,
+    DEFAULT_SPOOL_SIZE,
     DEFAULT_SSL_V2,
     DOMAIN,
     EVENT_NEW_STATE,
@@ -86,23 +93,34 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    PRECISION_DIVISORS,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
+    REPLAY_BATCH_SIZE,
+    REPLAY_MESSAGE,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_DIRECTORY,
+    SPOOL_ERROR,
+    SPOOL_FULL_MESSAGE,
+    SPOOL_SEGMENT_BYTES,
+    SPOOLING_MESSAGE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
+    WRITE_PIPELINE_DEPTH,
     WROTE_MESSAGE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+EPOCH = dt_util.utc_from_timestamp(0)
+
 
 def create_influx_url(conf: dict) -> dict:
     """Build URL used from config inputs and default when necessary."""
@@ -161,6 +179,8 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_LINE_PROTOCOL, default=False): cv.boolean,
+        vol.Optional(CONF_SPOOL_SIZE, default=DEFAULT_SPOOL_SIZE): cv.positive_int,
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_MEASUREMENT_ATTR, default=DEFAULT_MEASUREMENT_ATTR): vol.In(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
@@ -197,10 +217,10 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
-    """Build event to json converter and add to config."""
+def _generate_event_to_point(conf: dict) -> Callable[[Event], tuple | None]:
+    """Build converter from event to measurement, tags, fields and time."""
     entity_filter = convert_include_exclude_filter(conf)
-    tags = conf.get(CONF_TAGS)
+    global_tags = conf.get(CONF_TAGS)
     tags_attributes = conf.get(CONF_TAGS_ATTRIBUTES)
     default_measurement = conf.get(CONF_DEFAULT_MEASUREMENT)
     measurement_attr = conf.get(CONF_MEASUREMENT_ATTR)
@@ -212,8 +232,8 @@ def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
 
-    def event_to_json(event: dict) -> str:
-        """Convert event into json in format Influx expects."""
+    def event_to_point(event: Event) -> tuple | None:
+        """Convert event into the parts of an Influx point."""
         state = event.data.get(EVENT_NEW_STATE)
         if (
             state is None
@@ -262,67 +282,140 @@ def _generate_event_to_json(conf: dict) -> Callable[[dict], str]:
                 else:
                     include_uom = measurement_attr != "unit_of_measurement"
 
-        json = {
-            INFLUX_CONF_MEASUREMENT: measurement,
-            INFLUX_CONF_TAGS: {
-                CONF_DOMAIN: state.domain,
-                CONF_ENTITY_ID: state.object_id,
-            },
-            INFLUX_CONF_TIME: event.time_fired,
-            INFLUX_CONF_FIELDS: {},
+        tags = {
+            CONF_DOMAIN: state.domain,
+            CONF_ENTITY_ID: state.object_id,
         }
+        fields = {}
         if _include_state:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_STATE] = state.state
+            fields[INFLUX_CONF_STATE] = state.state
         if _include_value:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
+            fields[INFLUX_CONF_VALUE] = _state_as_value
 
         ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
         ignore_attributes.update(global_ignore_attributes)
         for key, value in state.attributes.items():
             if key in tags_attributes:
-                json[INFLUX_CONF_TAGS][key] = value
+                tags[key] = value
             elif (
                 (key != CONF_UNIT_OF_MEASUREMENT or include_uom)
                 and (key != "device_class" or include_dc)
                 and key not in ignore_attributes
             ):
                 # If the key is already in fields
-                if key in json[INFLUX_CONF_FIELDS]:
+                if key in fields:
                     key = f"{key}_"
                 # Prevent column data errors in influxDB.
                 # For each value we try to cast it as float
                 # But if we can not do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json[INFLUX_CONF_FIELDS][key] = float(value)
+                    fields[key] = float(value)
                 except (ValueError, TypeError):
                     new_key = f"{key}_str"
                     new_value = str(value)
-                    json[INFLUX_CONF_FIELDS][new_key] = new_value
+                    fields[new_key] = new_value
 
                     if RE_DIGIT_TAIL.match(new_value):
-                        json[INFLUX_CONF_FIELDS][key] = float(
-                            RE_DECIMAL.sub("", new_value)
-                        )
+                        fields[key] = float(RE_DECIMAL.sub("", new_value))
 
                 # Infinity and NaN are not valid floats in InfluxDB
                 with suppress(KeyError, TypeError):
-                    if not math.isfinite(json[INFLUX_CONF_FIELDS][key]):
-                        del json[INFLUX_CONF_FIELDS][key]
+                    if not math.isfinite(fields[key]):
+                        del fields[key]
+
+        tags.update(global_tags)
+
+        return measurement, tags, fields, event.time_fired
 
-        json[INFLUX_CONF_TAGS].update(tags)
+    return event_to_point
 
-        return json
+
+def _generate_event_to_json(conf: dict) -> Callable[[Event], dict | None]:
+    """Build event to json converter and add to config."""
+    event_to_point = _generate_event_to_point(conf)
+
+    def event_to_json(event: Event) -> dict | None:
+        """Convert event into json in format Influx expects."""
+        if (point := event_to_point(event)) is None:
+            return None
+
+        measurement, tags, fields, time_fired = point
+        return {
+            INFLUX_CONF_MEASUREMENT: measurement,
+            INFLUX_CONF_TAGS: tags,
+            INFLUX_CONF_TIME: time_fired,
+            INFLUX_CONF_FIELDS: fields,
+        }
 
     return event_to_json
 
 
+def _escape_key(key: Any) -> str:
+    """Escape a measurement, tag key, tag value or field key for line protocol."""
+    return (
+        str(key)
+        .replace("\\", "\\\\")
+        .replace(" ", "\\ ")
+        .replace(",", "\\,")
+        .replace("=", "\\=")
+        .replace("\n", "\\n")
+    )
+
+
+def _escape_field_value(value: float | str) -> str:
+    """Format a field value for line protocol."""
+    if isinstance(value, float):
+        return repr(value)
+    value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{value}"'.replace("\n", "\\n")
+
+
+def _generate_event_to_line(conf: dict) -> Callable[[Event], str | None]:
+    """Build event to line protocol converter.
+
+    The line is written straight from the parts of the point instead of
+    handing a json point to the client library to serialize.
+    """
+    event_to_point = _generate_event_to_point(conf)
+    divisor = PRECISION_DIVISORS[conf.get(CONF_PRECISION) or "ns"]
+
+    def event_to_line(event: Event) -> str | None:
+        """Convert event into a line of Influx line protocol."""
+        if (point := event_to_point(event)) is None:
+            return None
+
+        measurement, tags, fields, time_fired = point
+        if not fields:
+            return None
+
+        series = [_escape_key(measurement)]
+        for key in sorted(tags):
+            value = _escape_key(tags[key])
+            if value.endswith("\\"):
+                value += " "
+            if key and value:
+                series.append(f"{_escape_key(key)}={value}")
+        field_set = ",".join(
+            f"{_escape_key(key)}={_escape_field_value(value)}"
+            for key, value in fields.items()
+        )
+        delta = time_fired - EPOCH
+        timestamp = (
+            (delta.days * 86400 + delta.seconds) * 10 ** 9 + delta.microseconds * 1000
+        ) // divisor
+        return f"{','.join(series)} {field_set} {timestamp}"
+
+    return event_to_line
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
 
     data_repositories: list[str]
     write: Callable[[str], None]
+    write_lines: Callable[[list[str]], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -384,7 +477,13 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
                 write_v2(b"")
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
+            # Line protocol batches are pipelined by the writer itself and
+            # need to see failures to buffer them
+            write_api = influx.write_api(
+                write_options=SYNCHRONOUS
+                if conf.get(CONF_LINE_PROTOCOL)
+                else ASYNCHRONOUS
+            )
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -393,7 +492,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
             else:
                 buckets = []
 
-        return InfluxClient(buckets, write_v2, query_v2, close_v2)
+        return InfluxClient(buckets, write_v2, write_v2, query_v2, close_v2)
 
     # Else it's a V1 client
     if CONF_SSL_CA_CERT in conf and conf[CONF_VERIFY_SSL]:
@@ -424,10 +523,10 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
 
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
+    def write_v1(json, **kwargs):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(json, time_precision=precision, **kwargs)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -439,6 +538,10 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
                 raise ValueError(WRITE_ERROR % (json, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
+    def write_lines_v1(lines):
+        """Write line protocol to V1 influx."""
+        write_v1(lines, protocol="line")
+
     def query_v1(query, database=None):
         """Query V1 influx."""
         try:
@@ -465,7 +568,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):  # noqa: C90
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
 
-    return InfluxClient(databases, write_v1, query_v1, close_v1)
+    return InfluxClient(databases, write_v1, write_lines_v1, query_v1, close_v1)
 
 
 def setup(hass, config):
@@ -478,9 +581,17 @@ def setup(hass, config):
         event_helper.call_later(hass, RETRY_INTERVAL, lambda _: setup(hass, config))
         return True
 
-    event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    if conf[CONF_LINE_PROTOCOL]:
+        spool = LineProtocolSpool(
+            hass.config.path(SPOOL_DIRECTORY), conf[CONF_SPOOL_SIZE] * 1024 * 1024
+        )
+        instance = InfluxLineProtocolThread(
+            hass, influx, _generate_event_to_line(conf), max_tries, spool
+        )
+    else:
+        instance = InfluxThread(hass, influx, _generate_event_to_json(conf), max_tries)
+    hass.data[DOMAIN] = instance
     instance.start()
 
     def shutdown(event):
@@ -587,3 +698,201 @@ class InfluxThread(threading.Thread):
     def block_till_done(self):
         """Block till all events processed."""
         self.queue.join()
+
+
+class LineProtocolSpool:
+    """Bounded ring buffer of line protocol on disk.
+
+    Lines are appended to segment files of about SPOOL_SEGMENT_BYTES. When
+    the buffer grows past its size the oldest segment is dropped.
+    """
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        """Initialize the spool and pick up segments left by a previous run."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._segments: deque[list] = deque()
+        self._sealed = True
+        self._size = 0
+
+        with suppress(FileNotFoundError):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(".lp"):
+                    size = os.path.getsize(os.path.join(path, name))
+                    self._segments.append([int(name[:-3]), size])
+                    self._size += size
+
+    def __bool__(self) -> bool:
+        """Return if there are buffered lines."""
+        return bool(self._segments)
+
+    def _segment_path(self, sequence: int) -> str:
+        """Return the path of a segment."""
+        return os.path.join(self.path, f"{sequence:012d}.lp")
+
+    def append(self, lines: list[str]) -> None:
+        """Buffer lines, dropping the oldest segments when full."""
+        data = "\n".join(lines).encode() + b"\n"
+        with self._lock:
+            if (
+                self._sealed
+                or not self._segments
+                or self._segments[-1][1] >= SPOOL_SEGMENT_BYTES
+            ):
+                sequence = self._segments[-1][0] + 1 if self._segments else 0
+                self._segments.append([sequence, 0])
+                self._sealed = False
+
+            segment = self._segments[-1]
+            try:
+                os.makedirs(self.path, exist_ok=True)
+                with open(self._segment_path(segment[0]), "ab") as file:
+                    file.write(data)
+            except OSError as err:
+                _LOGGER.error(SPOOL_ERROR, len(lines), err)
+                return
+            segment[1] += len(data)
+            self._size += len(data)
+
+            dropped = 0
+            while self._size > self.max_bytes and len(self._segments) > 1:
+                sequence, size = self._segments.popleft()
+                with suppress(FileNotFoundError):
+                    os.remove(self._segment_path(sequence))
+                self._size -= size
+                dropped += size
+
+        if dropped:
+            _LOGGER.warning(SPOOL_FULL_MESSAGE, dropped)
+
+    def oldest(self) -> tuple[int, list[str]] | None:
+        """Return the oldest segment and its lines."""
+        with self._lock:
+            if not self._segments:
+                return None
+            sequence = self._segments[0][0]
+            if len(self._segments) == 1:
+                # New lines go to a new segment while this one is replayed
+                self._sealed = True
+
+        try:
+            with open(self._segment_path(sequence), encoding="utf-8") as file:
+                return sequence, file.read().splitlines()
+        except FileNotFoundError:
+            # Dropped because the buffer was full
+            return sequence, []
+
+    def remove(self, sequence: int) -> None:
+        """Remove a replayed segment."""
+        with self._lock:
+            for segment in self._segments:
+                if segment[0] == sequence:
+                    self._segments.remove(segment)
+                    self._size -= segment[1]
+                    break
+            with suppress(FileNotFoundError):
+                os.remove(self._segment_path(sequence))
+
+
+class InfluxLineProtocolThread(InfluxThread):
+    """A threaded event handler writing line protocol.
+
+    Batches are written by a pool of writers so a slow write does not hold
+    up the next batches. While InfluxDB cannot be reached batches are put
+    in the spool, which is replayed once a write succeeds again.
+    """
+
+    def __init__(self, hass, influx, event_to_line, max_tries, spool):
+        """Initialize the listener."""
+        super().__init__(hass, influx, event_to_line, max_tries)
+        self.spool = spool
+        self._executor = ThreadPoolExecutor(
+            max_workers=WRITE_PIPELINE_DEPTH, thread_name_prefix=f"{DOMAIN}_writer"
+        )
+        self._slots = threading.BoundedSemaphore(WRITE_PIPELINE_DEPTH)
+        self._lock = threading.Lock()
+        self._retry_at = None
+        self._replaying = False
+
+    def _write_batch(self, lines):
+        """Write a batch of lines or buffer them if InfluxDB is unreachable."""
+        with self._lock:
+            if self._retry_at is not None:
+                if time.monotonic() < self._retry_at:
+                    self.spool.append(lines)
+                    return
+                # Only one batch at a time checks if InfluxDB is back
+                self._retry_at = time.monotonic() + RETRY_DELAY
+
+        try:
+            self.influx.write_lines(lines)
+        except ValueError as err:
+            _LOGGER.error(err)
+            return
+        except ConnectionError as err:
+            with self._lock:
+                if self._retry_at is None:
+                    _LOGGER.error(SPOOLING_MESSAGE, err)
+                self._retry_at = time.monotonic() + RETRY_DELAY
+            self.spool.append(lines)
+            return
+
+        with self._lock:
+            self._retry_at = None
+        _LOGGER.debug(WROTE_MESSAGE, len(lines))
+
+        if self.spool:
+            self._replay()
+
+    def _replay(self):
+        """Write the lines buffered in the spool."""
+        with self._lock:
+            if self._replaying:
+                return
+            self._replaying = True
+
+        _LOGGER.info(REPLAY_MESSAGE)
+        try:
+            while not self.shutdown and (segment := self.spool.oldest()):
+                sequence, lines = segment
+                for start in range(0, len(lines), REPLAY_BATCH_SIZE):
+                    try:
+                        self.influx.write_lines(
+                            lines[start : start + REPLAY_BATCH_SIZE]
+                        )
+                    except ValueError as err:
+                        _LOGGER.error(err)
+                self.spool.remove(sequence)
+        except ConnectionError as err:
+            with self._lock:
+                if self._retry_at is None:
+                    _LOGGER.error(SPOOLING_MESSAGE, err)
+                self._retry_at = time.monotonic() + RETRY_DELAY
+        finally:
+            with self._lock:
+                self._replaying = False
+
+    def _release_slot(self, _):
+        """Let the next batch into the pipeline."""
+        self._slots.release()
+
+    def run(self):
+        """Process incoming events."""
+        while not self.shutdown:
+            count, lines = self.get_events_json()
+            if lines:
+                self._slots.acquire()
+                future = self._executor.submit(self._write_batch, lines)
+                future.add_done_callback(self._release_slot)
+            for _ in range(count):
+                self.queue.task_done()
+        self._executor.shutdown()
+
+    def block_till_done(self):
+        """Block till all events processed and written."""
+        super().block_till_done()
+        for _ in range(WRITE_PIPELINE_DEPTH):
+            self._slots.acquire()
+        for _ in range(WRITE_PIPELINE_DEPTH):
+            self._slots.release()
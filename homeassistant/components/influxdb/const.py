@@ -32,6 +32,8 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_LINE_PROTOCOL = "line_protocol"
+CONF_SPOOL_SIZE = "spool_size"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -78,6 +80,12 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+WRITE_PIPELINE_DEPTH = 3
+REPLAY_BATCH_SIZE = 5000
+SPOOL_DIRECTORY = ".influxdb_spool"
+SPOOL_SEGMENT_BYTES = 1024 * 1024
+DEFAULT_SPOOL_SIZE = 100  # megabytes
+PRECISION_DIVISORS = {"ns": 1, "us": 10 ** 3, "ms": 10 ** 6, "s": 10 ** 9}
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -119,6 +127,10 @@ QUERY_ERROR = (
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
+SPOOLING_MESSAGE = "%s Buffering events on disk until InfluxDB is reachable again."
+REPLAY_MESSAGE = "Resumed, replaying events buffered on disk."
+SPOOL_ERROR = "Could not buffer %d events on disk due to '%s'."
+SPOOL_FULL_MESSAGE = "Disk buffer is full, dropped %d bytes of the oldest events."
 WROTE_MESSAGE = "Wrote %d events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
@@ -75,6 +75,11 @@ class LocalFile(Camera):
         if content is not None:
             self.content_type = content
 
+    @property
+    def snapshot_cache_ttl(self) -> float:
+        """Return 0, the file is read again for every request."""
+        return 0
+
     def camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
@@ -14,8 +14,10 @@ import voluptuous as vol
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -60,6 +62,8 @@ DOMAIN = "logbook"
 
 GROUP_BY_MINUTES = 15
 
+MAX_CONTEXT_IDS_PER_QUERY = 250
+
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
@@ -86,6 +90,7 @@ ALL_EVENT_TYPES = [
 ]
 
 EVENT_COLUMNS = [
+    Events.event_id,
     Events.event_type,
     Events.event_data,
     Events.time_fired,
@@ -233,6 +238,43 @@ class LogbookView(HomeAssistantView):
                 "Can't combine entity with context_id", HTTPStatus.BAD_REQUEST
             )
 
+        if (limit := request.query.get("limit")) is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                limit = 0
+            if limit < 1:
+                return self.json_message("Invalid limit", HTTPStatus.BAD_REQUEST)
+
+        if (cursor := request.query.get("cursor")) is not None:
+            if limit is None:
+                return self.json_message(
+                    "Can't pass cursor without limit", HTTPStatus.BAD_REQUEST
+                )
+            if (cursor := decode_cursor(cursor)) is None:
+                return self.json_message("Invalid cursor", HTTPStatus.BAD_REQUEST)
+
+        def json_events_page():
+            """Fetch a page of events and generate JSON."""
+            entries, next_cursor = _get_events_page(
+                hass,
+                start_day,
+                end_day,
+                limit,
+                cursor,
+                entity_ids,
+                self.filters,
+                self.entities_filter,
+                entity_matches_only,
+                context_id,
+            )
+            return self.json(
+                {
+                    "entries": entries,
+                    "next_cursor": next_cursor and encode_cursor(next_cursor),
+                }
+            )
+
         def json_events():
             """Fetch events and generate JSON."""
             return self.json(
@@ -248,7 +290,9 @@ class LogbookView(HomeAssistantView):
                 )
             )
 
-        return await hass.async_add_executor_job(json_events)
+        return await hass.data[DATA_INSTANCE].async_add_executor_job(
+            json_events if limit is None else json_events_page
+        )
 
 
 def humanify(hass, events, entity_attr_cache, context_lookup):
@@ -427,57 +471,210 @@ def _get_events(
         for row in query.yield_per(1000):
             event = LazyEventPartialState(row)
             context_lookup.setdefault(event.context_id, event)
-            if event.event_type == EVENT_CALL_SERVICE:
-                continue
-            if event.event_type == EVENT_STATE_CHANGED or _keep_event(
-                hass, event, entities_filter
-            ):
+            if _include_event(hass, event, entities_filter):
                 yield event
 
     if entity_ids is not None:
         entities_filter = generate_filter([], entity_ids, [], [])
 
-    with session_scope(hass=hass) as session:
-        old_state = aliased(States, name="old_state")
+    with session_scope(hass=hass, read_only=True) as session:
+        query = _generate_logbook_query(
+            hass,
+            session,
+            start_day,
+            end_day,
+            entity_ids,
+            filters,
+            entity_matches_only,
+            context_id,
+        )
+
+        return list(
+            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+        )
 
-        if entity_ids is not None:
-            query = _generate_events_query_without_states(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_event_types_filter(
-                hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
-            )
-            if entity_matches_only:
-                # When entity_matches_only is provided, contexts and events that do not
-                # contain the entity_ids are not included in the logbook response.
-                query = _apply_event_entity_id_matchers(query, entity_ids)
-
-            query = query.union_all(
-                _generate_states_query(
-                    session, start_day, end_day, old_state, entity_ids
-                )
-            )
-        else:
-            query = _generate_events_query(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_events_types_and_states_filter(
-                hass, query, old_state
-            ).filter(
-                (States.last_updated == States.last_changed)
-                | (Events.event_type != EVENT_STATE_CHANGED)
+
+def _get_events_page(
+    hass,
+    start_day,
+    end_day,
+    limit,
+    cursor=None,
+    entity_ids=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    context_id=None,
+):
+    """Get a page of events for a period of time.
+
+    Only the rows of the page are fetched and humanified. The context of
+    each entry is resolved by looking up the origin events of the contexts
+    on the page instead of collecting every context in the period.
+
+    A page is extended until the grouping window of its last entry is
+    complete, so pages are grouped the same way as a single request for
+    the whole period. Returns the entries and the cursor of the next page,
+    which is None when the period is exhausted.
+    """
+    assert not (
+        entity_ids and context_id
+    ), "can't pass in both entity_ids and context_id"
+
+    entity_attr_cache = EntityAttributeCache(hass)
+
+    if entity_ids is not None:
+        entities_filter = generate_filter([], entity_ids, [], [])
+
+    with session_scope(hass=hass, read_only=True) as session:
+
+        def query_rows(extra_filter):
+            return _generate_logbook_query(
+                hass,
+                session,
+                start_day,
+                end_day,
+                entity_ids,
+                filters,
+                entity_matches_only,
+                context_id,
+                extra_filter,
             )
-            if filters:
-                query = query.filter(
-                    filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
-                )
 
-            if context_id is not None:
-                query = query.filter(Events.context_id == context_id)
+        events = []
+        events_by_id = {}
+        group = None
+        position = cursor
+        next_cursor = None
+        while next_cursor is None:
+            extra_filter = None if position is None else _after_cursor(*position)
+            rows = query_rows(extra_filter).limit(limit).all()
+            for row in rows:
+                event = LazyEventPartialState(row)
+                if _include_event(hass, event, entities_filter):
+                    event_group = event.time_fired_minute // GROUP_BY_MINUTES
+                    if len(events) >= limit and event_group != group:
+                        next_cursor = position
+                        break
+                    events.append(event)
+                    group = event_group
+                events_by_id[row.event_id] = event
+                position = (row.time_fired, row.event_id)
+            if len(rows) < limit:
+                break
+
+        context_lookup = {None: None}
+        context_ids = {
+            context
+            for event in events
+            for context in (event.context_id, event.context_parent_id)
+            if context is not None
+        }
+        context_ids = list(context_ids)
+        for idx in range(0, len(context_ids), MAX_CONTEXT_IDS_PER_QUERY):
+            chunk = context_ids[idx : idx + MAX_CONTEXT_IDS_PER_QUERY]
+            for row in query_rows(Events.context_id.in_(chunk)):
+                if row.context_id in context_lookup:
+                    continue
+                # Reuse the event of the page so the entry is recognized as
+                # the origin of its own context
+                context_lookup[row.context_id] = events_by_id.get(
+                    row.event_id
+                ) or LazyEventPartialState(row)
 
-        query = query.order_by(Events.time_fired)
+        entries = list(humanify(hass, events, entity_attr_cache, context_lookup))
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+    return entries, next_cursor
+
+
+def _include_event(hass, event, entities_filter):
+    """Return if an event should be humanified."""
+    if event.event_type == EVENT_CALL_SERVICE:
+        return False
+    return event.event_type == EVENT_STATE_CHANGED or _keep_event(
+        hass, event, entities_filter
+    )
+
+
+def _generate_logbook_query(
+    hass,
+    session,
+    start_day,
+    end_day,
+    entity_ids,
+    filters,
+    entity_matches_only,
+    context_id,
+    extra_filter=None,
+):
+    """Generate the query for the logbook rows in order."""
+    old_state = aliased(States, name="old_state")
+
+    if entity_ids is not None:
+        query = _generate_events_query_without_states(session)
+        query = _apply_event_time_filter(query, start_day, end_day)
+        query = _apply_event_types_filter(
+            hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
         )
+        if entity_matches_only:
+            # When entity_matches_only is provided, contexts and events that do not
+            # contain the entity_ids are not included in the logbook response.
+            query = _apply_event_entity_id_matchers(query, entity_ids)
+
+        states_query = _generate_states_query(
+            session, start_day, end_day, old_state, entity_ids
+        )
+        if extra_filter is not None:
+            query = query.filter(extra_filter)
+            states_query = states_query.filter(extra_filter)
+
+        query = query.union_all(states_query)
+    else:
+        query = _generate_events_query(session)
+        query = _apply_event_time_filter(query, start_day, end_day)
+        query = _apply_events_types_and_states_filter(hass, query, old_state).filter(
+            (States.last_updated == States.last_changed)
+            | (Events.event_type != EVENT_STATE_CHANGED)
+        )
+        if filters:
+            query = query.filter(
+                filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
+            )
+
+        if context_id is not None:
+            query = query.filter(Events.context_id == context_id)
+
+        if extra_filter is not None:
+            query = query.filter(extra_filter)
+
+    return query.order_by(Events.time_fired, Events.event_id)
+
+
+def _after_cursor(time_fired, event_id):
+    """Match the rows after a cursor in the order of the logbook query."""
+    return (Events.time_fired > time_fired) | (
+        (Events.time_fired == time_fired) & (Events.event_id > event_id)
+    )
+
+
+def encode_cursor(cursor):
+    """Encode a cursor of the logbook query for the API."""
+    time_fired, event_id = cursor
+    return f"{process_timestamp_to_utc_isoformat(time_fired)}|{event_id}"
+
+
+def decode_cursor(cursor):
+    """Decode a cursor of the logbook API.
+
+    Returns None if the cursor is invalid.
+    """
+    time_fired, _, event_id = cursor.rpartition("|")
+    if (time_fired := dt_util.parse_datetime(time_fired)) is None:
+        return None
+    try:
+        return dt_util.as_utc(time_fired), int(event_id)
+    except ValueError:
+        return None
 
 
 def _generate_events_query(session):
@@ -487,6 +684,7 @@ def _generate_events_query(session):
         States.entity_id,
         States.domain,
         States.attributes,
+        StateAttributes.shared_attrs,
     )
 
 
@@ -497,6 +695,7 @@ def _generate_events_query_without_states(session):
         literal(value=None, type_=sqlalchemy.String).label("entity_id"),
         literal(value=None, type_=sqlalchemy.String).label("domain"),
         literal(value=None, type_=sqlalchemy.Text).label("attributes"),
+        literal(value=None, type_=sqlalchemy.Text).label("shared_attrs"),
     )
 
 
@@ -505,6 +704,9 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
@@ -519,6 +721,9 @@ def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
             | _missing_state_matcher(old_state)
@@ -548,7 +753,11 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(
+            sqlalchemy.func.coalesce(
+                StateAttributes.shared_attrs, States.attributes
+            ).contains(UNIT_OF_MEASUREMENT_JSON)
+        ),
     )
 
 
@@ -703,7 +912,9 @@ class LazyEventPartialState:
         if self._attributes:
             return self._attributes.get(ATTR_ICON)
 
-        result = ICON_JSON_EXTRACT.search(self._row.attributes)
+        result = ICON_JSON_EXTRACT.search(
+            self._row.shared_attrs or self._row.attributes or EMPTY_JSON_OBJECT
+        )
         return result and result.group(1)
 
     @property
@@ -728,13 +939,11 @@ class LazyEventPartialState:
     def attributes(self):
         """State attributes."""
         if not self._attributes:
-            if (
-                self._row.attributes is None
-                or self._row.attributes == EMPTY_JSON_OBJECT
-            ):
+            attributes = self._row.shared_attrs or self._row.attributes
+            if attributes is None or attributes == EMPTY_JSON_OBJECT:
                 self._attributes = {}
             else:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(attributes)
         return self._attributes
 
     @property
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache, partial, wraps
+from collections import deque
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
@@ -82,6 +83,7 @@ from .models import (
     ReceiveMessage,
     ReceivePayloadType,
 )
+from .trie import TopicTrie
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -98,6 +100,8 @@ CONF_CLIENT_KEY = "client_key"
 CONF_CLIENT_CERT = "client_cert"
 CONF_TLS_INSECURE = "tls_insecure"
 CONF_TLS_VERSION = "tls_version"
+CONF_MESSAGE_BATCH_SIZE = "message_batch_size"
+CONF_MESSAGE_BATCH_LATENCY = "message_batch_latency"
 
 PROTOCOL_31 = "3.1"
 
@@ -105,6 +109,8 @@ DEFAULT_PORT = 1883
 DEFAULT_KEEPALIVE = 60
 DEFAULT_PROTOCOL = PROTOCOL_311
 DEFAULT_TLS_PROTOCOL = "auto"
+DEFAULT_MESSAGE_BATCH_SIZE = 1000
+DEFAULT_MESSAGE_BATCH_LATENCY = 0.05  # seconds
 
 ATTR_PAYLOAD_TEMPLATE = "payload_template"
 
@@ -186,6 +192,13 @@ CONFIG_SCHEMA = vol.Schema(
                         CONF_BIRTH_MESSAGE, default=DEFAULT_BIRTH
                     ): MQTT_WILL_BIRTH_SCHEMA,
                     vol.Optional(CONF_DISCOVERY, default=DEFAULT_DISCOVERY): cv.boolean,
+                    vol.Optional(
+                        CONF_MESSAGE_BATCH_SIZE, default=DEFAULT_MESSAGE_BATCH_SIZE
+                    ): cv.positive_int,
+                    vol.Optional(
+                        CONF_MESSAGE_BATCH_LATENCY,
+                        default=DEFAULT_MESSAGE_BATCH_LATENCY,
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, min_included=False)),
                     # discovery_prefix must be a valid publish topic because if no
                     # state topic is specified, it will be created with the given prefix.
                     vol.Optional(
@@ -521,7 +534,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
@@ -545,6 +557,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._topic_trie = TopicTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -553,6 +566,11 @@ class MQTT:
 
         self._pending_operations: dict[str, asyncio.Event] = {}
 
+        # Received messages are handed from the paho thread to the event loop
+        # in batches to avoid waking up the loop for every single message.
+        self._received_messages: deque = deque()
+        self._process_messages_scheduled = False
+
         if self.hass.state == CoreState.running:
             self._ha_started.set()
         else:
@@ -716,11 +734,9 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._topic_trie.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -733,9 +749,9 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            self._topic_trie.remove(topic, subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if self._topic_trie.has_filter(topic):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -823,16 +839,52 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        The message is queued and the event loop is only woken up if it has
+        not already been scheduled to process the queue.
+        """
+        self._received_messages.append(msg)
+        if not self._process_messages_scheduled:
+            self._process_messages_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._async_process_messages)
+
+    @callback
+    def _async_process_messages(self) -> None:
+        """Process a batch of the messages queued by the paho thread.
+
+        A batch ends when it reaches the maximum batch size or when it has been
+        running longer than the latency bound. The remaining messages are
+        processed in the next iteration of the event loop.
+        """
+        max_batch_size = self.conf.get(
+            CONF_MESSAGE_BATCH_SIZE, DEFAULT_MESSAGE_BATCH_SIZE
+        )
+        deadline = self.hass.loop.time() + self.conf.get(
+            CONF_MESSAGE_BATCH_LATENCY, DEFAULT_MESSAGE_BATCH_LATENCY
+        )
+        received_messages = self._received_messages
+
+        for _ in range(max_batch_size):
+            if not received_messages:
+                break
+            msg = received_messages.popleft()
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error processing MQTT message on %s", msg.topic)
+            if self.hass.loop.time() >= deadline:
+                break
+
+        if not received_messages:
+            self._process_messages_scheduled = False
+            # The paho thread may have queued a message after the queue was
+            # found empty but before the flag was cleared.
+            if not received_messages:
+                return
+            self._process_messages_scheduled = True
+
+        self.hass.loop.call_soon(self._async_process_messages)
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -844,9 +896,7 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
-
-        for subscription in subscriptions:
+        for subscription in self._topic_trie.match(msg.topic):
 
             payload: SubscribePayloadType = msg.payload
             if subscription.encoding is not None:
@@ -944,16 +994,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
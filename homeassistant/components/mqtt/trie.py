@@ -0,0 +1,118 @@
+"""Prefix tree to find the MQTT topic filters matching a topic."""
+from __future__ import annotations
+
+from itertools import count
+from typing import Any
+
+SINGLE_LEVEL_WILDCARD = "+"
+MULTI_LEVEL_WILDCARD = "#"
+
+
+class _TopicNode:
+    """Level of a topic filter."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode] = {}
+        self.values: list[tuple[int, Any]] = []
+
+
+class TopicTrie:
+    """Topic filters with wildcards stored in a prefix tree.
+
+    Matching a topic only visits the levels of the topic and the wildcard
+    branches next to them, no matter how many filters are stored.
+    Matches follow the same rules as paho's MQTTMatcher.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicNode()
+        self._sequence = count()
+
+    def add(self, topic_filter: str, value: Any) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.values.append((next(self._sequence), value))
+
+    def remove(self, topic_filter: str, value: Any) -> None:
+        """Remove a value of a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        path = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise KeyError(topic_filter)
+            path.append((node, level))
+            node = child
+
+        for index, (_, stored) in enumerate(node.values):
+            if stored is value:
+                del node.values[index]
+                break
+        else:
+            raise KeyError(topic_filter)
+
+        # Remove the levels that no longer lead to a value
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def has_filter(self, topic_filter: str) -> bool:
+        """Return if there are values for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def match(self, topic: str) -> list[Any]:
+        """Return the values of all filters matching a topic in insertion order."""
+        levels = topic.split("/")
+        # Wildcards at the first level do not match topics starting with $
+        wildcards_at_first_level = not topic.startswith("$")
+        matches: list[tuple[int, Any]] = []
+        nodes = [self._root]
+
+        for index, level in enumerate(levels):
+            wildcards = index > 0 or wildcards_at_first_level
+            next_nodes = []
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if not wildcards:
+                    continue
+                if (child := children.get(SINGLE_LEVEL_WILDCARD)) is not None:
+                    next_nodes.append(child)
+                if (child := children.get(MULTI_LEVEL_WILDCARD)) is not None:
+                    matches.extend(child.values)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+        else:
+            for node in nodes:
+                matches.extend(node.values)
+                # The multi level wildcard also matches the parent level
+                if (child := node.children.get(MULTI_LEVEL_WILDCARD)) is not None:
+                    matches.extend(child.values)
+
+        if len(matches) > 1:
+            matches.sort(key=_sequence_key)
+        return [value for _, value in matches]
+
+
+def _sequence_key(item: tuple[int, Any]) -> int:
+    """Return the insertion sequence of a stored value."""
+    return item[0]
@@ -20,6 +20,7 @@ from homeassistant.core import HomeAssistant, ServiceCall
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template import compiled_template_cache_info
 
 from .const import DOMAIN
 
@@ -30,6 +31,7 @@ SERVICE_STOP_LOG_OBJECTS = "stop_log_objects"
 SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_LOG_TEMPLATE_CACHE_STATS = "log_template_cache_stats"
 
 
 SERVICES = (
@@ -40,6 +42,7 @@ SERVICES = (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_TEMPLATE_CACHE_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -128,6 +131,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             arepr.max_string = original_maxstring
             arepr.max_other = original_maxother
 
+    async def _async_log_template_cache_stats(call: ServiceCall) -> None:
+        """Log the statistics of the compiled template cache."""
+        _LOGGER.critical("Compiled template cache: %s", compiled_template_cache_info())
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -191,6 +198,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_TEMPLATE_CACHE_STATS,
+        _async_log_template_cache_stats,
+    )
+
     return True
 
 
@@ -4,6 +4,7 @@ import string
 
 from aiohttp import web
 import prometheus_client
+from prometheus_client.core import GaugeMetricFamily
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -27,6 +28,7 @@ from homeassistant.const import (
     ATTR_TEMPERATURE,
     ATTR_UNIT_OF_MEASUREMENT,
     CONTENT_TYPE_TEXT_PLAIN,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     PERCENTAGE,
     STATE_ON,
@@ -37,6 +39,7 @@ from homeassistant.const import (
 )
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.util.temperature import fahrenheit_to_celsius
 
@@ -52,12 +55,18 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+CONF_COLLECT_ON_SCRAPE = "collect_on_scrape"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
 
 DEFAULT_NAMESPACE = "homeassistant"
 
+IGNORED_STATES = (STATE_UNAVAILABLE, STATE_UNKNOWN)
+
+# Domains with counters of state changes, which can't be collected on scrape
+EVENT_DRIVEN_DOMAINS = {"automation"}
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -66,6 +75,7 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_PROM_NAMESPACE, default=DEFAULT_NAMESPACE): cv.string,
                 vol.Optional(CONF_DEFAULT_METRIC): cv.string,
                 vol.Optional(CONF_OVERRIDE_METRIC): cv.string,
+                vol.Optional(CONF_COLLECT_ON_SCRAPE, default=False): cv.boolean,
                 vol.Optional(CONF_COMPONENT_CONFIG, default={}): vol.Schema(
                     {cv.entity_id: COMPONENT_CONFIG_SCHEMA_ENTRY}
                 ),
@@ -98,6 +108,8 @@ def setup(hass, config):
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
 
+    collect_on_scrape = conf[CONF_COLLECT_ON_SCRAPE]
+
     metrics = PrometheusMetrics(
         prometheus_client,
         entity_filter,
@@ -106,12 +118,83 @@ def setup(hass, config):
         component_config,
         override_metric,
         default_metric,
+        collect_on_scrape,
     )
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
+    hass.bus.listen(EVENT_ENTITY_REGISTRY_UPDATED, metrics.handle_registry_event)
+
+    if collect_on_scrape:
+        collector = PrometheusCollector(hass, metrics)
+        prometheus_client.REGISTRY.register(collector)
+
+        def unregister_collector(event):
+            """Stop collecting the states of this instance."""
+            prometheus_client.REGISTRY.unregister(collector)
+
+        hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, unregister_collector)
+
     return True
 
 
+class PrometheusCollector:
+    """Collect the gauges of all states when Prometheus scrapes."""
+
+    def __init__(self, hass, metrics):
+        """Initialize the collector."""
+        self._hass = hass
+        self._metrics = metrics
+
+    def describe(self):
+        """Return no metrics to avoid collecting when registering."""
+        return []
+
+    def collect(self):
+        """Return the gauges of the current states."""
+        return self._metrics.collect_states(self._hass.states.async_all())
+
+
+class ScrapedGauge:
+    """A gauge whose samples are gathered during a single scrape.
+
+    Offers the part of the prometheus_client Gauge interface used by the
+    state handlers, so they work the same way in both modes.
+    """
+
+    def __init__(self, name, documentation, labels):
+        """Initialize the gauge."""
+        self._family = GaugeMetricFamily(name, documentation, labels=labels)
+        self._labelnames = labels
+        self._samples = {}
+
+    def labels(self, **labels):
+        """Return the sample for a set of labels."""
+        return ScrapedSample(
+            self._samples, tuple(str(labels[name]) for name in self._labelnames)
+        )
+
+    def metric_family(self):
+        """Return the metric family with the gathered samples."""
+        for label_values, value in self._samples.items():
+            self._family.add_metric(label_values, value)
+        return self._family
+
+
+class ScrapedSample:
+    """A sample of a scraped gauge."""
+
+    __slots__ = ("_samples", "_label_values")
+
+    def __init__(self, samples, label_values):
+        """Initialize the sample."""
+        self._samples = samples
+        self._label_values = label_values
+
+    def set(self, value):
+        """Set the value of the sample."""
+        self._samples[self._label_values] = float(value)
+
+
 class PrometheusMetrics:
     """Model all of the metrics which should be exposed to Prometheus."""
 
@@ -124,9 +207,14 @@ class PrometheusMetrics:
         component_config,
         override_metric,
         default_metric,
+        collect_on_scrape=False,
     ):
         """Initialize Prometheus Metrics."""
         self.prometheus_cli = prometheus_cli
+        self._collect_on_scrape = collect_on_scrape
+        self._scraped_gauges = None
+        self._handlers = {}
+        self._labels_cache = {}
         self._component_config = component_config
         self._override_metric = override_metric
         self._default_metric = default_metric
@@ -158,25 +246,54 @@ class PrometheusMetrics:
         if not self._filter(state.entity_id):
             return
 
-        ignored_states = (STATE_UNAVAILABLE, STATE_UNKNOWN)
-
-        handler = f"_handle_{domain}"
-
-        if hasattr(self, handler) and state.state not in ignored_states:
-            getattr(self, handler)(state)
+        if not self._collect_on_scrape:
+            self._handle_state(domain, state)
+        elif domain in EVENT_DRIVEN_DOMAINS and state.state not in IGNORED_STATES:
+            self._handler(domain)(state)
 
-        labels = self._labels(state)
         state_change = self._metric(
             "state_change", self.prometheus_cli.Counter, "The number of state changes"
         )
-        state_change.labels(**labels).inc()
+        state_change.labels(**self._labels(state)).inc()
+
+    def handle_registry_event(self, event):
+        """Forget the cached labels when the entity registry changes."""
+        self._labels_cache.clear()
+
+    def collect_states(self, states):
+        """Return the gauges of states when Prometheus scrapes."""
+        self._scraped_gauges = {}
+        try:
+            for state in states:
+                if self._filter(state.entity_id):
+                    self._handle_state(state.domain, state)
+            gauges = self._scraped_gauges
+        finally:
+            self._scraped_gauges = None
+
+        return [gauge.metric_family() for gauge in gauges.values()]
 
+    def _handler(self, domain):
+        """Return the handler of the states of a domain."""
+        try:
+            return self._handlers[domain]
+        except KeyError:
+            handler = self._handlers[domain] = getattr(self, f"_handle_{domain}", None)
+            return handler
+
+    def _handle_state(self, domain, state):
+        """Update the gauges of a state."""
+        if state.state not in IGNORED_STATES and (handler := self._handler(domain)):
+            if not self._collect_on_scrape or domain not in EVENT_DRIVEN_DOMAINS:
+                handler(state)
+
+        labels = self._labels(state)
         entity_available = self._metric(
             "entity_available",
             self.prometheus_cli.Gauge,
             "Entity is available (not in the unavailable or unknown state)",
         )
-        entity_available.labels(**labels).set(float(state.state not in ignored_states))
+        entity_available.labels(**labels).set(float(state.state not in IGNORED_STATES))
 
         last_updated_time_seconds = self._metric(
             "last_updated_time_seconds",
@@ -204,6 +321,17 @@ class PrometheusMetrics:
         if extra_labels is not None:
             labels.extend(extra_labels)
 
+        if self._scraped_gauges is not None and factory is self.prometheus_cli.Gauge:
+            try:
+                return self._scraped_gauges[metric]
+            except KeyError:
+                gauge = self._scraped_gauges[metric] = ScrapedGauge(
+                    self._sanitize_metric_name(f"{self.metrics_prefix}{metric}"),
+                    documentation,
+                    labels,
+                )
+                return gauge
+
         try:
             return self._metrics[metric]
         except KeyError:
@@ -237,13 +365,19 @@ class PrometheusMetrics:
             value = 0
         return value
 
-    @staticmethod
-    def _labels(state):
-        return {
+    def _labels(self, state):
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        if (cached := self._labels_cache.get(state.entity_id)) is not None and cached[
+            "friendly_name"
+        ] == friendly_name:
+            return cached
+
+        labels = self._labels_cache[state.entity_id] = {
             "entity": state.entity_id,
             "domain": state.domain,
-            "friendly_name": state.attributes.get(ATTR_FRIENDLY_NAME),
+            "friendly_name": friendly_name,
         }
+        return labels
 
     def _battery(self, state):
         if "battery_level" in state.attributes:
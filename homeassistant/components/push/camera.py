@@ -120,6 +120,11 @@ class PushCamera(Camera):
                 "In <%s>, webhook_id <%s> already used", self.name, self.webhook_id
             )
 
+    @property
+    def snapshot_cache_ttl(self):
+        """Return 0, every request shows the next image while idle."""
+        return 0
+
     @property
     def image_field(self):
         """HTTP field containing the image file."""
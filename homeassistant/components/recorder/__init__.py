@@ -10,13 +10,13 @@ import queue
 import sqlite3
 import threading
 import time
-from typing import Any, NamedTuple
+from typing import Any, NamedTuple, TypeVar
 
 from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.session import Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 import voluptuous as vol
 
 from homeassistant.components import persistent_notification
@@ -49,13 +49,21 @@ from homeassistant.helpers.service import async_extract_entity_ids
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
+from homeassistant.util.lru import LRU
 
 from . import history, migration, purge, statistics, websocket_api
-from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
+from .const import (
+    CONF_DB_INTEGRITY_CHECK,
+    DATA_INSTANCE,
+    DB_READ_POOL_SIZE,
+    DOMAIN,
+    SQLITE_URL_PREFIX,
+)
 from .models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -68,11 +76,14 @@ from .util import (
     perodic_db_cleanups,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_connection_for_dialect,
     validate_or_move_away_sqlite_database,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 SERVICE_PURGE = "purge"
 SERVICE_PURGE_ENTITIES = "purge_entities"
 SERVICE_ENABLE = "enable"
@@ -114,9 +125,13 @@ DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
 KEEPALIVE_TIME = 30
 
-# Controls how often we clean up
-# States and Events objects
-EXPIRE_AFTER_COMMITS = 120
+# The number of attribute ids to cache in memory
+#
+# Based on:
+# - The number of overlapping attributes
+# - How frequently states with overlapping attributes will change
+# - How much memory our low end hardware has
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
@@ -366,6 +381,12 @@ class StatisticsTask(NamedTuple):
     start: datetime
 
 
+class PeriodStatisticsTask(NamedTuple):
+    """An object to insert into the recorder queue to compile daily and monthly statistics."""
+
+    end: datetime
+
+
 class ExternalStatisticsTask(NamedTuple):
     """An object to insert into the recorder queue to run an external statistics task."""
 
@@ -377,6 +398,15 @@ class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
 
+class PendingState(NamedTuple):
+    """A states row waiting for the next commit."""
+
+    state_row: dict[str, Any]
+    event_row: dict[str, Any]
+    attributes_id: int | None
+    state_attributes: StateAttributes | None
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -409,26 +439,45 @@ class Recorder(threading.Thread):
         self._queue_watch = threading.Event()
         self.engine: Any = None
         self.run_info: Any = None
+        self._read_engine: Any = None
+        self._read_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=DB_READ_POOL_SIZE, thread_name_prefix="RecorderRead"
+        )
 
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
 
         self._timechanges_seen = 0
-        self._commits_without_expire = 0
         self._keepalive_count = 0
-        self._old_states: dict[str, States] = {}
-        self._pending_expunge: list[States] = []
+        self._old_states: dict[str, int] = {}
+        self._state_attributes_ids: LRU[str, int] = LRU(STATE_ATTRIBUTES_ID_CACHE_SIZE)
+        self._pending_state_attributes: dict[str, StateAttributes] = {}
+        self._pending_events: list[dict[str, Any]] = []
+        self._pending_states: list[PendingState] = []
         self.event_session = None
         self.get_session = None
+        self.get_read_session = None
         self._completed_first_database_setup = None
         self._event_listener = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self._queue_watcher = None
         self._db_supports_row_number = True
+        self.purge_progress = purge.PurgeProgress()
 
         self.enabled = True
 
+    @callback
+    def async_add_executor_job(
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Run a database read job in the executor reserved for reading.
+
+        Reads in this executor use their own connections and never wait for
+        the event loop's default executor.
+        """
+        return self.hass.loop.run_in_executor(self._read_executor, target, *args)
+
     def set_enable(self, enable):
         """Enable or disable recording events and states."""
         self.enabled = enable
@@ -637,6 +686,7 @@ class Recorder(threading.Thread):
 
         if current_version is None:
             self.hass.add_job(self.async_connection_failed)
+            self._read_executor.shutdown()
             return
 
         schema_is_current = migration.schema_is_current(current_version)
@@ -765,6 +815,9 @@ class Recorder(threading.Thread):
 
     def _run_purge(self, purge_before, repack, apply_filter):
         """Purge the database."""
+        # Commit pending states first so the purge can see
+        # every shared attributes row that is still in use
+        self._commit_event_session_or_retry()
         if purge.purge_old_data(self, purge_before, repack, apply_filter):
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
@@ -776,6 +829,7 @@ class Recorder(threading.Thread):
 
     def _run_purge_entities(self, entity_filter):
         """Purge entities from the database."""
+        self._commit_event_session_or_retry()
         if purge.purge_entity_data(self, entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
@@ -783,11 +837,23 @@ class Recorder(threading.Thread):
 
     def _run_statistics(self, start):
         """Run statistics task."""
+        # Commit pending states first so they are included in the statistics
+        self._commit_event_session_or_retry()
         if statistics.compile_statistics(self, start):
+            if start.minute == 55:
+                # A full hour is compiled, compile the days and months it ended
+                self.queue.put(PeriodStatisticsTask(start + timedelta(minutes=5)))
             return
         # Schedule a new statistics task if this one didn't finish
         self.queue.put(StatisticsTask(start))
 
+    def _run_period_statistics(self, end):
+        """Run daily and monthly statistics task."""
+        if statistics.compile_missing_period_statistics(self, end):
+            return
+        # Schedule a new task to continue after the work queued in the meantime
+        self.queue.put(PeriodStatisticsTask(end))
+
     def _run_external_statistics(self, metadata, stats):
         """Run statistics task."""
         if statistics.add_external_statistics(self, metadata, stats):
@@ -809,6 +875,9 @@ class Recorder(threading.Thread):
         if isinstance(event, StatisticsTask):
             self._run_statistics(event.start)
             return
+        if isinstance(event, PeriodStatisticsTask):
+            self._run_period_statistics(event.end)
+            return
         if isinstance(event, ClearStatisticsTask):
             statistics.clear_statistics(self, event.statistic_ids)
             return
@@ -840,44 +909,77 @@ class Recorder(threading.Thread):
 
         try:
             if event.event_type == EVENT_STATE_CHANGED:
-                dbevent = Events.from_event(event, event_data="{}")
+                event_row = Events.row_from_event(event, event_data="{}")
             else:
-                dbevent = Events.from_event(event)
-            dbevent.created = event.time_fired
-            self.event_session.add(dbevent)
+                event_row = Events.row_from_event(event)
+            event_row["created"] = event.time_fired
         except (TypeError, ValueError):
             _LOGGER.warning("Event is not JSON serializable: %s", event)
             return
 
+        self._pending_events.append(event_row)
+
         if event.event_type == EVENT_STATE_CHANGED:
             try:
-                dbstate = States.from_event(event)
-                has_new_state = event.data.get("new_state")
-                if dbstate.entity_id in self._old_states:
-                    old_state = self._old_states.pop(dbstate.entity_id)
-                    if old_state.state_id:
-                        dbstate.old_state_id = old_state.state_id
-                    else:
-                        dbstate.old_state = old_state
-                if not has_new_state:
-                    dbstate.state = None
-                dbstate.event = dbevent
-                dbstate.created = event.time_fired
-                self.event_session.add(dbstate)
-                if has_new_state:
-                    self._old_states[dbstate.entity_id] = dbstate
-                    self._pending_expunge.append(dbstate)
+                state_row = States.row_from_event(event)
+                shared_attrs = StateAttributes.shared_attrs_from_event(event)
             except (TypeError, ValueError):
                 _LOGGER.warning(
                     "State is not JSON serializable: %s",
                     event.data.get("new_state"),
                 )
+            else:
+                if not event.data.get("new_state"):
+                    state_row["state"] = None
+                state_row["created"] = event.time_fired
+                self._pending_states.append(
+                    PendingState(
+                        state_row,
+                        event_row,
+                        *self._lookup_state_attributes(shared_attrs),
+                    )
+                )
 
         # If they do not have a commit interval
         # than we commit right away
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _lookup_state_attributes(
+        self, shared_attrs: str
+    ) -> tuple[int | None, StateAttributes | None]:
+        """Return the id of the shared attributes or a pending attributes row."""
+        # Matching attributes found in the pending commit
+        if pending_attributes := self._pending_state_attributes.get(shared_attrs):
+            return None, pending_attributes
+        # Matching attributes id found in the cache
+        if attributes_id := self._state_attributes_ids.get(shared_attrs):
+            return attributes_id, None
+        attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        # Matching attributes found in the database
+        if attributes_id := self._find_shared_attr_in_db(attr_hash, shared_attrs):
+            self._state_attributes_ids[shared_attrs] = attributes_id
+            return attributes_id, None
+        # No matching attributes found, save them in the DB
+        dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=attr_hash)
+        self._pending_state_attributes[shared_attrs] = dbstate_attributes
+        self.event_session.add(dbstate_attributes)
+        return None, dbstate_attributes
+
+    def _find_shared_attr_in_db(self, attr_hash: int, shared_attrs: str) -> int | None:
+        """Find shared attributes in the db from the hash and shared_attrs."""
+        # Pending attributes were already checked in
+        # _pending_state_attributes so there is no need to autoflush
+        with self.event_session.no_autoflush:
+            if attributes := (
+                self.event_session.query(StateAttributes.attributes_id)
+                .filter(StateAttributes.hash == attr_hash)
+                .filter(StateAttributes.shared_attrs == shared_attrs)
+                .first()
+            ):
+                return attributes[0]
+        return None
+
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -890,7 +992,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self._pending_events
+            and not self.event_session.new
+            and not self.event_session.dirty
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -911,24 +1017,74 @@ class Recorder(threading.Thread):
                 time.sleep(self.db_retry_wait)
 
     def _commit_event_session(self):
-        self._commits_without_expire += 1
-
-        if self._pending_expunge:
-            self.event_session.flush()
-            for dbstate in self._pending_expunge:
-                # Expunge the state so its not expired
-                # until we use it later for dbstate.old_state
-                if dbstate in self.event_session:
-                    self.event_session.expunge(dbstate)
-            self._pending_expunge = []
-        self.event_session.commit()
-
-        # Expire is an expensive operation (frequently more expensive
-        # than the flush and commit itself) so we only
-        # do it after EXPIRE_AFTER_COMMITS commits
-        if self._commits_without_expire == EXPIRE_AFTER_COMMITS:
-            self._commits_without_expire = 0
-            self.event_session.expire_all()
+        """Write the pending rows and commit the event session."""
+        session = self.event_session
+        # Flush the ORM objects first so new attributes rows have an id
+        session.flush()
+        if self._pending_events:
+            old_states = self._write_pending_rows(session)
+        session.commit()
+
+        if self._pending_events:
+            # Only replace the old states once the rows are committed
+            # so a failed commit can be retried with the same rows
+            self._old_states = old_states
+            self._pending_events = []
+            self._pending_states = []
+
+        # Once the attributes are committed they have an id
+        # and can be moved into the cache
+        for shared_attrs, attributes in self._pending_state_attributes.items():
+            self._state_attributes_ids[shared_attrs] = attributes.attributes_id
+        self._pending_state_attributes = {}
+
+    def _write_pending_rows(self, session: Session) -> dict[str, int]:
+        """Insert the pending events and states with ids assigned by the database.
+
+        Dialects that return the ids of an executemany, like PostgreSQL,
+        insert each table with one statement. The others insert row by
+        row without the ORM overhead. The states reference their event
+        and the previous state of the entity through the returned ids.
+
+        Returns the old states map to use once the commit succeeds.
+        """
+        for event_row in self._pending_events:
+            # Ids from a failed commit are not used again
+            event_row.pop("event_id", None)
+        session.bulk_insert_mappings(Events, self._pending_events, return_defaults=True)
+
+        old_states = self._old_states.copy()
+        pending_states = self._pending_states
+        while pending_states:
+            # A state can only reference a previous state of the same
+            # entity in this commit once the previous one has its id
+            state_rows = []
+            next_pending_states = []
+            entity_ids = set()
+            for pending in pending_states:
+                state_row = pending.state_row
+                entity_id = state_row["entity_id"]
+                if entity_id in entity_ids:
+                    next_pending_states.append(pending)
+                    continue
+                entity_ids.add(entity_id)
+                state_row.pop("state_id", None)
+                state_row["event_id"] = pending.event_row["event_id"]
+                state_row["old_state_id"] = old_states.get(entity_id)
+                state_row["attributes_id"] = (
+                    pending.attributes_id or pending.state_attributes.attributes_id
+                )
+                state_rows.append(state_row)
+
+            session.bulk_insert_mappings(States, state_rows, return_defaults=True)
+            for state_row in state_rows:
+                if state_row["state"] is None:
+                    old_states.pop(state_row["entity_id"], None)
+                else:
+                    old_states[state_row["entity_id"]] = state_row["state_id"]
+            pending_states = next_pending_states
+
+        return old_states
 
     def _handle_sqlite_corruption(self):
         """Handle the sqlite3 database being corrupt."""
@@ -941,6 +1097,10 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._state_attributes_ids.clear()
+        self._pending_state_attributes = {}
+        self._pending_events = []
+        self._pending_states = []
 
         if not self.event_session:
             return
@@ -1022,8 +1182,40 @@ class Recorder(threading.Thread):
 
         Base.metadata.create_all(self.engine)
         self.get_session = scoped_session(sessionmaker(bind=self.engine))
+        self._setup_read_connection()
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_connection(self):
+        """Set up a pool of connections used for reading only.
+
+        An in memory database can't be shared, it is read through the
+        connection of the recorder.
+        """
+        if self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url:
+            self.get_read_session = scoped_session(sessionmaker(bind=self.engine))
+            return
+
+        kwargs = {
+            "pool_size": DB_READ_POOL_SIZE,
+            "max_overflow": DB_READ_POOL_SIZE,
+        }
+        if self._using_file_sqlite:
+            # Each connection is a WAL reader, used by one thread at a time
+            kwargs["connect_args"] = {"check_same_thread": False}
+            kwargs["poolclass"] = QueuePool
+        else:
+            kwargs["echo"] = False
+        self._read_engine = create_engine(self.db_url, **kwargs)
+
+        def setup_read_connection(dbapi_connection, connection_record):
+            """Dbapi specific connection settings."""
+            setup_read_connection_for_dialect(
+                self, self._read_engine.dialect.name, dbapi_connection
+            )
+
+        sqlalchemy_event.listen(self._read_engine, "connect", setup_read_connection)
+        self.get_read_session = scoped_session(sessionmaker(bind=self._read_engine))
+
     @property
     def _using_file_sqlite(self):
         """Short version to check if we are using sqlite3 as a file."""
@@ -1033,6 +1225,10 @@ class Recorder(threading.Thread):
 
     def _close_connection(self):
         """Close the connection."""
+        if self._read_engine is not None:
+            self._read_engine.dispose()
+        self._read_engine = None
+        self.get_read_session = None
         self.engine.dispose()
         self.engine = None
         self.get_session = None
@@ -1087,4 +1283,5 @@ class Recorder(threading.Thread):
         """Save end time for current run."""
         self.hass.add_job(self._async_stop_queue_watcher_and_event_listener)
         self._end_session()
+        self._read_executor.shutdown()
         self._close_connection()
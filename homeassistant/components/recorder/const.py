@@ -13,3 +13,14 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 # We can increase this back to 1000 once most
 # have upgraded their sqlite version
 MAX_ROWS_TO_PURGE = 998
+
+# The minimum number of rows (events) we purge in one delete statement
+MIN_ROWS_TO_PURGE = 50
+
+# Seconds of database work a purge pass aims for, the number of rows purged per
+# pass is adjusted so other recorder tasks don't wait longer
+PURGE_PASS_TIME_BUDGET = 0.25
+
+# Number of database connections and threads used for reading history and
+# statistics outside the recorder thread
+DB_READ_POOL_SIZE = 4
@@ -11,6 +11,7 @@ from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -47,13 +48,18 @@ QUERY_STATES = [
     States.domain,
     States.entity_id,
     States.state,
+    States.numeric_state,
     States.attributes,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "recorder_history_bakery"
 
+# The number of rows to fetch from the database at once when streaming
+STREAM_BATCH_SIZE = 1000
+
 
 def async_setup(hass):
     """Set up the history hooks."""
@@ -62,7 +68,7 @@ def async_setup(hass):
 
 def get_significant_states(hass, *args, **kwargs):
     """Wrap get_significant_states_with_session with an sql session."""
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         return get_significant_states_with_session(hass, session, *args, **kwargs)
 
 
@@ -76,6 +82,7 @@ def get_significant_states_with_session(
     include_start_time_state=True,
     significant_changes_only=True,
     minimal_response=False,
+    max_points=None,
 ):
     """
     Return states changes during UTC period start_time - end_time.
@@ -88,11 +95,103 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    max_points optionally limits the number of numeric states returned per
+    entity, see _downsample_rows.
     """
     timer_start = time.perf_counter()
 
+    states = execute(
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_dict(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+        max_points,
+    )
+
+
+def iter_significant_states_with_session(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+    max_points=None,
+):
+    """Yield the significant states of one entity at a time as (entity_id, states).
+
+    Same result as get_significant_states_with_session, but the rows are
+    fetched from the database in batches so only the states of the entity
+    being yielded are kept in memory.
+
+    Entities with state changes are yielded ordered by entity_id, followed
+    by the entities which only have a state at the start time.
+    """
+    initial_states = {}
+    if include_start_time_state:
+        initial_states = _get_start_time_states(
+            hass, session, start_time, entity_ids, filters
+        )
+
+    states = _significant_states_query(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+    ).with_post_criteria(lambda q: q.yield_per(STREAM_BATCH_SIZE))
+
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        ent_results = []
+        if (initial_state := initial_states.pop(ent_id, None)) is not None:
+            ent_results.append(initial_state)
+        _append_entity_states(ent_results, ent_id, group, minimal_response, max_points)
+        yield ent_id, ent_results
+
+    for ent_id, initial_state in initial_states.items():
+        yield ent_id, [initial_state]
+
+
+def _significant_states_query(
+    hass,
+    session,
+    start_time,
+    end_time,
+    entity_ids,
+    filters,
+    significant_changes_only,
+):
+    """Return the query for the significant states ordered by entity_id."""
     baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+        lambda session: session.query(*QUERY_STATES).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
     )
 
     if significant_changes_only:
@@ -120,33 +219,18 @@ def get_significant_states_with_session(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
-    )
-
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
-
-    return _sorted_states_to_dict(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
+    return baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
+            lambda session: session.query(*QUERY_STATES).outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
         )
 
         baked_query += lambda q: q.filter(
@@ -160,7 +244,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -180,14 +266,18 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     """Return the last number_of_states."""
     start_time = dt_util.utcnow()
 
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
+            lambda session: session.query(*QUERY_STATES).outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
         )
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -223,7 +313,7 @@ def get_states(hass, utc_point_in_time, entity_ids=None, run=None, filters=None)
         if run is None:
             return []
 
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         return _get_states_with_session(
             hass, session, utc_point_in_time, entity_ids, run, filters
         )
@@ -247,7 +337,9 @@ def _get_states_with_session(
 
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
 
     if entity_ids:
         # We got an include-list of entities, accelerate the query by filtering already
@@ -313,7 +405,9 @@ def _get_single_entity_states_with_session(hass, session, utc_point_in_time, ent
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
     baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+        lambda session: session.query(*QUERY_STATES).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
     )
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
@@ -338,6 +432,7 @@ def _sorted_states_to_dict(
     filters=None,
     include_start_time_state=True,
     minimal_response=False,
+    max_points=None,
 ):
     """Convert SQL results into JSON friendly data structure.
 
@@ -357,65 +452,135 @@ def _sorted_states_to_dict(
             result[ent_id] = []
 
     # Get the states at the start time
-    timer_start = time.perf_counter()
     if include_start_time_state:
-        run = recorder.run_information_from_instance(hass, start_time)
-        for state in _get_states_with_session(
-            hass, session, start_time, entity_ids, run=run, filters=filters
-        ):
-            state.last_changed = start_time
-            state.last_updated = start_time
-            result[state.entity_id].append(state)
+        for ent_id, state in _get_start_time_states(
+            hass, session, start_time, entity_ids, filters
+        ).items():
+            result[ent_id].append(state)
+
+    # Append all changes to it
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        _append_entity_states(
+            result[ent_id], ent_id, group, minimal_response, max_points
+        )
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _get_start_time_states(hass, session, start_time, entity_ids, filters):
+    """Return the states at the start time by entity_id.
+
+    The states are moved to the start time to create a synthetic zero
+    data point for each entity.
+    """
+    timer_start = time.perf_counter()
+    run = recorder.run_information_from_instance(hass, start_time)
+    initial_states = {}
+    for state in _get_states_with_session(
+        hass, session, start_time, entity_ids, run=run, filters=filters
+    ):
+        state.last_changed = start_time
+        state.last_updated = start_time
+        initial_states[state.entity_id] = state
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
+        _LOGGER.debug(
+            "getting %d first datapoints took %fs", len(initial_states), elapsed
+        )
+
+    return initial_states
 
+
+def _append_entity_states(ent_results, ent_id, group, minimal_response, max_points):
+    """Append the states of one entity from the sorted SQL results."""
     # Called in a tight loop so cache the function
     # here
     _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
 
-    # Append all changes to it
-    for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
-        ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(LazyState(db_state) for db_state in group)
-
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
-
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
-            )
-            prev_state = db_state
+    if max_points:
+        group = iter(_downsample_rows(list(group), max_points))
+
+    domain = split_entity_id(ent_id)[0]
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        ent_results.extend(LazyState(db_state) for db_state in group)
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if not ent_results:
+        ent_results.append(LazyState(next(group)))
+
+    prev_state = ent_results[-1]
+    initial_state_count = len(ent_results)
+
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        ent_results.append(
+            {
+                STATE_KEY: db_state.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    db_state.last_changed
+                ),
+            }
+        )
+        prev_state = db_state
 
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
+    if prev_state and len(ent_results) != initial_state_count:
+        # There was at least one state change
+        # replace the last minimal state with
+        # a full state
+        ent_results[-1] = LazyState(prev_state)
 
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+
+def _downsample_rows(rows, max_points):
+    """Reduce the numeric rows of one entity to about max_points rows.
+
+    The time between the first and last row is split into max_points / 2
+    buckets of equal duration and only the rows with the minimum and the
+    maximum value of each bucket are kept, so peaks still show in graphs.
+
+    The first and last row and rows which are not numeric are always kept,
+    the latter mark gaps such as unavailable in the graphs.
+    """
+    if len(rows) <= max_points:
+        return rows
+
+    first_updated = rows[0].last_updated
+    duration = (rows[-1].last_updated - first_updated).total_seconds()
+    if not duration:
+        return rows
+    bucket_duration = duration / max(max_points // 2, 1)
+
+    # Indexes of the rows to keep and the (value, index) extremes by bucket
+    keep = {0, len(rows) - 1}
+    bucket_min = {}
+    bucket_max = {}
+    for idx, row in enumerate(rows):
+        value = row.numeric_state
+        if value is None:
+            # Rows written before the numeric_state column existed
+            value = States.parse_numeric_state(row.state)
+        if value is None:
+            keep.add(idx)
+            continue
+        bucket = int(
+            (row.last_updated - first_updated).total_seconds() // bucket_duration
+        )
+        if bucket not in bucket_min or value < bucket_min[bucket][0]:
+            bucket_min[bucket] = (value, idx)
+        if bucket not in bucket_max or value > bucket_max[bucket][0]:
+            bucket_max[bucket] = (value, idx)
+
+    keep.update(idx for _, idx in bucket_min.values())
+    keep.update(idx for _, idx in bucket_max.values())
+    return [rows[idx] for idx in sorted(keep)]
 
 
 def get_state(hass, utc_point_in_time, entity_id, run=None):
@@ -582,6 +582,18 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
     elif new_version == 23:
         # Add name column to StatisticsMeta
         _add_columns(session, "statistics_meta", ["name VARCHAR(255)"])
+    elif new_version == 24:
+        # The state_attributes table is created by create_all, link states to it.
+        # Existing rows keep their attributes in the states table.
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 25:
+        # Existing rows are not backfilled, readers fall back to parsing the state
+        _add_columns(connection, "states", ["numeric_state DOUBLE PRECISION"])
+    elif new_version == 26:
+        # The statistics_daily and statistics_monthly tables are created by
+        # create_all, they are filled when the next hourly statistics are compiled
+        pass
 
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
@@ -4,14 +4,25 @@ from __future__ import annotations
 from collections.abc import Callable
 from datetime import datetime
 import logging
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import func
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
-from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States, StatisticsRuns, StatisticsShortTerm
+import homeassistant.util.dt as dt_util
+
+from .const import MAX_ROWS_TO_PURGE, MIN_ROWS_TO_PURGE, PURGE_PASS_TIME_BUDGET
+from .models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsRuns,
+    StatisticsShortTerm,
+    process_timestamp,
+)
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -21,23 +32,129 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+class PurgeProgress:
+    """Progress and throughput of purging old data.
+
+    A purge runs in passes queued between the other recorder tasks. The number
+    of events purged per pass is adjusted to keep a pass within
+    PURGE_PASS_TIME_BUDGET.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the progress."""
+        self.rows_per_pass = MAX_ROWS_TO_PURGE
+        self.purge_before: datetime | None = None
+        self.oldest: datetime | None = None
+        self.purged_until: datetime | None = None
+        self.started: datetime | None = None
+        self.finished: datetime | None = None
+        self.passes = 0
+        self.events = 0
+        self.states = 0
+        self.duration = 0.0
+
+    def start(self, purge_before: datetime, oldest: datetime | None) -> None:
+        """Start tracking a purge of data older than purge_before."""
+        self.purge_before = purge_before
+        self.oldest = oldest
+        self.purged_until = None
+        self.started = dt_util.utcnow()
+        self.finished = None
+        self.passes = 0
+        self.events = 0
+        self.states = 0
+        self.duration = 0.0
+
+    def add_pass(
+        self, events: int, states: int, duration: float, purged_until: datetime | None
+    ) -> None:
+        """Record a purge pass and adjust the number of rows purged per pass."""
+        self.passes += 1
+        self.events += events
+        self.states += states
+        self.duration += duration
+        if purged_until is not None:
+            self.purged_until = purged_until
+        _LOGGER.debug(
+            "Purge pass removed %s events and %s states in %.3fs",
+            events,
+            states,
+            duration,
+        )
+        if duration <= 0 or (
+            events < self.rows_per_pass and duration <= PURGE_PASS_TIME_BUDGET
+        ):
+            return
+        self.rows_per_pass = max(
+            MIN_ROWS_TO_PURGE,
+            min(
+                MAX_ROWS_TO_PURGE,
+                int(self.rows_per_pass * PURGE_PASS_TIME_BUDGET / duration),
+            ),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a JSON friendly dict."""
+        progress = None
+        if self.finished is not None:
+            progress = 1.0
+        elif (
+            self.purge_before is not None
+            and self.oldest is not None
+            and self.purged_until is not None
+            and self.purge_before > self.oldest
+        ):
+            progress = min(
+                1.0,
+                (self.purged_until - self.oldest) / (self.purge_before - self.oldest),
+            )
+        return {
+            "purge_before": self.purge_before.isoformat()
+            if self.purge_before
+            else None,
+            "started": self.started.isoformat() if self.started else None,
+            "finished": self.finished.isoformat() if self.finished else None,
+            "progress": progress,
+            "passes": self.passes,
+            "events": self.events,
+            "states": self.states,
+            "duration": round(self.duration, 3),
+            "rows_per_second": round((self.events + self.states) / self.duration)
+            if self.duration
+            else None,
+            "rows_per_pass": self.rows_per_pass,
+        }
+
+
 @retryable_database_job("purge")
 def purge_old_data(
     instance: Recorder, purge_before: datetime, repack: bool, apply_filter: bool = False
 ) -> bool:
     """Purge events and states older than purge_before.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Cleans up the oldest records, one pass at a time. Returns False if the purge
+    hasn't fully completed yet.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
 
+    progress = instance.purge_progress
+    pass_start = time.monotonic()
     with session_scope(session=instance.get_session()) as session:  # type: ignore
-        # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-        event_ids = _select_event_ids_to_purge(session, purge_before)
-        state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
+        if progress.purge_before != purge_before or progress.finished:
+            progress.start(
+                purge_before,
+                process_timestamp(session.query(func.min(Events.time_fired)).scalar()),
+            )
+        # Purge the oldest events and the states they belong to
+        event_ids, purged_until = _select_event_ids_to_purge(
+            session, purge_before, progress.rows_per_pass
+        )
+        state_ids, attributes_ids = _select_state_and_attributes_ids_to_purge(
+            session, purge_before, event_ids
+        )
         statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
         short_term_statistics = _select_short_term_statistics_to_purge(
             session, purge_before
@@ -46,6 +163,8 @@ def purge_old_data(
         if state_ids:
             _purge_state_ids(instance, session, state_ids)
 
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+
         if event_ids:
             _purge_event_ids(session, event_ids)
 
@@ -56,46 +175,67 @@ def purge_old_data(
             _purge_short_term_statistics(session, short_term_statistics)
 
         if event_ids or statistics_runs or short_term_statistics:
-            # Return false, as we might not be done yet.
+            # We might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
-            return False
-
-        if apply_filter and _purge_filtered_data(instance, session) is False:
+            finished = False
+        elif apply_filter and _purge_filtered_data(instance, session) is False:
             _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
-            return False
+            finished = False
+        else:
+            _purge_old_recorder_runs(instance, session, purge_before)
+            finished = True
 
-        _purge_old_recorder_runs(instance, session, purge_before)
-    if repack:
-        repack_database(instance)
+    progress.add_pass(
+        len(event_ids), len(state_ids), time.monotonic() - pass_start, purged_until
+    )
+    if not finished:
+        return False
+    if repack and not repack_database(instance):
+        _LOGGER.debug("Repacking hasn't fully completed yet")
+        return False
+    progress.finished = dt_util.utcnow()
     return True
 
 
-def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list[int]:
-    """Return a list of event ids to purge."""
+def _select_event_ids_to_purge(
+    session: Session, purge_before: datetime, max_rows: int
+) -> tuple[list[int], datetime | None]:
+    """Return a list of the oldest event ids to purge and when the last one fired."""
     events = (
-        session.query(Events.event_id)
+        session.query(Events.event_id, Events.time_fired)
         .filter(Events.time_fired < purge_before)
-        .limit(MAX_ROWS_TO_PURGE)
+        .order_by(Events.time_fired)
+        .limit(max_rows)
         .all()
     )
     _LOGGER.debug("Selected %s event ids to remove", len(events))
-    return [event.event_id for event in events]
+    if not events:
+        return [], None
+    return [event.event_id for event in events], process_timestamp(
+        events[-1].time_fired
+    )
 
 
-def _select_state_ids_to_purge(
+def _select_state_and_attributes_ids_to_purge(
     session: Session, purge_before: datetime, event_ids: list[int]
-) -> set[int]:
-    """Return a list of state ids to purge."""
+) -> tuple[set[int], set[int]]:
+    """Return a list of state ids and the attributes ids they reference."""
     if not event_ids:
-        return set()
+        return set(), set()
     states = (
-        session.query(States.state_id)
+        session.query(States.state_id, States.attributes_id)
         .filter(States.last_updated < purge_before)
         .filter(States.event_id.in_(event_ids))
         .all()
     )
     _LOGGER.debug("Selected %s state ids to remove", len(states))
-    return {state.state_id for state in states}
+    state_ids = set()
+    attributes_ids = set()
+    for state in states:
+        state_ids.add(state.state_id)
+        if state.attributes_id:
+            attributes_ids.add(state.attributes_id)
+    return state_ids, attributes_ids
 
 
 def _select_statistics_runs_to_purge(
@@ -165,9 +305,7 @@ def _evict_purged_states_from_old_states_cache(
     # Make a map from old_state_id to entity_id
     old_states = instance._old_states  # pylint: disable=protected-access
     old_state_reversed = {
-        old_state.state_id: entity_id
-        for entity_id, old_state in old_states.items()
-        if old_state.state_id
+        old_state_id: entity_id for entity_id, old_state_id in old_states.items()
     }
 
     # Evict any purged state from the old states cache
@@ -175,6 +313,57 @@ def _evict_purged_states_from_old_states_cache(
         old_states.pop(old_state_reversed[purged_state_id], None)
 
 
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the attributes ids that are no longer referenced by any state.
+
+    Must be called after the states referencing them have been purged.
+    """
+    if not attributes_ids:
+        return
+    still_used_ids = {
+        state.attributes_id
+        for state in session.query(
+            distinct(States.attributes_id).label("attributes_id")
+        )
+        .filter(States.attributes_id.in_(attributes_ids))
+        .all()
+    }
+    if not (unused_ids := attributes_ids - still_used_ids):
+        return
+
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+
+    # Evict any entries in the state_attributes_ids cache referring to a purged row
+    _evict_purged_attributes_from_attributes_cache(instance, unused_ids)
+
+
+def _evict_purged_attributes_from_attributes_cache(
+    instance: Recorder, purged_attributes_ids: set[int]
+) -> None:
+    """Evict purged attribute ids from the attribute ids cache."""
+    # Make a map from attributes_id to shared_attrs
+    state_attributes_ids = (
+        instance._state_attributes_ids  # pylint: disable=protected-access
+    )
+    state_attributes_ids_reversed = {
+        attributes_id: shared_attrs
+        for shared_attrs, attributes_id in state_attributes_ids.items()
+    }
+
+    # Evict any purged attributes from the cache
+    for purged_attribute_id in purged_attributes_ids.intersection(
+        state_attributes_ids_reversed
+    ):
+        state_attributes_ids.pop(state_attributes_ids_reversed[purged_attribute_id])
+
+
 def _purge_statistics_runs(session: Session, statistics_runs: list[int]) -> None:
     """Delete by run_id."""
     deleted_rows = (
@@ -254,9 +443,10 @@ def _purge_filtered_states(
     """Remove filtered states and linked events."""
     state_ids: list[int]
     event_ids: list[int | None]
-    state_ids, event_ids = zip(
+    attributes_ids: list[int | None]
+    state_ids, event_ids, attributes_ids = zip(
         *(
-            session.query(States.state_id, States.event_id)
+            session.query(States.state_id, States.event_id, States.attributes_id)
             .filter(States.entity_id.in_(excluded_entity_ids))
             .limit(MAX_ROWS_TO_PURGE)
             .all()
@@ -268,6 +458,9 @@ def _purge_filtered_states(
     )
     _purge_state_ids(instance, session, set(state_ids))
     _purge_event_ids(session, event_ids)  # type: ignore  # type of event_ids already narrowed to 'list[int]'
+    _purge_unused_attributes_ids(
+        instance, session, {id_ for id_ in attributes_ids if id_ is not None}
+    )
 
 
 def _purge_filtered_events(
@@ -285,11 +478,17 @@ def _purge_filtered_events(
         "Selected %s event_ids to remove that should be filtered", len(event_ids)
     )
     states: list[States] = (
-        session.query(States.state_id).filter(States.event_id.in_(event_ids)).all()
+        session.query(States.state_id, States.attributes_id)
+        .filter(States.event_id.in_(event_ids))
+        .all()
     )
     state_ids: set[int] = {state.state_id for state in states}
+    attributes_ids: set[int] = {
+        state.attributes_id for state in states if state.attributes_id
+    }
     _purge_state_ids(instance, session, state_ids)
     _purge_event_ids(session, event_ids)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
 
 
 @retryable_database_job("purge")
@@ -9,27 +9,62 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+SQLITE_AUTO_VACUUM_INCREMENTAL = 2
 
-def repack_database(instance: Recorder) -> None:
-    """Repack based on engine type."""
+# Number of free pages an incremental vacuum of a sqlite database releases at once
+SQLITE_INCREMENTAL_VACUUM_PAGES = 2000
+
+
+def repack_database(instance: Recorder) -> bool:
+    """Repack based on engine type.
+
+    Returns False if repacking hasn't fully completed yet.
+    """
 
     # Execute sqlite command to free up space on disk
     if instance.engine.dialect.name == "sqlite":
+        if (
+            instance.engine.execute("PRAGMA auto_vacuum").scalar()
+            == SQLITE_AUTO_VACUUM_INCREMENTAL
+        ):
+            return _incremental_vacuum_sqlite(instance)
         _LOGGER.debug("Vacuuming SQL DB to free space")
+        # The vacuum also switches the database to incremental vacuuming, later
+        # repacks free up space in small steps instead of rewriting the database
+        instance.engine.execute("PRAGMA auto_vacuum = INCREMENTAL")
         instance.engine.execute("VACUUM")
-        return
+        return True
 
     # Execute postgresql vacuum command to free up space on disk
+    # A plain vacuum doesn't lock the tables
     if instance.engine.dialect.name == "postgresql":
         _LOGGER.debug("Vacuuming SQL DB to free space")
         with instance.engine.connect().execution_options(
             isolation_level="AUTOCOMMIT"
         ) as conn:
             conn.execute("VACUUM")
-        return
+        return True
 
     # Optimize mysql / mariadb tables to free up space on disk
+    # InnoDB rebuilds the tables online
     if instance.engine.dialect.name == "mysql":
         _LOGGER.debug("Optimizing SQL DB to free space")
         instance.engine.execute("OPTIMIZE TABLE states, events, recorder_runs")
-        return
+        return True
+
+    return True
+
+
+def _incremental_vacuum_sqlite(instance: Recorder) -> bool:
+    """Free up some of the unused pages of a sqlite database."""
+    _LOGGER.debug("Incrementally vacuuming SQL DB to free space")
+    conn = instance.engine.raw_connection()
+    try:
+        # executescript steps the pragma until all pages are released,
+        # a single execute only releases one page
+        conn.executescript(
+            f"PRAGMA incremental_vacuum({SQLITE_INCREMENTAL_VACUUM_PAGES})"
+        )
+        return not conn.execute("PRAGMA freelist_count").fetchone()[0]
+    finally:
+        conn.close()
@@ -8,10 +8,9 @@ from datetime import datetime, timedelta
 from itertools import chain, groupby
 import logging
 import re
-from statistics import mean
 from typing import TYPE_CHECKING, Any, Literal
 
-from sqlalchemy import bindparam, func
+from sqlalchemy import bindparam, case, func, literal, literal_column
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext import baked
 from sqlalchemy.orm.scoping import scoped_session
@@ -32,13 +31,15 @@ import homeassistant.util.temperature as temperature_util
 from homeassistant.util.unit_system import UnitSystem
 import homeassistant.util.volume as volume_util
 
-from .const import DATA_INSTANCE, DOMAIN
+from .const import DATA_INSTANCE, DOMAIN, MAX_ROWS_TO_PURGE
 from .models import (
     StatisticData,
     StatisticMetaData,
     StatisticResult,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
     process_timestamp,
@@ -118,6 +119,19 @@ STATISTICS_BAKERY = "recorder_statistics_bakery"
 STATISTICS_META_BAKERY = "recorder_statistics_meta_bakery"
 STATISTICS_SHORT_TERM_BAKERY = "recorder_statistics_short_term_bakery"
 
+# Tables with hourly statistics aggregated per day or month in the local time zone
+PERIOD_TABLES: dict[str, type[StatisticsDaily | StatisticsMonthly]] = {
+    "day": StatisticsDaily,
+    "month": StatisticsMonthly,
+}
+
+# Maximum number of days or months aggregated by a single query
+MAX_PERIODS_PER_QUERY = 31
+
+# Maximum number of days or months compiled per table by one daily and monthly
+# statistics task, the task is queued again until all periods are compiled
+MAX_PERIODS_PER_TASK = MAX_PERIODS_PER_QUERY
+
 
 # Convert pressure and temperature statistics from the native unit used for statistics
 # to the units configured by the user
@@ -270,6 +284,8 @@ def compile_hourly_statistics(
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    Daily and monthly statistics are compiled when the hour ends a day or month.
     """
     start_time = start.replace(minute=0)
     end_time = start_time + timedelta(hours=1)
@@ -335,32 +351,30 @@ def compile_hourly_statistics(
                         "sum": _sum,
                     }
     else:
-        baked_query = instance.hass.data[STATISTICS_SHORT_TERM_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS_SUMMARY_SUM_LEGACY)
-        )
-
-        baked_query += lambda q: q.filter(
-            StatisticsShortTerm.start >= bindparam("start_time")
-        )
-        baked_query += lambda q: q.filter(
-            StatisticsShortTerm.start < bindparam("end_time")
-        )
-        baked_query += lambda q: q.order_by(
-            StatisticsShortTerm.metadata_id, StatisticsShortTerm.start.desc()
+        subquery = (
+            session.query(
+                StatisticsShortTerm.metadata_id,
+                func.max(StatisticsShortTerm.start).label("last_start"),
+            )
+            .filter(StatisticsShortTerm.start >= bindparam("start_time"))
+            .filter(StatisticsShortTerm.start < bindparam("end_time"))
+            .group_by(StatisticsShortTerm.metadata_id)
+            .subquery()
         )
-
-        stats = execute(
-            baked_query(session).params(start_time=start_time, end_time=end_time)
+        query = (
+            session.query(*QUERY_STATISTICS_SUMMARY_SUM_LEGACY)
+            .join(
+                subquery,
+                (StatisticsShortTerm.metadata_id == subquery.c.metadata_id)
+                & (StatisticsShortTerm.start == subquery.c.last_start),
+            )
+            .order_by(StatisticsShortTerm.metadata_id)
         )
+        stats = execute(query.params(start_time=start_time, end_time=end_time))
 
         if stats:
-            for metadata_id, group in groupby(stats, lambda stat: stat["metadata_id"]):  # type: ignore
-                (
-                    metadata_id,
-                    last_reset,
-                    state,
-                    _sum,
-                ) = next(group)
+            for stat in stats:
+                metadata_id, last_reset, state, _sum = stat
                 if metadata_id in summary:
                     summary[metadata_id].update(
                         {
@@ -382,6 +396,243 @@ def compile_hourly_statistics(
     for metadata_id, stat in summary.items():
         session.add(Statistics.from_stats(metadata_id, stat))
 
+    session.flush()
+
+
+def _period_start(period: str, time: datetime) -> datetime:
+    """Return the local start of the day or month time is within."""
+    start = dt_util.as_local(time).replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == "month":
+        start = start.replace(day=1)
+    return start
+
+
+def _next_period_start(period: str, start: datetime) -> datetime:
+    """Return the local start of the day or month following the one at start."""
+    if period == "month":
+        return (start + timedelta(days=31)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def _period_boundaries(
+    period: str, start_time: datetime, end_time: datetime
+) -> list[datetime]:
+    """Return the UTC boundaries of the days or months overlapping a period.
+
+    The first boundary is at or before start_time, the last at or after end_time.
+    """
+    start = _period_start(period, start_time)
+    boundaries = [dt_util.as_utc(start)]
+    while boundaries[-1] < end_time:
+        start = _next_period_start(period, start)
+        boundaries.append(dt_util.as_utc(start))
+    return boundaries
+
+
+def _aggregate_statistics(
+    session: scoped_session,
+    metadata_ids: list[int] | None,
+    period_starts: list[datetime],
+    start_time: datetime,
+    end_time: datetime,
+) -> list:
+    """Aggregate hourly statistics per day or month in the database.
+
+    Hourly statistics in start_time - end_time are grouped by the period they
+    start in. period_starts are the UTC starts of the periods, the returned
+    period column is an index into period_starts.
+    The mean, min and max are aggregated by the database and last_reset, state
+    and sum are taken from the last hourly statistics of each period.
+    """
+    if len(period_starts) > 1:
+        period = case(
+            [
+                (Statistics.start < period_start, index)
+                for index, period_start in enumerate(period_starts[1:])
+            ],
+            else_=len(period_starts) - 1,
+        )
+    else:
+        period = literal(0)
+
+    query = (
+        session.query(
+            Statistics.metadata_id,
+            period.label("period"),
+            func.avg(Statistics.mean).label("mean"),
+            func.count(Statistics.mean).label("mean_count"),
+            func.min(Statistics.min).label("min"),
+            func.max(Statistics.max).label("max"),
+            func.max(Statistics.start).label("last_start"),
+        )
+        .filter(Statistics.start >= start_time)
+        .filter(Statistics.start < end_time)
+    )
+    if metadata_ids is not None:
+        query = query.filter(Statistics.metadata_id.in_(metadata_ids))
+    subquery = query.group_by(
+        Statistics.metadata_id, literal_column("period")
+    ).subquery()
+
+    query = (
+        session.query(
+            subquery.c.metadata_id,
+            subquery.c.period,
+            subquery.c.mean,
+            subquery.c.mean_count,
+            subquery.c.min,
+            subquery.c.max,
+            Statistics.last_reset,
+            Statistics.state,
+            Statistics.sum,
+        )
+        .join(
+            Statistics,
+            (Statistics.metadata_id == subquery.c.metadata_id)
+            & (Statistics.start == subquery.c.last_start),
+        )
+        .order_by(subquery.c.metadata_id, subquery.c.period)
+    )
+    return execute(query) or []
+
+
+def _compile_period_statistics(
+    session: scoped_session,
+    period: str,
+    metadata_ids: list[int] | None,
+    start_time: datetime,
+    end_time: datetime,
+) -> None:
+    """Compile daily or monthly statistics from hourly statistics.
+
+    start_time and end_time must be at the start of a day or month.
+    """
+    table = PERIOD_TABLES[period]
+    boundaries = _period_boundaries(period, start_time, end_time)
+    for index in range(0, len(boundaries) - 1, MAX_PERIODS_PER_QUERY):
+        chunk = boundaries[index : index + MAX_PERIODS_PER_QUERY + 1]
+        for stat in _aggregate_statistics(
+            session, metadata_ids, chunk[:-1], chunk[0], chunk[-1]
+        ):
+            session.add(
+                table.from_stats(
+                    stat.metadata_id,
+                    {
+                        "start": chunk[stat.period],
+                        "mean": stat.mean,
+                        "min": stat.min,
+                        "max": stat.max,
+                        "last_reset": process_timestamp(stat.last_reset),
+                        "state": stat.state,
+                        "sum": stat.sum,
+                    },
+                )
+            )
+
+
+def _period_statistics_end(session: scoped_session, period: str) -> datetime | None:
+    """Return the end of the last compiled daily or monthly statistics.
+
+    Returns None if there are none, or if they were compiled for another time zone.
+    """
+    table = PERIOD_TABLES[period]
+    if (last_start := session.query(func.max(table.start)).scalar()) is None:
+        return None
+    last_start = process_timestamp(last_start)
+    start = _period_start(period, last_start)
+    if dt_util.as_utc(start) != last_start:
+        return None
+    return dt_util.as_utc(_next_period_start(period, start))
+
+
+def _compile_missing_period_statistics(
+    session: scoped_session, end_time: datetime
+) -> bool:
+    """Compile the next daily and monthly statistics ended before end_time.
+
+    Compiles at most MAX_PERIODS_PER_TASK days and months, the compiled
+    statistics are the progress the next call continues from. Statistics
+    compiled for another time zone are first deleted, MAX_ROWS_TO_PURGE
+    rows at a time.
+
+    Returns True when all periods ended before end_time are compiled.
+    """
+    done = True
+    for period, table in PERIOD_TABLES.items():
+        if (start_time := _period_statistics_end(session, period)) is None:
+            if ids := [
+                row.id
+                for row in session.query(table.id)
+                .order_by(table.id)
+                .limit(MAX_ROWS_TO_PURGE)
+            ]:
+                # The time zone has changed, start over once all are deleted
+                session.query(table).filter(table.id.in_(ids)).delete(
+                    synchronize_session=False
+                )
+                done = False
+                continue
+        # Skip the days and months without hourly statistics
+        period_end = dt_util.as_utc(_period_start(period, end_time))
+        query = session.query(
+            func.min(Statistics.start), func.max(Statistics.start)
+        ).filter(Statistics.start < period_end)
+        if start_time is not None:
+            query = query.filter(Statistics.start >= start_time)
+        first_start, last_start = query.one()
+        if first_start is None:
+            continue
+        start_time = dt_util.as_utc(
+            _period_start(period, process_timestamp(first_start))
+        )
+        period_end = dt_util.as_utc(
+            _next_period_start(
+                period, _period_start(period, process_timestamp(last_start))
+            )
+        )
+        boundaries = _period_boundaries(period, start_time, period_end)
+        if len(boundaries) > MAX_PERIODS_PER_TASK + 1:
+            period_end = boundaries[MAX_PERIODS_PER_TASK]
+            done = False
+        _compile_period_statistics(session, period, None, start_time, period_end)
+    return done
+
+
+@retryable_database_job("daily and monthly statistics")
+def compile_missing_period_statistics(instance: Recorder, end: datetime) -> bool:
+    """Compile the next daily and monthly statistics ended before end.
+
+    Returns False when the task should be queued again to continue.
+    """
+    with session_scope(session=instance.get_session()) as session:  # type: ignore
+        return _compile_missing_period_statistics(session, end)
+
+
+def _update_period_statistics(
+    session: scoped_session, metadata_id: int, starts: list[datetime]
+) -> None:
+    """Compile daily and monthly statistics again after hourly statistics changed."""
+    if not starts:
+        return
+    session.flush()
+    for period, table in PERIOD_TABLES.items():
+        if (compiled_end := _period_statistics_end(session, period)) is None:
+            # Compiled by the next hourly statistics run
+            continue
+        start_time = dt_util.as_utc(_period_start(period, min(starts)))
+        end_time = min(
+            compiled_end,
+            dt_util.as_utc(
+                _next_period_start(period, _period_start(period, max(starts)))
+            ),
+        )
+        if start_time >= end_time:
+            continue
+        session.query(table).filter(table.metadata_id == metadata_id).filter(
+            table.start >= start_time
+        ).filter(table.start < end_time).delete(synchronize_session=False)
+        _compile_period_statistics(session, period, [metadata_id], start_time, end_time)
+
 
 @retryable_database_job("statistics")
 def compile_statistics(instance: Recorder, start: datetime) -> bool:
@@ -538,7 +789,7 @@ def get_metadata(
     statistic_source: str | None = None,
 ) -> dict[str, tuple[int, StatisticMetaData]]:
     """Return metadata for statistic_ids."""
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         return get_metadata_with_session(
             hass,
             session,
@@ -593,7 +844,7 @@ def list_statistic_ids(
     statistic_ids = {}
 
     # Query the database
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         metadata = get_metadata_with_session(
             hass, session, statistic_type=statistic_type
         )
@@ -669,98 +920,177 @@ def _statistics_during_period_query(
     return baked_query  # type: ignore[no-any-return]
 
 
-def _reduce_statistics(
-    stats: dict[str, list[dict[str, Any]]],
-    same_period: Callable[[datetime, datetime], bool],
-    period_start_end: Callable[[datetime], tuple[datetime, datetime]],
-    period: timedelta,
+def _statistics_during_period_per_period(
+    hass: HomeAssistant,
+    session: scoped_session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    _metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: Literal["day", "month"],
 ) -> dict[str, list[dict[str, Any]]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
-    result: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: dict[str, Any] = stat_list[0]
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(
-            stat_list, ({"start": stat_list[-1]["start"] + period},)
-        ):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                result[statistic_id].append(
-                    {
-                        "statistic_id": statistic_id,
-                        "start": start.isoformat(),
-                        "end": end.isoformat(),
-                        "mean": mean(mean_values) if mean_values else None,
-                        "min": min(min_values) if min_values else None,
-                        "max": max(max_values) if max_values else None,
-                        "last_reset": prev_stat["last_reset"],
-                        "state": prev_stat["state"],
-                        "sum": prev_stat["sum"],
-                    }
-                )
-                max_values = []
-                mean_values = []
-                min_values = []
-            if statistic.get("max") is not None:
-                max_values.append(statistic["max"])
-            if statistic.get("mean") is not None:
-                mean_values.append(statistic["mean"])
-            if statistic.get("min") is not None:
-                min_values.append(statistic["min"])
-            prev_stat = statistic
+    """Return daily or monthly statistics during UTC period start_time - end_time.
 
-    return result
+    Days and months completely within the period are read from the compiled daily
+    and monthly statistics, the hourly statistics of other days or months are
+    aggregated by the database.
+    """
+    query = session.query(func.max(Statistics.start)).filter(
+        Statistics.start >= start_time
+    )
+    if end_time is not None:
+        query = query.filter(Statistics.start < end_time)
+    if metadata_ids is not None:
+        query = query.filter(Statistics.metadata_id.in_(metadata_ids))
+    if (last_start := query.scalar()) is None:
+        return {}
+    if end_time is None:
+        end_time = process_timestamp(last_start) + Statistics.duration
+
+    boundaries = _period_boundaries(period, start_time, end_time)
+    compiled_start = next(boundary for boundary in boundaries if boundary >= start_time)
+    compiled_end = max(boundary for boundary in boundaries if boundary <= end_time)
+    if (period_end := _period_statistics_end(session, period)) is not None:
+        compiled_end = min(compiled_end, period_end)
+    else:
+        compiled_end = compiled_start
 
+    # Entries per metadata_id and period start
+    periods: dict[int, dict[datetime, dict[str, Any]]] = defaultdict(dict)
 
-def _reduce_statistics_per_day(
-    stats: dict[str, list[dict[str, Any]]]
-) -> dict[str, list[dict[str, Any]]]:
-    """Reduce hourly statistics to daily statistics."""
-
-    def same_period(time1: datetime, time2: datetime) -> bool:
-        """Return True if time1 and time2 are in the same date."""
-        date1 = dt_util.as_local(time1).date()
-        date2 = dt_util.as_local(time2).date()
-        return date1 == date2
-
-    def period_start_end(time: datetime) -> tuple[datetime, datetime]:
-        """Return the start and end of the period (day) time is within."""
-        start = dt_util.as_utc(
-            dt_util.as_local(time).replace(hour=0, minute=0, second=0, microsecond=0)
+    if compiled_start < compiled_end:
+        table = PERIOD_TABLES[period]
+        query = (
+            session.query(
+                table.metadata_id,
+                table.start,
+                table.mean,
+                table.min,
+                table.max,
+                table.last_reset,
+                table.state,
+                table.sum,
+            )
+            .filter(table.start >= compiled_start)
+            .filter(table.start < compiled_end)
         )
-        end = start + timedelta(days=1)
-        return (start, end)
+        if metadata_ids is not None:
+            query = query.filter(table.metadata_id.in_(metadata_ids))
+        stats = execute(query) or []
+        valid_starts = set(boundaries)
+        if all(process_timestamp(stat.start) in valid_starts for stat in stats):
+            for stat in stats:
+                periods[stat.metadata_id][process_timestamp(stat.start)] = {
+                    "mean": stat.mean,
+                    "mean_count": None,
+                    "min": stat.min,
+                    "max": stat.max,
+                    "last_reset": stat.last_reset,
+                    "state": stat.state,
+                    "sum": stat.sum,
+                }
+        else:
+            # Compiled for another time zone, aggregate the hourly statistics
+            compiled_end = compiled_start
 
-    return _reduce_statistics(stats, same_period, period_start_end, timedelta(days=1))
+    if compiled_start < compiled_end:
+        ranges = [(start_time, compiled_start), (compiled_end, end_time)]
+    else:
+        ranges = [(start_time, end_time)]
+    for range_start, range_end in ranges:
+        if range_start >= range_end:
+            continue
+        period_starts = [
+            boundary
+            for boundary, next_boundary in zip(boundaries, boundaries[1:])
+            if boundary < range_end and next_boundary > range_start
+        ]
+        for stat in _aggregate_statistics(
+            session, metadata_ids, period_starts, range_start, range_end
+        ):
+            periods[stat.metadata_id][period_starts[stat.period]] = {
+                "mean": stat.mean,
+                "mean_count": stat.mean_count,
+                "min": stat.min,
+                "max": stat.max,
+                "last_reset": stat.last_reset,
+                "state": stat.state,
+                "sum": stat.sum,
+            }
 
+    if not periods:
+        return {}
 
-def _reduce_statistics_per_month(
-    stats: dict[str, list[dict[str, Any]]]
-) -> dict[str, list[dict[str, Any]]]:
-    """Reduce hourly statistics to monthly statistics."""
-
-    def same_period(time1: datetime, time2: datetime) -> bool:
-        """Return True if time1 and time2 are in the same year and month."""
-        date1 = dt_util.as_local(time1).date()
-        date2 = dt_util.as_local(time2).date()
-        return (date1.year, date1.month) == (date2.year, date2.month)
-
-    def period_start_end(time: datetime) -> tuple[datetime, datetime]:
-        """Return the start and end of the period (month) time is within."""
-        start = dt_util.as_utc(
-            dt_util.as_local(time).replace(
-                day=1, hour=0, minute=0, second=0, microsecond=0
+    # Like hourly statistics, include the last known statistics before start_time
+    # for statistics which have no hourly statistics starting at start_time
+    at_start_time = {
+        stat.metadata_id
+        for stat in session.query(Statistics.metadata_id)
+        .filter(Statistics.start == start_time)
+        .filter(Statistics.metadata_id.in_(list(periods)))
+    }
+    if need_stat_at_start_time := set(periods) - at_start_time:
+        for stat in (
+            _statistics_at_time(
+                session, need_stat_at_start_time, Statistics, start_time
             )
-        )
-        end = (start + timedelta(days=31)).replace(day=1)
-        return (start, end)
+            or []
+        ):
+            start = dt_util.as_utc(_period_start(period, process_timestamp(stat.start)))
+            if (entry := periods[stat.metadata_id].get(start)) is None:
+                periods[stat.metadata_id][start] = {
+                    "mean": stat.mean,
+                    "min": stat.min,
+                    "max": stat.max,
+                    "last_reset": stat.last_reset,
+                    "state": stat.state,
+                    "sum": stat.sum,
+                }
+                continue
+            # Merge with the hourly statistics in the same period
+            if stat.mean is not None:
+                if entry["mean"] is None:
+                    entry["mean"] = stat.mean
+                else:
+                    entry["mean"] = (
+                        entry["mean"] * entry["mean_count"] + stat.mean
+                    ) / (entry["mean_count"] + 1)
+            for key, reduce in (("min", min), ("max", max)):
+                if (value := getattr(stat, key)) is not None:
+                    entry[key] = (
+                        value if entry[key] is None else reduce(entry[key], value)
+                    )
 
-    return _reduce_statistics(stats, same_period, period_start_end, timedelta(days=31))
+    units = hass.config.units
+    metadata = dict(_metadata.values())
+    result: dict[str, list[dict[str, Any]]] = {}
+    for meta_id in sorted(periods):
+        unit = metadata[meta_id]["unit_of_measurement"]
+        statistic_id = metadata[meta_id]["statistic_id"]
+        convert = UNIT_CONVERSIONS.get(unit, lambda x, units: x)  # type: ignore
+        ent_results = result[statistic_id] = []
+        for start, entry in sorted(periods[meta_id].items()):
+            if period == "day":
+                end = start + timedelta(days=1)
+            else:
+                end = (start + timedelta(days=31)).replace(day=1)
+            ent_results.append(
+                {
+                    "statistic_id": statistic_id,
+                    "start": start.isoformat(),
+                    "end": end.isoformat(),
+                    "mean": convert(entry["mean"], units),
+                    "min": convert(entry["min"], units),
+                    "max": convert(entry["max"], units),
+                    "last_reset": process_timestamp_to_utc_isoformat(
+                        entry["last_reset"]
+                    ),
+                    "state": convert(entry["state"], units),
+                    "sum": convert(entry["sum"], units),
+                }
+            )
+
+    return result
 
 
 def statistics_during_period(
@@ -776,7 +1106,7 @@ def statistics_during_period(
     If statistic_ids is omitted, returns statistics for all statistics ids.
     """
     metadata = None
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         # Fetch metadata for the given (or all) statistic_ids
         metadata = get_metadata_with_session(hass, session, statistic_ids=statistic_ids)
         if not metadata:
@@ -786,6 +1116,11 @@ def statistics_during_period(
         if statistic_ids is not None:
             metadata_ids = [metadata_id for metadata_id, _ in metadata.values()]
 
+        if period in ("day", "month"):
+            return _statistics_during_period_per_period(
+                hass, session, start_time, end_time, metadata_ids, metadata, period
+            )
+
         if period == "5minute":
             bakery = STATISTICS_SHORT_TERM_BAKERY
             base_query = QUERY_STATISTICS_SHORT_TERM
@@ -807,63 +1142,66 @@ def statistics_during_period(
         if not stats:
             return {}
         # Return statistics combined with metadata
-        if period not in ("day", "month"):
-            return _sorted_statistics_to_dict(
-                hass, session, stats, statistic_ids, metadata, True, table, start_time
-            )
-
-        result = _sorted_statistics_to_dict(
-            hass, session, stats, statistic_ids, metadata, True, table, start_time, True
+        return _sorted_statistics_to_dict(
+            hass, session, stats, statistic_ids, metadata, True, table, start_time
         )
 
-        if period == "day":
-            return _reduce_statistics_per_day(result)
-
-        return _reduce_statistics_per_month(result)
-
 
-def get_last_statistics(
-    hass: HomeAssistant, number_of_stats: int, statistic_id: str, convert_units: bool
+def get_last_statistics_with_session(
+    hass: HomeAssistant,
+    session: scoped_session,
+    number_of_stats: int,
+    statistic_id: str,
+    convert_units: bool,
 ) -> dict[str, list[dict]]:
     """Return the last number_of_stats statistics for a given statistic_id."""
     statistic_ids = [statistic_id]
-    with session_scope(hass=hass) as session:
-        # Fetch metadata for the given statistic_id
-        metadata = get_metadata_with_session(hass, session, statistic_ids=statistic_ids)
-        if not metadata:
-            return {}
+    # Fetch metadata for the given statistic_id
+    metadata = get_metadata_with_session(hass, session, statistic_ids=statistic_ids)
+    if not metadata:
+        return {}
 
-        baked_query = hass.data[STATISTICS_SHORT_TERM_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS_SHORT_TERM)
-        )
+    baked_query = hass.data[STATISTICS_SHORT_TERM_BAKERY](
+        lambda session: session.query(*QUERY_STATISTICS_SHORT_TERM)
+    )
 
-        baked_query += lambda q: q.filter_by(metadata_id=bindparam("metadata_id"))
-        metadata_id = metadata[statistic_id][0]
+    baked_query += lambda q: q.filter_by(metadata_id=bindparam("metadata_id"))
+    metadata_id = metadata[statistic_id][0]
 
-        baked_query += lambda q: q.order_by(
-            StatisticsShortTerm.metadata_id, StatisticsShortTerm.start.desc()
-        )
+    baked_query += lambda q: q.order_by(
+        StatisticsShortTerm.metadata_id, StatisticsShortTerm.start.desc()
+    )
 
-        baked_query += lambda q: q.limit(bindparam("number_of_stats"))
+    baked_query += lambda q: q.limit(bindparam("number_of_stats"))
 
-        stats = execute(
-            baked_query(session).params(
-                number_of_stats=number_of_stats, metadata_id=metadata_id
-            )
+    stats = execute(
+        baked_query(session).params(
+            number_of_stats=number_of_stats, metadata_id=metadata_id
         )
-        if not stats:
-            return {}
+    )
+    if not stats:
+        return {}
 
-        # Return statistics combined with metadata
-        return _sorted_statistics_to_dict(
-            hass,
-            session,
-            stats,
-            statistic_ids,
-            metadata,
-            convert_units,
-            StatisticsShortTerm,
-            None,
+    # Return statistics combined with metadata
+    return _sorted_statistics_to_dict(
+        hass,
+        session,
+        stats,
+        statistic_ids,
+        metadata,
+        convert_units,
+        StatisticsShortTerm,
+        None,
+    )
+
+
+def get_last_statistics(
+    hass: HomeAssistant, number_of_stats: int, statistic_id: str, convert_units: bool
+) -> dict[str, list[dict]]:
+    """Return the last number_of_stats statistics for a given statistic_id."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return get_last_statistics_with_session(
+            hass, session, number_of_stats, statistic_id, convert_units
         )
 
 
@@ -908,7 +1246,6 @@ def _sorted_statistics_to_dict(
     convert_units: bool,
     table: type[Statistics | StatisticsShortTerm],
     start_time: datetime | None,
-    start_time_as_datetime: bool = False,
 ) -> dict[str, list[dict]]:
     """Convert SQL results into JSON friendly data structure."""
     result: dict = defaultdict(list)
@@ -956,7 +1293,7 @@ def _sorted_statistics_to_dict(
             ent_results.append(
                 {
                     "statistic_id": statistic_id,
-                    "start": start if start_time_as_datetime else start.isoformat(),
+                    "start": start.isoformat(),
                     "end": end.isoformat(),
                     "mean": convert(db_state.mean, units),
                     "min": convert(db_state.min, units),
@@ -1038,6 +1375,7 @@ def add_external_statistics(
     """Process an add_statistics job."""
     with session_scope(session=instance.get_session()) as session:  # type: ignore
         metadata_id = _update_or_add_metadata(instance.hass, session, metadata)
+        starts = []
         for stat in statistics:
             if stat_id := _statistics_exists(
                 session, Statistics, metadata_id, stat["start"]
@@ -1045,5 +1383,7 @@ def add_external_statistics(
                 _update_statistics(session, Statistics, stat_id, stat)
             else:
                 _insert_statistics(session, Statistics, metadata_id, stat)
+            starts.append(stat["start"])
+        _update_period_statistics(session, metadata_id, starts)
 
     return True
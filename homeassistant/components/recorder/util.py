@@ -28,7 +28,9 @@ from .models import (
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_STATISTICS,
+    TABLE_STATISTICS_DAILY,
     TABLE_STATISTICS_META,
+    TABLE_STATISTICS_MONTHLY,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
     RecorderRuns,
@@ -66,11 +68,22 @@ RETRYABLE_MYSQL_ERRORS = (1205, 1206, 1213)
 
 @contextmanager
 def session_scope(
-    *, hass: HomeAssistant | None = None, session: Session | None = None
+    *,
+    hass: HomeAssistant | None = None,
+    session: Session | None = None,
+    read_only: bool = False,
 ) -> Generator[Session, None, None]:
-    """Provide a transactional scope around a series of operations."""
+    """Provide a transactional scope around a series of operations.
+
+    Sessions created with read_only use the connections reserved for reading,
+    which don't wait for the recorder thread.
+    """
     if session is None and hass is not None:
-        session = hass.data[DATA_INSTANCE].get_session()
+        instance = hass.data[DATA_INSTANCE]
+        if read_only:
+            session = instance.get_read_session()
+        else:
+            session = instance.get_session()
 
     if session is None:
         raise RuntimeError("Session required")
@@ -204,6 +217,8 @@ def basic_sanity_check(cursor):
             TABLE_STATISTICS_META,
             TABLE_STATISTICS_RUNS,
             TABLE_STATISTICS_SHORT_TERM,
+            TABLE_STATISTICS_DAILY,
+            TABLE_STATISTICS_MONTHLY,
         ]:
             continue
         if table in (TABLE_RECORDER_RUNS, TABLE_SCHEMA_CHANGES):
@@ -400,6 +415,22 @@ def setup_connection_for_dialect(
         _warn_unsupported_dialect(dialect_name)
 
 
+def setup_read_connection_for_dialect(instance, dialect_name, dbapi_connection):
+    """Execute statements needed for a dialect connection used for reading only."""
+    setup_connection_for_dialect(instance, dialect_name, dbapi_connection, False)
+    if dialect_name == "sqlite":
+        execute_on_connection(dbapi_connection, "PRAGMA query_only = ON")
+    elif dialect_name == "mysql":
+        execute_on_connection(dbapi_connection, "SET SESSION TRANSACTION READ ONLY")
+        dbapi_connection.commit()
+    elif dialect_name == "postgresql":
+        execute_on_connection(
+            dbapi_connection, "SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"
+        )
+        # Don't let the rollback when the connection is returned revert it
+        dbapi_connection.commit()
+
+
 def end_incomplete_runs(session, start_time):
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
@@ -7,6 +7,7 @@ import datetime
 import itertools
 import logging
 import math
+import threading
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -19,6 +20,7 @@ from homeassistant.components.recorder import (
 )
 from homeassistant.components.recorder.const import DOMAIN as RECORDER_DOMAIN
 from homeassistant.components.recorder.models import (
+    LazyState,
     StatisticData,
     StatisticMetaData,
     StatisticResult,
@@ -42,6 +44,7 @@ from homeassistant.const import (
     ENERGY_KILO_WATT_HOUR,
     ENERGY_MEGA_WATT_HOUR,
     ENERGY_WATT_HOUR,
+    EVENT_STATE_CHANGED,
     POWER_KILO_WATT,
     POWER_WATT,
     PRESSURE_BAR,
@@ -57,7 +60,7 @@ from homeassistant.const import (
     VOLUME_CUBIC_FEET,
     VOLUME_CUBIC_METERS,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 import homeassistant.util.dt as dt_util
@@ -140,6 +143,12 @@ WARN_NEGATIVE = "sensor_warn_total_increasing_negative"
 WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 
+# Running statistics of measurement sensors, updated as their state changes
+DATA_RUNNING_STATISTICS = "sensor_running_statistics"
+STATISTICS_PERIOD = datetime.timedelta(minutes=5)
+# Maximum number of periods kept for each sensor until they are compiled
+MAX_PENDING_PERIODS = 12
+
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
@@ -207,6 +216,18 @@ def _parse_float(state: str) -> float:
     return fstate
 
 
+def _parse_state(state: State) -> float:
+    """Parse the state of a state object, throw if it is not a finite number.
+
+    States loaded from the database carry their parsed numeric value.
+    """
+    if isinstance(state, LazyState):
+        if (fstate := state.numeric_state) is None:
+            raise ValueError
+        return fstate
+    return _parse_float(state.state)
+
+
 def _normalize_states(
     hass: HomeAssistant,
     session: Session,
@@ -223,7 +244,7 @@ def _normalize_states(
         fstates = []
         for state in entity_history:
             try:
-                fstate = _parse_float(state.state)
+                fstate = _parse_state(state)
             except (ValueError, TypeError):  # TypeError to guard for NULL state in DB
                 continue
             fstates.append((fstate, state))
@@ -231,23 +252,7 @@ def _normalize_states(
         if fstates:
             all_units = _get_units(fstates)
             if len(all_units) > 1:
-                if WARN_UNSTABLE_UNIT not in hass.data:
-                    hass.data[WARN_UNSTABLE_UNIT] = set()
-                if entity_id not in hass.data[WARN_UNSTABLE_UNIT]:
-                    hass.data[WARN_UNSTABLE_UNIT].add(entity_id)
-                    extra = ""
-                    if old_metadata := old_metadatas.get(entity_id):
-                        extra = (
-                            " and matches the unit of already compiled statistics "
-                            f"({old_metadata[1]['unit_of_measurement']})"
-                        )
-                    _LOGGER.warning(
-                        "The unit of %s is changing, got multiple %s, generation of long term "
-                        "statistics will be suppressed unless the unit is stable%s",
-                        entity_id,
-                        all_units,
-                        extra,
-                    )
+                _warn_unstable_unit(hass, old_metadatas, entity_id, all_units)
                 return None, []
             unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         return unit, fstates
@@ -256,17 +261,13 @@ def _normalize_states(
 
     for state in entity_history:
         try:
-            fstate = _parse_float(state.state)
+            fstate = _parse_state(state)
         except ValueError:
             continue
         unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         # Exclude unsupported units from statistics
         if unit not in UNIT_CONVERSIONS[device_class]:
-            if WARN_UNSUPPORTED_UNIT not in hass.data:
-                hass.data[WARN_UNSUPPORTED_UNIT] = set()
-            if entity_id not in hass.data[WARN_UNSUPPORTED_UNIT]:
-                hass.data[WARN_UNSUPPORTED_UNIT].add(entity_id)
-                _LOGGER.warning("%s has unknown unit %s", entity_id, unit)
+            _warn_unsupported_unit(hass, entity_id, unit)
             continue
 
         fstates.append((UNIT_CONVERSIONS[device_class][unit](fstate), state))
@@ -274,6 +275,305 @@ def _normalize_states(
     return DEVICE_CLASS_UNITS[device_class], fstates
 
 
+def _normalize_state(
+    hass: HomeAssistant, state: State, device_class: str | None, entity_id: str
+) -> tuple[float, str | None] | None:
+    """Normalize the unit of a single state.
+
+    Returns None if the state is excluded from statistics, same as
+    _normalize_states.
+    """
+    try:
+        fstate = _parse_state(state)
+    except (ValueError, TypeError):
+        return None
+    unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+
+    if device_class not in UNIT_CONVERSIONS:
+        return fstate, unit
+
+    if unit not in UNIT_CONVERSIONS[device_class]:
+        _warn_unsupported_unit(hass, entity_id, unit)
+        return None
+
+    return (
+        UNIT_CONVERSIONS[device_class][unit](fstate),
+        DEVICE_CLASS_UNITS[device_class],
+    )
+
+
+def _warn_unstable_unit(
+    hass: HomeAssistant,
+    old_metadatas: dict[str, tuple[int, StatisticMetaData]],
+    entity_id: str,
+    all_units: set[str | None],
+) -> None:
+    """Log a warning once if the unit of a sensor is changing."""
+    if WARN_UNSTABLE_UNIT not in hass.data:
+        hass.data[WARN_UNSTABLE_UNIT] = set()
+    if entity_id not in hass.data[WARN_UNSTABLE_UNIT]:
+        hass.data[WARN_UNSTABLE_UNIT].add(entity_id)
+        extra = ""
+        if old_metadata := old_metadatas.get(entity_id):
+            extra = (
+                " and matches the unit of already compiled statistics "
+                f"({old_metadata[1]['unit_of_measurement']})"
+            )
+        _LOGGER.warning(
+            "The unit of %s is changing, got multiple %s, generation of long term "
+            "statistics will be suppressed unless the unit is stable%s",
+            entity_id,
+            all_units,
+            extra,
+        )
+
+
+def _warn_unsupported_unit(
+    hass: HomeAssistant, entity_id: str, unit: str | None
+) -> None:
+    """Log a warning once if a sensor has a unit which can't be normalized."""
+    if WARN_UNSUPPORTED_UNIT not in hass.data:
+        hass.data[WARN_UNSUPPORTED_UNIT] = set()
+    if entity_id not in hass.data[WARN_UNSUPPORTED_UNIT]:
+        hass.data[WARN_UNSUPPORTED_UNIT].add(entity_id)
+        _LOGGER.warning("%s has unknown unit %s", entity_id, unit)
+
+
+def _period_start(time: datetime.datetime) -> datetime.datetime:
+    """Return the start of the 5-minute statistics period containing time."""
+    return time.replace(minute=time.minute - time.minute % 5, second=0, microsecond=0)
+
+
+class PeriodStatistics:
+    """Time weighted mean, min and max of a sensor during a 5-minute period.
+
+    The statistics are updated with every valid state, following the same rules
+    as _time_weighted_average.
+    """
+
+    __slots__ = (
+        "start",
+        "complete",
+        "units",
+        "min",
+        "max",
+        "_accumulated",
+        "_first_time",
+        "_value",
+        "_value_time",
+    )
+
+    def __init__(self, start: datetime.datetime, complete: bool) -> None:
+        """Initialize the period statistics."""
+        self.start = start
+        # False if the states before some state change in the period are unknown
+        self.complete = complete
+        self.units: set[str | None] = set()
+        self.min: float | None = None
+        self.max: float | None = None
+        self._accumulated = 0.0
+        self._first_time: datetime.datetime | None = None
+        self._value: float | None = None
+        self._value_time: datetime.datetime | None = None
+
+    def add(self, fstate: float, unit: str | None, time: datetime.datetime) -> None:
+        """Add a valid state."""
+        if self._value is None:
+            self._first_time = time
+            self.min = self.max = fstate
+        else:
+            assert self._value_time is not None
+            duration = time - self._value_time
+            # Accumulate the value, weighted by duration until next state change
+            self._accumulated += self._value * duration.total_seconds()
+            self.min = min(self.min, fstate)  # type: ignore[type-var]
+            self.max = max(self.max, fstate)  # type: ignore[type-var]
+        self._value = fstate
+        self._value_time = time
+        self.units.add(unit)
+
+    def mean(self) -> float:
+        """Return the time weighted average of the period."""
+        assert self._value is not None
+        assert self._first_time is not None and self._value_time is not None
+        end = self.start + STATISTICS_PERIOD
+        duration = end - self._value_time
+        accumulated = self._accumulated + self._value * duration.total_seconds()
+        return accumulated / (end - self._first_time).total_seconds()
+
+
+class _SensorStatistics:
+    """Running statistics of a single measurement sensor."""
+
+    __slots__ = ("device_class", "period", "pending", "_last")
+
+    def __init__(
+        self, device_class: str | None, time: datetime.datetime, complete: bool
+    ) -> None:
+        """Initialize the running statistics, starting in the period of time."""
+        self.device_class = device_class
+        self.period = PeriodStatistics(_period_start(time), complete)
+        self.pending: dict[datetime.datetime, PeriodStatistics] = {}
+        # The normalized value and unit of the last state, None if it's not valid
+        self._last: tuple[float, str | None] | None = None
+
+    def update(
+        self,
+        value: tuple[float, str | None] | None,
+        time: datetime.datetime,
+        significant: bool,
+    ) -> None:
+        """Update the statistics with a new state."""
+        if time < self.period.start:
+            # Out of order state change, the period no longer matches the database
+            self.period.complete = False
+        else:
+            self.roll(time)
+        self._last = value
+        if not self.period.complete:
+            return
+        # Same as the recorder history, attribute only changes are not significant
+        if significant and value is not None:
+            self.period.add(*value, time)
+
+    def roll(self, time: datetime.datetime) -> None:
+        """Close the periods ending before time."""
+        if self.period.start + STATISTICS_PERIOD > time:
+            return
+
+        start = self.period.start + STATISTICS_PERIOD
+        if self.period.complete:
+            self.pending[self.period.start] = self.period
+        # Periods without state changes are all the same, only keep the last ones
+        start = max(
+            start, _period_start(time) - MAX_PENDING_PERIODS * STATISTICS_PERIOD
+        )
+        while True:
+            period = PeriodStatistics(start, True)
+            # The previous state is the first state of the period
+            if self._last is not None:
+                period.add(*self._last, start)
+            start += STATISTICS_PERIOD
+            if start > time:
+                break
+            self.pending[period.start] = period
+        self.period = period
+
+        while len(self.pending) > MAX_PENDING_PERIODS:
+            del self.pending[next(iter(self.pending))]
+
+
+class RunningStatistics:
+    """Running 5-minute statistics of measurement sensors.
+
+    The statistics are updated as the state of the sensors change, which
+    allows compiling them without reading the states back from the database.
+    Periods which were not fully tracked, for example the period during which
+    Home Assistant was started, have to be compiled from the database.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the running statistics."""
+        self.hass = hass
+        self._lock = threading.Lock()
+        self._sensors: dict[str, _SensorStatistics] = {}
+        self._tracking_since: datetime.datetime | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start tracking the state of sensors."""
+        now = self._tracking_since = dt_util.utcnow()
+        with self._lock:
+            for state in self.hass.states.async_all(DOMAIN):
+                self._update(state.entity_id, None, state, now)
+        self.hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED, DOMAIN, self._async_state_changed
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Update the statistics of a sensor when its state changes."""
+        old_state: State | None = event.data.get("old_state")
+        new_state: State | None = event.data.get("new_state")
+        time = event.time_fired if new_state is None else new_state.last_updated
+        with self._lock:
+            self._update(event.data["entity_id"], old_state, new_state, time)
+
+    def _update(
+        self,
+        entity_id: str,
+        old_state: State | None,
+        state: State | None,
+        time: datetime.datetime,
+    ) -> None:
+        """Update the statistics of a sensor."""
+        if state is None:
+            # The recorder stores an empty state when an entity is removed
+            if (sensor := self._sensors.get(entity_id)) is not None:
+                sensor.update(None, time, True)
+            return
+
+        state_class = state.attributes.get(ATTR_STATE_CLASS)
+        device_class = state.attributes.get(ATTR_DEVICE_CLASS)
+        if (
+            state_class != STATE_CLASS_MEASUREMENT
+            or device_class in DEVICE_CLASS_STATISTICS[STATE_CLASS_MEASUREMENT]
+        ):
+            # Only mean, min and max are kept as running statistics
+            self._sensors.pop(entity_id, None)
+            return
+
+        sensor = self._sensors.get(entity_id)
+        if sensor is None or sensor.device_class != device_class:
+            # The states of the period are only known for sensors which were
+            # added after tracking started
+            complete = (
+                sensor is None
+                and old_state is None
+                and self._tracking_since is not None
+                and self._tracking_since <= _period_start(time)
+            )
+            sensor = self._sensors[entity_id] = _SensorStatistics(
+                device_class, time, complete
+            )
+        sensor.update(
+            _normalize_state(self.hass, state, device_class, entity_id),
+            time,
+            state.last_changed == state.last_updated,
+        )
+
+    def pop_period(
+        self, entity_id: str, device_class: str | None, start: datetime.datetime
+    ) -> PeriodStatistics | None:
+        """Return the statistics of a sensor for the period starting at start.
+
+        Returns None if the period was not fully tracked.
+        """
+        with self._lock:
+            if (sensor := self._sensors.get(entity_id)) is None:
+                return None
+            if sensor.device_class != device_class or _period_start(start) != start:
+                return None
+            sensor.roll(start + STATISTICS_PERIOD)
+            for period_start in list(sensor.pending):
+                if period_start > start:
+                    break
+                period = sensor.pending.pop(period_start)
+                if period_start == start:
+                    return period
+            return None
+
+
+def _get_running_statistics(hass: HomeAssistant) -> RunningStatistics:
+    """Get the running statistics, start tracking sensors if needed."""
+    if (running_statistics := hass.data.get(DATA_RUNNING_STATISTICS)) is None:
+        running_statistics = hass.data[DATA_RUNNING_STATISTICS] = RunningStatistics(
+            hass
+        )
+        hass.add_job(running_statistics.async_start)
+    return running_statistics
+
+
 def _suggest_report_issue(hass: HomeAssistant, entity_id: str) -> str:
     """Suggest to report an issue."""
     domain = entity_sources(hass).get(entity_id, {}).get("domain")
@@ -420,6 +720,19 @@ def _compile_statistics(  # noqa: C901
         hass, session, statistic_ids=[i.entity_id for i in sensor_states]
     )
 
+    # Use the running statistics of sensors which have been tracked during the
+    # whole period, the states of other sensors are read from the database
+    running_statistics = _get_running_statistics(hass)
+    periods: dict[str, PeriodStatistics] = {}
+    for _state in sensor_states:
+        entity_id = _state.entity_id
+        if "sum" in wanted_statistics[entity_id]:
+            continue
+        if period := running_statistics.pop_period(
+            entity_id, _state.attributes.get(ATTR_DEVICE_CLASS), start
+        ):
+            periods[entity_id] = period
+
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
@@ -437,7 +750,7 @@ def _compile_statistics(  # noqa: C901
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
+        if "sum" not in wanted_statistics[i.entity_id] and i.entity_id not in periods
     ]
     if entities_significant_history:
         _history_list = history.get_significant_states_with_session(  # type: ignore
@@ -451,23 +764,32 @@ def _compile_statistics(  # noqa: C901
     # If there are no recent state changes, the sensor's state may already be pruned
     # from the recorder. Get the state from the state machine instead.
     for _state in sensor_states:
-        if _state.entity_id not in history_list:
+        if _state.entity_id not in history_list and _state.entity_id not in periods:
             history_list[_state.entity_id] = (_state,)
 
     for _state in sensor_states:  # pylint: disable=too-many-nested-blocks
         entity_id = _state.entity_id
-        if entity_id not in history_list:
-            continue
-
         state_class = _state.attributes[ATTR_STATE_CLASS]
         device_class = _state.attributes.get(ATTR_DEVICE_CLASS)
-        entity_history = history_list[entity_id]
-        unit, fstates = _normalize_states(
-            hass, session, old_metadatas, entity_history, device_class, entity_id
-        )
 
-        if not fstates:
-            continue
+        if (period := periods.get(entity_id)) is not None:
+            if period.min is None:
+                # No valid states
+                continue
+            if len(period.units) > 1:
+                _warn_unstable_unit(hass, old_metadatas, entity_id, period.units)
+                continue
+            unit = next(iter(period.units))
+        else:
+            if entity_id not in history_list:
+                continue
+            entity_history = history_list[entity_id]
+            unit, fstates = _normalize_states(
+                hass, session, old_metadatas, entity_history, device_class, entity_id
+            )
+
+            if not fstates:
+                continue
 
         # Check metadata
         if old_metadata := old_metadatas.get(entity_id):
@@ -500,6 +822,16 @@ def _compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if period is not None:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = period.max  # type: ignore[typeddict-item]
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = period.min  # type: ignore[typeddict-item]
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = period.mean()
+            result.append({"meta": meta, "stat": stat})
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(*itertools.islice(zip(*fstates), 1))  # type: ignore[typeddict-item]
         if "min" in wanted_statistics[entity_id]:
@@ -512,7 +844,9 @@ def _compile_statistics(  # noqa: C901
             last_reset = old_last_reset = None
             new_state = old_state = None
             _sum = 0.0
-            last_stats = statistics.get_last_statistics(hass, 1, entity_id, False)
+            last_stats = statistics.get_last_statistics_with_session(
+                hass, session, 1, entity_id, False
+            )
             if entity_id in last_stats:
                 # We have compiled history for this sensor before, use that as a starting point
                 last_reset = old_last_reset = last_stats[entity_id][0]["last_reset"]
@@ -27,6 +27,7 @@ from homeassistant.helpers.event import (
     async_track_template_result,
 )
 from homeassistant.helpers.json import ExtendedJSONEncoder
+from homeassistant.helpers.polling import async_get_poll_scheduler
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import IntegrationNotFound, async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
@@ -51,8 +52,10 @@ def async_register_commands(
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
+    async_reg(hass, handle_poll_stats)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
@@ -113,6 +116,59 @@ def handle_subscribe_events(
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends a compressed snapshot of the states followed by the changes.
+    """
+    entity_ids = msg.get("entity_ids")
+    check_entity = connection.user.permissions.check_entity
+
+    @callback
+    def forward_entity_changes(event: Event) -> None:
+        """Forward entity state changes to websocket."""
+        if not check_entity(event.data["entity_id"], POLICY_READ):
+            return
+
+        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+
+    if entity_ids:
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED, entity_ids, forward_entity_changes
+        )
+        states = [
+            state for entity_id in entity_ids if (state := hass.states.get(entity_id))
+        ]
+    else:
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, forward_entity_changes
+        )
+        states = hass.states.async_all()
+
+    connection.send_message(messages.result_message(msg["id"]))
+    connection.send_message(
+        messages.event_message(
+            msg["id"],
+            {
+                messages.ENTITY_EVENT_ADD: {
+                    state.entity_id: messages.compressed_state_dict_add(state)
+                    for state in states
+                    if check_entity(state.entity_id, POLICY_READ)
+                }
+            },
+        )
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -238,7 +294,16 @@ def handle_get_states(
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    try:
+        serialized_states = [state.as_dict_json for state in states]
+    except (ValueError, TypeError):
+        # Let the connection report the data that can not be serialized
+        connection.send_message(messages.result_message(msg["id"], states))
+        return
+
+    connection.send_message(
+        messages.construct_result_message(msg["id"], f'[{",".join(serialized_states)}]')
+    )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -305,6 +370,23 @@ async def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "entity_platform/poll_stats"})
+def handle_poll_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle poll stats command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"platform": platform, **stats}
+            for platform, stats in async_get_poll_scheduler(hass)
+            .async_get_stats()
+            .items()
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
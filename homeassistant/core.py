@@ -21,13 +21,13 @@ from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, cast
 from urllib.parse import urlparse
 
-import attr
 import voluptuous as vol
 import yarl
 
 from homeassistant import block_async_io, loader, util
 from homeassistant.const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NOW,
     ATTR_SECONDS,
@@ -60,6 +60,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from homeassistant.helpers.json import json_dumps
 from homeassistant.util import location
 from homeassistant.util.async_ import (
     fire_coroutine_threadsafe,
@@ -69,7 +70,7 @@ from homeassistant.util.async_ import (
 import homeassistant.util.dt as dt_util
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
-import homeassistant.util.uuid as uuid_util
+from homeassistant.util.uuid import random_uuid_hex
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -576,13 +577,47 @@ class HomeAssistant:
             self._stopped.set()
 
 
-@attr.s(slots=True, frozen=True)
+_NEW_CONTEXT_ID: Any = object()
+
+
 class Context:
-    """The context that triggered something."""
+    """The context that triggered something.
+
+    Treat a context as immutable, it is hashed and shared between objects.
+    """
+
+    __slots__ = ("user_id", "parent_id", "id")
+
+    def __init__(
+        self,
+        user_id: str | None = None,
+        parent_id: str | None = None,
+        id: str | None = _NEW_CONTEXT_ID,  # pylint: disable=redefined-builtin
+    ) -> None:
+        """Initialize a context, generating an id unless one is passed."""
+        self.user_id = user_id
+        self.parent_id = parent_id
+        self.id = random_uuid_hex() if id is _NEW_CONTEXT_ID else id
 
-    user_id: str = attr.ib(default=None)
-    parent_id: str | None = attr.ib(default=None)
-    id: str = attr.ib(factory=uuid_util.random_uuid_hex)
+    def __eq__(self, other: Any) -> bool:
+        """Compare contexts."""
+        return bool(
+            self.__class__ == other.__class__
+            and self.id == other.id
+            and self.user_id == other.user_id
+            and self.parent_id == other.parent_id
+        )
+
+    def __hash__(self) -> int:
+        """Make hashable."""
+        return hash((self.user_id, self.parent_id, self.id))
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return (
+            f"Context(user_id={self.user_id!r}, parent_id={self.parent_id!r}, "
+            f"id={self.id!r})"
+        )
 
     def as_dict(self) -> dict[str, str | None]:
         """Return a dictionary representation of the context."""
@@ -663,6 +698,7 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        self._keyed_listeners: dict[str, dict[str, list[HassJob]]] = {}
         self._hass = hass
 
     @callback
@@ -671,7 +707,14 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listener_counts = {
+            key: len(listeners) for key, listeners in self._listeners.items()
+        }
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            listener_counts[event_type] = listener_counts.get(event_type, 0) + sum(
+                len(jobs) for jobs in keyed_listeners.values()
+            )
+        return listener_counts
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -720,6 +763,9 @@ class EventBus:
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
+        if (keyed_listeners := self._keyed_listeners.get(event_type)) is not None:
+            self._async_fire_keyed(event, keyed_listeners)
+
         if not listeners:
             return
 
@@ -733,6 +779,29 @@ class EventBus:
                     continue
             self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_fire_keyed(
+        self, event: Event, keyed_listeners: dict[str, list[HassJob]]
+    ) -> None:
+        """Schedule the keyed listeners matching the entity_id of an event.
+
+        This method must be run in the event loop.
+        """
+        if not isinstance(entity_id := event.data.get(ATTR_ENTITY_ID), str):
+            return
+
+        if (entity_jobs := keyed_listeners.get(entity_id)) is not None:
+            for job in entity_jobs:
+                self._hass.async_add_hass_job(job, event)
+
+        domain, separator, _ = entity_id.partition(".")
+        if not separator or (domain_jobs := keyed_listeners.get(domain)) is None:
+            return
+        for job in domain_jobs:
+            # A listener for both the entity_id and its domain runs once
+            if entity_jobs is None or job not in entity_jobs:
+                self._hass.async_add_hass_job(job, event)
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -773,6 +842,58 @@ class EventBus:
             event_type, (HassJob(listener), event_filter)
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        keys: str | Iterable[str],
+        listener: Callable,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for specific entities.
+
+        Each key is an entity_id or a domain, and matches events that have
+        that entity_id, or an entity_id of that domain, in their data.
+        Firing an event only looks up the listeners of its keys instead of
+        running a filter for every listener.
+
+        This method must be run in the event loop.
+        """
+        if isinstance(keys, str):
+            keys = [keys]
+        else:
+            keys = list(dict.fromkeys(keys))
+
+        job = HassJob(listener)
+        keyed_listeners = self._keyed_listeners.setdefault(event_type, {})
+        for key in keys:
+            keyed_listeners.setdefault(key, []).append(job)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_keyed_listener(event_type, keys, job)
+
+        return remove_listener
+
+    @callback
+    def _async_remove_keyed_listener(
+        self, event_type: str, keys: list[str], job: HassJob
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            for key in keys:
+                keyed_listeners[key].remove(job)
+                if not keyed_listeners[key]:
+                    del keyed_listeners[key]
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown keyed listener %s", job)
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: tuple[HassJob, Callable | None]
@@ -884,9 +1005,11 @@ class State:
         "last_changed",
         "last_updated",
         "context",
-        "domain",
-        "object_id",
+        "_domain",
+        "_object_id",
         "_as_dict",
+        "_as_dict_json",
+        "_attributes_json",
     ]
 
     def __init__(
@@ -920,8 +1043,25 @@ class State:
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
-        self.domain, self.object_id = split_entity_id(self.entity_id)
+        self._domain: str | None = None
+        self._object_id: str | None = None
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._attributes_json: str | None = None
+
+    @property
+    def domain(self) -> str:
+        """Domain of this state."""
+        if self._domain is None:
+            self._domain, self._object_id = split_entity_id(self.entity_id)
+        return self._domain
+
+    @property
+    def object_id(self) -> str:
+        """Object id of this state."""
+        if self._object_id is None:
+            self._domain, self._object_id = split_entity_id(self.entity_id)
+        return self._object_id
 
     @property
     def name(self) -> str:
@@ -954,6 +1094,27 @@ class State:
             }
         return self._as_dict
 
+    @property
+    def as_dict_json(self) -> str:
+        """Return a JSON string of the State.
+
+        Serialized once and shared by everything that sends the state out.
+        Raises TypeError or ValueError if the attributes are not serializable.
+        """
+        if self._as_dict_json is None:
+            self._as_dict_json = json_dumps(self.as_dict())
+        return self._as_dict_json
+
+    @property
+    def attributes_json(self) -> str:
+        """Return a JSON string of the State attributes.
+
+        Raises TypeError or ValueError if the attributes are not serializable.
+        """
+        if self._attributes_json is None:
+            self._attributes_json = json_dumps(dict(self.attributes))
+        return self._attributes_json
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
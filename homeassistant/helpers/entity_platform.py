@@ -15,6 +15,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import (
     ATTR_RESTORED,
+    CONF_HOST,
     DEVICE_DEFAULT_NAME,
     EVENT_HOMEASSISTANT_STARTED,
 )
@@ -44,6 +45,7 @@ from . import (
 from .device_registry import DeviceRegistry
 from .entity_registry import DISABLED_INTEGRATION, EntityRegistry
 from .event import async_call_later, async_track_time_interval
+from .polling import async_get_poll_scheduler
 from .typing import ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -103,6 +105,8 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # If a poll is waiting for the poll scheduler or running
+        self._poll_pending = False
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
@@ -149,6 +153,35 @@ class EntityPlatform:
 
         return self.parallel_updates
 
+    @property
+    def _poll_name(self) -> str:
+        """Return the name of the platform for the poll scheduler.
+
+        The entity component sets up a platform from YAML once per scan
+        interval and entity namespace.
+        """
+        if self.config_entry is not None:
+            return f"{self.domain}.{self.platform_name}.{self.config_entry.entry_id}"
+        name = f"{self.domain}.{self.platform_name}"
+        if self.entity_namespace is not None:
+            name = f"{name}.{self.entity_namespace}"
+        return f"{name}@{self.scan_interval.total_seconds():g}s"
+
+    @property
+    def _poll_budget_key(self) -> str | None:
+        """Return the key of the poll budget the platform shares.
+
+        Platforms set up from a config entry share a budget with the other
+        platforms of that entry, or with all platforms talking to the same
+        host when the entry has one. The polls are only limited once the
+        integration sets a budget for the key.
+        """
+        if self.config_entry is None:
+            return None
+        if (host := self.config_entry.data.get(CONF_HOST)) is not None:
+            return f"host:{host}"
+        return f"config_entry:{self.config_entry.entry_id}"
+
     async def async_setup(
         self,
         platform_config: ConfigType,
@@ -629,6 +662,9 @@ class EntityPlatform:
         if self._async_unsub_polling is not None:
             self._async_unsub_polling()
             self._async_unsub_polling = None
+            async_get_poll_scheduler(self.hass).async_remove(
+                self._poll_name, self._poll_budget_key
+            )
 
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
@@ -646,8 +682,7 @@ class EntityPlatform:
         if self._async_unsub_polling is not None and not any(
             entity.should_poll for entity in self.entities.values()
         ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+            self.async_unsub_polling()
 
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
@@ -701,8 +736,9 @@ class EntityPlatform:
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        The poll scheduler decides when the update starts. To protect from
+        flooding the executor, we will update async entities in parallel and
+        other entities sequential.
 
         This method must be run in the event loop.
         """
@@ -716,7 +752,29 @@ class EntityPlatform:
                 self.scan_interval,
             )
             return
+        if self._poll_pending:
+            self.logger.debug(
+                "Skipping update of %s %s, still waiting for the poll scheduler",
+                self.platform_name,
+                self.domain,
+            )
+            return
+
+        # Wait for the jitter and poll budget without holding the lock
+        self._poll_pending = True
+        try:
+            await async_get_poll_scheduler(self.hass).async_poll(
+                self._poll_name,
+                self.scan_interval,
+                self._async_poll_entities,
+                self._poll_budget_key,
+            )
+        finally:
+            self._poll_pending = False
 
+    async def _async_poll_entities(self) -> None:
+        """Update the states of the polling entities."""
+        assert self._process_updates is not None
         async with self._process_updates:
             tasks = []
             for entity in self.entities.values():
@@ -1,8 +1,18 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
+from __future__ import annotations
+
 import datetime
+from functools import partial
 import json
 from typing import Any
 
+from homeassistant.util.json import replace_non_finite_floats
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 class JSONEncoder(json.JSONEncoder):
     """JSONEncoder that supports Home Assistant objects."""
@@ -40,3 +50,63 @@ class ExtendedJSONEncoder(JSONEncoder):
             return super().default(o)
         except TypeError:
             return {"__type": str(type(o)), "repr": repr(o)}
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects for orjson.
+
+    orjson handles datetime natively and calls this for other objects.
+    """
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError
+
+
+_stdlib_json_dumps_strict = partial(
+    json.dumps, cls=JSONEncoder, allow_nan=False, separators=(",", ":")
+)
+
+
+def _stdlib_json_dumps(data: Any) -> str:
+    """Dump json with JSONEncoder to a string.
+
+    NaN and infinite floats are written as null, like orjson does.
+    """
+    try:
+        return _stdlib_json_dumps_strict(data)
+    except ValueError:
+        return _stdlib_json_dumps_strict(replace_non_finite_floats(data))
+
+
+def _stdlib_json_bytes(data: Any) -> bytes:
+    """Dump json with JSONEncoder to bytes."""
+    return _stdlib_json_dumps(data).encode("utf-8")
+
+
+def _orjson_bytes(data: Any) -> bytes:
+    """Dump json with orjson to bytes.
+
+    Data orjson does not support, like integers larger than 64 bits,
+    is handed to JSONEncoder.
+    """
+    try:
+        return orjson.dumps(  # type: ignore[no-any-return]
+            data, option=orjson.OPT_NON_STR_KEYS, default=json_encoder_default
+        )
+    except TypeError:
+        return _stdlib_json_bytes(data)
+
+
+def _orjson_dumps(data: Any) -> str:
+    """Dump json with orjson to a string."""
+    return _orjson_bytes(data).decode("utf-8")
+
+
+if orjson is None:  # pragma: no cover
+    json_bytes = _stdlib_json_bytes
+    json_dumps = _stdlib_json_dumps
+else:
+    json_bytes = _orjson_bytes
+    json_dumps = _orjson_dumps
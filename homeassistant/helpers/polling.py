@@ -0,0 +1,164 @@
+"""Helper to schedule the polling of entity platforms."""
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+import logging
+from random import uniform
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .singleton import singleton
+
+DATA_POLL_SCHEDULER = "poll_scheduler"
+
+# Polls start at a fixed offset of up to this part of the interval
+POLL_JITTER_FRACTION = 0.2
+MAX_POLL_JITTER = 10  # seconds
+
+# How many intervals to wait at most between polls that are too slow
+MAX_POLL_BACKOFF = 8
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollStats:
+    """Poll latency histogram and backoff of a platform."""
+
+    def __init__(self, jitter: float) -> None:
+        """Initialize the stats."""
+        self.jitter = jitter
+        self.backoff = 1
+        self.skip = 0
+        self.count = 0
+        self.sum = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, duration: float) -> None:
+        """Add the duration of a poll."""
+        self.count += 1
+        self.sum += duration
+        self.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as a dictionary with cumulative buckets.
+
+        Buckets are keyed by their upper bound in seconds, like Prometheus.
+        """
+        buckets = {}
+        total = 0
+        for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), self.buckets):
+            total += count
+            buckets[str(bound)] = total
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": buckets,
+            "backoff": self.backoff,
+        }
+
+
+class PollScheduler:
+    """Spread, limit and slow down the polls of entity platforms.
+
+    Every platform polls at a fixed random offset in its interval, so
+    platforms with the same interval do not all poll at the same moment.
+    Integrations can limit how many platforms sharing a budget key poll at
+    a time, platforms without a budget are not limited. A platform that
+    takes longer to poll than its interval skips intervals, twice as many
+    every time it stays slow.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_jitter: float = MAX_POLL_JITTER):
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.max_jitter = max_jitter
+        self._stats: dict[str, PollStats] = {}
+        self._budgets: dict[str, asyncio.Semaphore] = {}
+        self._budget_users: dict[str, set[str]] = {}
+
+    @callback
+    def async_set_budget(self, budget_key: str, limit: int) -> None:
+        """Set how many platforms of a budget key may poll at the same time."""
+        self._budgets[budget_key] = asyncio.Semaphore(limit)
+
+    @callback
+    def async_get_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the poll stats per platform."""
+        return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+    @callback
+    def async_remove(self, name: str, budget_key: str | None = None) -> None:
+        """Forget a platform that stopped polling.
+
+        The budget is removed with the last platform polling with it.
+        """
+        self._stats.pop(name, None)
+        if budget_key is None or (users := self._budget_users.get(budget_key)) is None:
+            return
+        users.discard(name)
+        if not users:
+            del self._budget_users[budget_key]
+            self._budgets.pop(budget_key, None)
+
+    async def async_poll(
+        self,
+        name: str,
+        interval: timedelta,
+        poll: Callable[[], Awaitable[None]],
+        budget_key: str | None = None,
+    ) -> None:
+        """Poll a platform on one of its scheduled intervals."""
+        seconds = interval.total_seconds()
+        if (stats := self._stats.get(name)) is None:
+            jitter = uniform(0, min(seconds * POLL_JITTER_FRACTION, self.max_jitter))
+            stats = self._stats[name] = PollStats(jitter)
+            if budget_key is not None:
+                self._budget_users.setdefault(budget_key, set()).add(name)
+
+        if stats.skip:
+            stats.skip -= 1
+            return
+
+        if stats.jitter:
+            await asyncio.sleep(stats.jitter)
+
+        if budget_key is None or (budget := self._budgets.get(budget_key)) is None:
+            duration = await _async_timed(poll)
+        else:
+            async with budget:
+                duration = await _async_timed(poll)
+
+        stats.add(duration)
+        if duration > seconds:
+            if stats.backoff < MAX_POLL_BACKOFF:
+                stats.backoff *= 2
+                _LOGGER.debug(
+                    "Polling %s took %.3f seconds, polling every %s intervals",
+                    name,
+                    duration,
+                    stats.backoff,
+                )
+        elif stats.backoff > 1:
+            stats.backoff //= 2
+        stats.skip = stats.backoff - 1
+
+
+async def _async_timed(poll: Callable[[], Awaitable[None]]) -> float:
+    """Return how long a poll took."""
+    start = time.monotonic()
+    await poll()
+    return time.monotonic() - start
+
+
+@callback
+@singleton(DATA_POLL_SCHEDULER)
+def async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the poll scheduler."""
+    return PollScheduler(hass)
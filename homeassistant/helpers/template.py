@@ -18,9 +18,10 @@ import random
 import re
 import statistics
 import sys
+import threading
+from types import CodeType
 from typing import Any, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import pass_context
@@ -54,6 +55,7 @@ from homeassistant.helpers.typing import TemplateVarsType
 from homeassistant.loader import bind_hass
 from homeassistant.util import convert, dt as dt_util, location as loc_util
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.lru import LRU
 from homeassistant.util.thread import ThreadWithException
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -67,6 +69,14 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+
+# Compiled code shared by all templates, keyed by environment kind and source
+_COMPILED_TEMPLATE_CACHE: LRU[tuple[str, str], CodeType] = LRU(
+    COMPILED_TEMPLATE_CACHE_SIZE
+)
+_COMPILED_TEMPLATE_CACHE_LOCK = threading.Lock()
+
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -760,6 +770,18 @@ class TemplateState(State):
         self._collect_state()
         return self._state.attributes
 
+    @property
+    def attributes_json(self):
+        """Wrap State.attributes_json."""
+        self._collect_state()
+        return self._state.attributes_json
+
+    @property
+    def as_dict_json(self):
+        """Wrap State.as_dict_json."""
+        self._collect_state()
+        return self._state.as_dict_json
+
     @property
     def last_changed(self):
         """Wrap State.last_changed."""
@@ -1750,7 +1772,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        if limited:
+            self.template_cache_kind = "limited"
+        elif strict:
+            self.template_cache_kind = "strict"
+        else:
+            self.template_cache_kind = "normal"
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1929,10 +1956,27 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        key = (self.template_cache_kind, source)
+        with _COMPILED_TEMPLATE_CACHE_LOCK:
+            cached = _COMPILED_TEMPLATE_CACHE.get(key)
+
+        if cached is None:
+            cached = super().compile(source)
+            with _COMPILED_TEMPLATE_CACHE_LOCK:
+                _COMPILED_TEMPLATE_CACHE[key] = cached
 
         return cached
 
 
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
+
+
+def compiled_template_cache_info() -> dict[str, int]:
+    """Return the statistics of the compiled template cache."""
+    with _COMPILED_TEMPLATE_CACHE_LOCK:
+        return {
+            "hits": _COMPILED_TEMPLATE_CACHE.hits,
+            "misses": _COMPILED_TEMPLATE_CACHE.misses,
+            "size": len(_COMPILED_TEMPLATE_CACHE),
+            "maxsize": _COMPILED_TEMPLATE_CACHE.maxsize,
+        }
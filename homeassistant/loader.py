@@ -13,6 +13,7 @@ import importlib
 import json
 import logging
 import pathlib
+from stat import S_ISREG
 import sys
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
@@ -45,6 +46,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -58,6 +60,10 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 30
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -100,6 +106,117 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class ManifestIndex:
+    """Persistent index of the manifests of integrations.
+
+    Each manifest is stored with the modification time and size of its file.
+    As long as those don't change, the manifest is served from the index
+    instead of reading and parsing the file again.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._manifests: dict[str, dict[str, Any]] = {}
+        self._store: Any = None
+        self._save_when_started = False
+
+    async def async_load(self) -> None:
+        """Load the index from storage."""
+        if self.hass.config.config_dir is None:
+            return
+
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.helpers.storage import Store
+
+        self._store = Store(
+            self.hass, MANIFEST_INDEX_STORAGE_VERSION, MANIFEST_INDEX_STORAGE_KEY
+        )
+        if (data := await self._store.async_load()) is not None:
+            self._manifests = cast(Dict[str, Dict[str, Any]], data["manifests"])
+
+    def read_manifest(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the manifest in a file or None if the file does not exist.
+
+        Raises ValueError if the manifest is not valid JSON.
+        This method must be run in the executor.
+        """
+        key = str(manifest_path)
+        try:
+            stat = manifest_path.stat()
+        except OSError:
+            stat = None
+
+        if stat is None or not S_ISREG(stat.st_mode):
+            if self._manifests.pop(key, None) is not None:
+                self._schedule_save()
+            return None
+
+        entry = self._manifests.get(key)
+        if (
+            entry is not None
+            and entry["mtime"] == stat.st_mtime
+            and entry["size"] == stat.st_size
+        ):
+            return cast(Manifest, dict(entry["manifest"]))
+
+        manifest = json.loads(manifest_path.read_text())
+        self._manifests[key] = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "manifest": manifest,
+        }
+        self._schedule_save()
+        return cast(Manifest, dict(manifest))
+
+    def _schedule_save(self) -> None:
+        """Schedule saving the index from any thread."""
+        if self._store is not None:
+            self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    def _async_schedule_save(self, *_: Any) -> None:
+        """Schedule saving the index once Home Assistant is running.
+
+        Tools like check_config load integrations without starting Home
+        Assistant and should not write to the configuration directory.
+        """
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+        from homeassistant.core import CoreState
+
+        if self.hass.state is CoreState.running:
+            self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+        elif not self._save_when_started:
+            self._save_when_started = True
+            self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STARTED, self._async_schedule_save
+            )
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the index to store."""
+        return {"manifests": dict(self._manifests)}
+
+
+async def async_get_manifest_index(hass: HomeAssistant) -> ManifestIndex:
+    """Return the loaded manifest index."""
+    if (index_or_evt := hass.data.get(DATA_MANIFEST_INDEX)) is None:
+        evt = hass.data[DATA_MANIFEST_INDEX] = asyncio.Event()
+
+        index = ManifestIndex(hass)
+        try:
+            await index.async_load()
+        finally:
+            hass.data[DATA_MANIFEST_INDEX] = index
+            evt.set()
+        return index
+
+    if isinstance(index_or_evt, asyncio.Event):
+        await index_or_evt.wait()
+        return cast(ManifestIndex, hass.data[DATA_MANIFEST_INDEX])
+
+    return cast(ManifestIndex, index_or_evt)
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -124,6 +241,7 @@ async def _async_get_custom_components(
     dirs = await hass.async_add_executor_job(
         get_sub_directories, custom_components.__path__
     )
+    await async_get_manifest_index(hass)
 
     integrations = await gather_with_concurrency(
         MAX_LOAD_CONCURRENTLY,
@@ -295,20 +413,26 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        index = hass.data.get(DATA_MANIFEST_INDEX)
         for base in root_module.__path__:  # type: ignore
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = json.loads(manifest_path.read_text())
+                if isinstance(index, ManifestIndex):
+                    manifest = index.read_manifest(manifest_path)
+                elif manifest_path.is_file():
+                    manifest = json.loads(manifest_path.read_text())
+                else:
+                    manifest = None
             except ValueError as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
                 )
                 continue
 
+            if manifest is None:
+                continue
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
@@ -522,6 +646,19 @@ class Integration:
             cache[self.domain] = importlib.import_module(self.pkg_path)
         return cache[self.domain]  # type: ignore
 
+    async def async_get_component(self) -> ModuleType:
+        """Return the component, importing it in the executor if needed.
+
+        Importing a module that is not loaded yet runs the code of the
+        module and its requirements, which must not block the event loop.
+        """
+        if (
+            self.domain in self.hass.data.get(DATA_COMPONENTS, {})
+            or self.pkg_path in sys.modules
+        ):
+            return self.get_component()
+        return await self.hass.async_add_executor_job(self.get_component)
+
     def get_platform(self, platform_name: str) -> ModuleType:
         """Return a platform for an integration."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
@@ -530,6 +667,16 @@ class Integration:
             cache[full_name] = self._import_platform(platform_name)
         return cache[full_name]  # type: ignore
 
+    async def async_get_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform for an integration, importing it in the executor if needed."""
+        full_name = f"{self.domain}.{platform_name}"
+        if (
+            full_name in self.hass.data.get(DATA_COMPONENTS, {})
+            or f"{self.pkg_path}.{platform_name}" in sys.modules
+        ):
+            return self.get_platform(platform_name)
+        return await self.hass.async_add_executor_job(self.get_platform, platform_name)
+
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
@@ -586,6 +733,7 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
+    await async_get_manifest_index(hass)
     if integration := await hass.async_add_executor_job(
         Integration.resolve_from_root, hass, components, domain
     ):
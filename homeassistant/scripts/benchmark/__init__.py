@@ -9,10 +9,12 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
+import tracemalloc
 from typing import TypeVar
 
-from homeassistant import core
+from homeassistant import config_entries, core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
@@ -253,6 +255,64 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_keyed_listeners(hass):
+    """Fire 10k state changed events to 5000 keyed entity listeners."""
+    return await _state_changed_listeners(hass, keyed=True)
+
+
+@benchmark
+async def state_changed_filtered_listeners(hass):
+    """Fire 10k state changed events to 5000 filtered entity listeners."""
+    return await _state_changed_listeners(hass, keyed=False)
+
+
+async def _state_changed_listeners(hass, keyed):
+    """Fire state changed events to a listener per entity."""
+    count = 0
+    entities = 5000
+    events_to_fire = 10 ** 4
+
+    @core.callback
+    def listener(event):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(entities):
+        entity_id = f"light.kitchen_{idx}"
+        if keyed:
+            hass.bus.async_listen_keyed(EVENT_STATE_CHANGED, entity_id, listener)
+            continue
+
+        @core.callback
+        def event_filter(event, entity_id=entity_id):
+            """Filter state changes of one entity."""
+            return event.data["entity_id"] == entity_id
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener, event_filter)
+
+    event_data = [
+        {
+            "entity_id": f"light.kitchen_{idx}",
+            "old_state": core.State(f"light.kitchen_{idx}", "off"),
+            "new_state": core.State(f"light.kitchen_{idx}", "on"),
+        }
+        for idx in range(entities)
+    ]
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data[idx % entities])
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def logbook_filtering_state(hass):
     """Filter state changes."""
@@ -369,6 +429,36 @@ async def filtering_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def state_machine_async_set(hass):
+    """Set 100 states of 3000 entities and report the memory they hold."""
+    entities = 3000
+    attributes = {
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "friendly_name": "Power",
+    }
+
+    start = timer()
+    for iteration in range(100):
+        for i in range(entities):
+            hass.states.async_set(f"sensor.power_{i}", iteration, attributes)
+    runtime = timer() - start
+
+    # Replace every state once more while tracing the allocations
+    tracemalloc.start()
+    for i in range(entities):
+        hass.states.async_set(f"sensor.power_{i}", "traced", attributes)
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"Memory held by {entities} states: {held / 1024:.0f} KiB"
+        f" (peak {peak / 1024:.0f} KiB)"
+    )
+    return runtime
+
+
 @benchmark
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
@@ -391,6 +481,199 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_states_stdlib(hass):
+    """Serialize million states with the standard library encoder."""
+    states = [
+        core.State("light.kitchen", "on", {"friendly_name": "Kitchen Lights"})
+        for _ in range(10 ** 6)
+    ]
+
+    start = timer()
+    json.dumps(states, cls=JSONEncoder, allow_nan=False)
+    return timer() - start
+
+
+def _sensor_state_changed_events(count):
+    """Create state changed events of a sensor with typical attributes."""
+    attributes = {
+        "unit_of_measurement": "°C",
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "friendly_name": "Living Room Temperature",
+    }
+    old_state = core.State("sensor.living_room", "21.4", attributes)
+    events = []
+    for i in range(count):
+        new_state = core.State("sensor.living_room", str(20 + i % 50 / 10), attributes)
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": "sensor.living_room",
+                    "old_state": old_state,
+                    "new_state": new_state,
+                },
+            )
+        )
+        old_state = new_state
+    return events
+
+
+@benchmark
+async def json_serialize_events(hass):
+    """Serialize 100k state changed events with websocket default encoder."""
+    events = _sensor_state_changed_events(10 ** 5)
+
+    start = timer()
+    for event in events:
+        JSON_DUMP(event)
+    return timer() - start
+
+
+@benchmark
+async def json_serialize_events_stdlib(hass):
+    """Serialize 100k state changed events with the standard library encoder."""
+    events = _sensor_state_changed_events(10 ** 5)
+
+    start = timer()
+    for event in events:
+        json.dumps(event, cls=JSONEncoder, allow_nan=False)
+    return timer() - start
+
+
+class _AdminPermissions:
+    """Permissions of an admin user."""
+
+    @staticmethod
+    def access_all_entities(key):
+        """Allow access to all entities."""
+        return True
+
+
+class _WebsocketClient:
+    """Websocket connection of an admin user that collects sent messages."""
+
+    def __init__(self):
+        """Initialize the client."""
+        self.user = collections.namedtuple("User", "permissions")(_AdminPermissions)
+        self.messages = []
+
+    def send_message(self, message):
+        """Collect a message and serialize it like the connection does."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.components.websocket_api.messages import message_to_json
+
+        if not isinstance(message, str):
+            message = message_to_json(message)
+        self.messages.append(message)
+
+
+@benchmark
+async def websocket_get_states(hass):
+    """Send 5000 states to 10 websocket clients, 10 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.websocket_api.commands import handle_get_states
+
+    entities = 5000
+    clients = [_WebsocketClient() for _ in range(10)]
+    attributes = {
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+        "friendly_name": "Power",
+    }
+    runtime = 0
+
+    for iteration in range(10):
+        for i in range(entities):
+            hass.states.async_set(f"sensor.power_{i}", iteration + i, attributes)
+
+        start = timer()
+        for msg_id, client in enumerate(clients):
+            handle_get_states(hass, client, {"id": msg_id, "type": "get_states"})
+        runtime += timer() - start
+
+    return runtime
+
+
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Match 100k distinct topics against 10k MQTT subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt.trie import TopicTrie
+
+    devices = 10000
+    trie = TopicTrie()
+    for idx in range(devices):
+        if idx % 10 == 0:
+            topic_filter = f"zigbee2mqtt/device_{idx}/#"
+        elif idx % 10 == 1:
+            topic_filter = f"zigbee2mqtt/device_{idx}/+/state"
+        else:
+            topic_filter = f"zigbee2mqtt/device_{idx}/sensor_0/state"
+        trie.add(topic_filter, idx)
+
+    topics = [
+        f"zigbee2mqtt/device_{idx % devices}/sensor_{idx // devices}/state"
+        for idx in range(100000)
+    ]
+
+    start = timer()
+    matches = sum(len(trie.match(topic)) for topic in topics)
+    runtime = timer() - start
+
+    assert matches == 28000
+    return runtime
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Record 50000 state changes of 500 entities in an in-memory database."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import recorder
+    from homeassistant.setup import async_setup_component
+
+    entities = 500
+    state_changes = 50000
+    # Simulate a commit interval with this many events each
+    events_per_commit = 1000
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        await async_setup_component(
+            hass,
+            recorder.DOMAIN,
+            {recorder.DOMAIN: {recorder.CONF_DB_URL: "sqlite://"}},
+        )
+        await hass.async_start()
+        instance = hass.data[recorder.DATA_INSTANCE]
+        await instance.async_recorder_ready.wait()
+
+        start = timer()
+
+        for idx in range(state_changes):
+            hass.states.async_set(
+                f"sensor.benchmark_{idx % entities}",
+                idx,
+                {"unit_of_measurement": "W", "friendly_name": "Benchmark"},
+            )
+            if idx % events_per_commit == 0:
+                hass.bus.async_fire(EVENT_TIME_CHANGED)
+        hass.bus.async_fire(EVENT_TIME_CHANGED)
+        await hass.async_block_till_done()
+        await hass.async_add_executor_job(instance.block_till_done)
+
+        runtime = timer() - start
+        await hass.async_stop()
+
+    # Each state change writes an events row and a states row
+    print(f"Recorded {int(state_changes * 2 / runtime)} rows/s")
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -421,6 +704,7 @@ def _create_state_changed_event_from_old_new(
     row.event_type = EVENT_STATE_CHANGED
     row.event_data = "{}"
     row.attributes = attributes_json
+    row.shared_attrs = attributes_json
     row.time_fired = event_time_fired
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
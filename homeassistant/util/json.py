@@ -5,15 +5,23 @@ from collections import deque
 from collections.abc import Callable
 import json
 import logging
+import math
 import os
+import re
 import tempfile
 from typing import Any
 
-from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
+_LEADING_SPACES = re.compile(r"^ +", re.MULTILINE)
+
 
 class SerializationError(HomeAssistantError):
     """Error serializing the data to JSON."""
@@ -52,10 +60,13 @@ def save_json(
 ) -> None:
     """Save JSON data to a file.
 
+    Data without a custom encoder is serialized with orjson when available,
+    accepting the same types as the standard library.
+
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        json_data = _dump_json(data, encoder)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
@@ -94,6 +105,57 @@ def format_unserializable_data(data: dict[str, Any]) -> str:
     return ", ".join(f"{path}={value}({type(value)}" for path, value in data.items())
 
 
+def replace_non_finite_floats(data: Any) -> Any:
+    """Return a copy of data with NaN and infinite floats replaced by None.
+
+    This matches how orjson serializes them.
+    """
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: replace_non_finite_floats(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple, set)):
+        return [replace_non_finite_floats(value) for value in data]
+    if hasattr(data, "as_dict"):
+        return replace_non_finite_floats(data.as_dict())
+    return data
+
+
+def _double_indent(match: re.Match[str]) -> str:
+    """Double the indentation of a line."""
+    return match.group(0) * 2
+
+
+def _dump_json(data: list | dict, encoder: type[json.JSONEncoder] | None) -> str:
+    """Serialize data to a JSON string indented with 4 spaces."""
+    if encoder is None and orjson is not None:
+        try:
+            # Pass datetimes and dataclasses on to the standard library,
+            # which rejects them
+            json_data = orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            ).decode("utf-8")
+        except TypeError:
+            # Let the standard library decide, it also handles integers
+            # larger than 64 bits
+            pass
+        else:
+            # orjson only indents with 2 spaces. Strings never span lines,
+            # so all leading spaces are indentation.
+            return _LEADING_SPACES.sub(_double_indent, json_data)
+    if encoder is None:
+        # Match the orjson output, NaN is written as null
+        try:
+            return json.dumps(data, indent=4, allow_nan=False)
+        except ValueError:
+            return json.dumps(replace_non_finite_floats(data), indent=4)
+    return json.dumps(data, indent=4, cls=encoder)
+
+
 def find_paths_unserializable_data(
     bad_data: Any, *, dump: Callable[[Any], str] = json.dumps
 ) -> dict[str, Any]:
@@ -101,6 +163,12 @@ def find_paths_unserializable_data(
 
     This method is slow! Only use for error handling.
     """
+    # helpers.json imports this module and is imported by core
+    from homeassistant.core import (  # pylint: disable=import-outside-toplevel
+        Event,
+        State,
+    )
+
     to_process = deque([(bad_data, "$")])
     invalid = {}
 
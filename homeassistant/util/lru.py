@@ -0,0 +1,97 @@
+"""Size bounded least recently used mapping."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Generic, TypeVar, overload
+
+_KT = TypeVar("_KT")
+_VT = TypeVar("_VT")
+_T = TypeVar("_T")
+
+
+class LRU(Generic[_KT, _VT]):
+    """A mapping that evicts the least recently used key when full.
+
+    Reads via get() and item access mark the key as recently used.
+    Not thread safe; callers must own the instance.
+    """
+
+    __slots__ = ("_data", "_maxsize", "hits", "misses")
+
+    def __init__(self, maxsize: int) -> None:
+        """Init the LRU."""
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._data: OrderedDict[_KT, _VT] = OrderedDict()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Return the maximum number of items."""
+        return self._maxsize
+
+    @overload
+    def get(self, key: _KT) -> _VT | None:
+        ...
+
+    @overload
+    def get(self, key: _KT, default: _T) -> _VT | _T:
+        ...
+
+    def get(self, key: _KT, default: _T | None = None) -> _VT | _T | None:
+        """Return the value for key and mark it as recently used."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def __getitem__(self, key: _KT) -> _VT:
+        """Return the value for key and mark it as recently used."""
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        """Set the value for key, evicting the oldest key when full."""
+        data = self._data
+        if key in data:
+            data.move_to_end(key)
+        data[key] = value
+        if len(data) > self._maxsize:
+            data.popitem(last=False)
+
+    def __delitem__(self, key: _KT) -> None:
+        """Remove key."""
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Return if key is present without marking it as used."""
+        return key in self._data
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._data)
+
+    def pop(self, key: _KT, default: _T | None = None) -> _VT | _T | None:
+        """Remove key and return its value."""
+        return self._data.pop(key, default)
+
+    def keys(self) -> list[_KT]:
+        """Return the keys from least to most recently used."""
+        return list(self._data)
+
+    def items(self) -> list[tuple[_KT, _VT]]:
+        """Return the items from least to most recently used."""
+        return list(self._data.items())
+
+    def clear(self) -> None:
+        """Remove all items and reset the statistics."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
@@ -51,6 +51,7 @@ from homeassistant.helpers import (
     entity_platform,
     entity_registry,
     intent,
+    polling,
     restore_state,
     storage,
 )
@@ -273,6 +274,10 @@ async def async_test_home_assistant(loop, load_registries=True):
     )
 
     hass.data[loader.DATA_CUSTOM_COMPONENTS] = {}
+    # Keep an in-memory manifest index that is never written to the config dir
+    hass.data[loader.DATA_MANIFEST_INDEX] = loader.ManifestIndex(hass)
+    # Poll on the exact scheduled time
+    hass.data[polling.DATA_POLL_SCHEDULER] = polling.PollScheduler(hass, max_jitter=0)
 
     hass.config.location_name = "test home"
     hass.config.config_dir = get_test_config_dir()
@@ -34,6 +34,13 @@ async def test_api_list_state_entities(hass, mock_api_client):
     assert remote_data == hass.states.async_all()
 
 
+async def test_api_list_state_entities_unserializable(hass, mock_api_client):
+    """Test listing states with a state that can not be serialized."""
+    hass.states.async_set("test.entity", "hello", {"bad": object()})
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.INTERNAL_SERVER_ERROR
+
+
 async def test_api_get_state(hass, mock_api_client):
     """Test if the debug interface allows us to get a state."""
     hass.states.async_set("hello.world", "nice", {"attr": 1})
@@ -185,6 +185,128 @@ async def test_get_image_from_camera_not_jpeg(hass, image_mock_url):
     assert image.content == b"png"
 
 
+async def test_get_image_shares_fetches(hass, image_mock_url, hass_ws_client):
+    """Test concurrent requests for a snapshot share one fetch."""
+    fetched = asyncio.Event()
+    calls = 0
+
+    async def _async_camera_image(self, width=None, height=None):
+        nonlocal calls
+        calls += 1
+        await fetched.wait()
+        return b"Image"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        new=_async_camera_image,
+    ):
+        requests = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*requests)
+
+        assert calls == 1
+        assert [image.content for image in images] == [b"Image"] * 3
+
+        # Outside of the camera proxy the next request fetches again
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert calls == 2
+
+    client = await hass_ws_client(hass)
+    await client.send_json(
+        {"id": 5, "type": "camera/image_cache", "entity_id": "camera.demo_camera"}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"snapshot_hit_rate": 50.0, "scaled_image_hit_rate": None}
+
+    await client.send_json(
+        {"id": 6, "type": "camera/image_cache", "entity_id": "camera.missing"}
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
+
+
+async def test_camera_proxy_snapshot_cache_ttl(
+    hass, image_mock_url, hass_client, hass_ws_client
+):
+    """Test the camera proxy and thumbnails reuse snapshots for the cache ttl."""
+    ws_client = await hass_ws_client(hass)
+    client = await hass_client()
+    with patch(
+        "homeassistant.components.camera.Camera.snapshot_cache_ttl",
+        new_callable=PropertyMock(return_value=10),
+    ), patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Test",
+    ) as mock_camera:
+        await client.get("/api/camera_proxy/camera.demo_camera")
+        response = await client.get("/api/camera_proxy/camera.demo_camera")
+        assert await response.read() == b"Test"
+        assert mock_camera.call_count == 1
+
+        await ws_client.send_json(
+            {"id": 5, "type": "camera_thumbnail", "entity_id": "camera.demo_camera"}
+        )
+        msg = await ws_client.receive_json()
+        assert msg["success"]
+        assert mock_camera.call_count == 1
+
+        # Another size is another snapshot
+        await client.get("/api/camera_proxy/camera.demo_camera?width=4&height=3")
+        assert mock_camera.call_count == 2
+
+        # Other users of the image always get a new snapshot
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera.call_count == 3
+
+        with patch(
+            "homeassistant.components.camera.time.monotonic",
+            return_value=camera.time.monotonic() + 10,
+        ):
+            await client.get("/api/camera_proxy/camera.demo_camera")
+        assert mock_camera.call_count == 4
+
+
+async def test_get_image_scaled_cache(hass, image_mock_url, hass_ws_client):
+    """Test scaled images are reused while the snapshot does not change."""
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=16, second_height=12
+    )
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+        return_value=turbo_jpeg,
+    ), patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Valid jpeg",
+    ) as mock_camera:
+        for _ in range(2):
+            image = await camera.async_get_image(
+                hass, "camera.demo_camera", width=4, height=3
+            )
+            assert image.content == EMPTY_8_6_JPEG
+
+        assert mock_camera.call_count == 2
+        assert turbo_jpeg.scale_with_quality.call_count == 1
+
+        mock_camera.return_value = b"Other jpeg"
+        await camera.async_get_image(hass, "camera.demo_camera", width=4, height=3)
+        assert turbo_jpeg.scale_with_quality.call_count == 2
+
+    client = await hass_ws_client(hass)
+    await client.send_json(
+        {"id": 5, "type": "camera/image_cache", "entity_id": "camera.demo_camera"}
+    )
+    msg = await client.receive_json()
+    assert msg["result"]["scaled_image_hit_rate"] == 33.3
+
+
 async def test_get_stream_source_from_camera(hass, mock_camera):
     """Fetch stream source from camera entity."""
 
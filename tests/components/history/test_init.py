@@ -831,6 +831,158 @@ async def test_entity_ids_limit_via_api_with_skip_initial_state(hass, hass_clien
     assert response_json[1][0]["entity_id"] == "light.cow"
 
 
+@pytest.mark.parametrize("query", ["", "&minimal_response", "&skip_initial_state"])
+async def test_fetch_period_api_stream(hass, hass_client, query):
+    """Test streaming the history returns the same states."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow() - timedelta(minutes=1)
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.cow", "on", {"brightness": 10})
+    hass.states.async_set("sensor.power", "10")
+    hass.states.async_set("sensor.power", "12")
+
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(f"/api/history/period/{start.isoformat()}?{query}")
+    assert response.status == HTTPStatus.OK
+    expected = await response.json()
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?stream{query}"
+    )
+    assert response.status == HTTPStatus.OK
+    assert response.content_type == "application/json"
+    streamed = await response.json()
+
+    assert len(streamed) == 3
+    assert sorted(streamed, key=lambda states: states[0]["entity_id"]) == sorted(
+        expected, key=lambda states: states[0]["entity_id"]
+    )
+
+
+async def test_fetch_period_api_stream_without_states(hass, hass_client):
+    """Test streaming the history of entities without states."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{dt_util.utcnow().isoformat()}?stream&filter_entity_id=light.kitchen"
+    )
+    assert response.status == HTTPStatus.OK
+    assert await response.json() == []
+
+
+async def _async_record_power_states(hass):
+    """Record 100 power states, one every second, with a spike.
+
+    Returns a time just before the first state.
+    """
+    start = dt_util.utcnow() - timedelta(minutes=5)
+    for i in range(100):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=start + timedelta(seconds=i),
+        ):
+            hass.states.async_set("sensor.power", 500 if i == 50 else i % 5)
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    return start - timedelta(seconds=1)
+
+
+@pytest.mark.parametrize("stream", ["", "&stream"])
+async def test_fetch_period_api_with_max_points(hass, hass_client, stream):
+    """Test the fetch period view downsamples numeric states."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = await _async_record_power_states(hass)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?minimal_response&max_points=10{stream}"
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert len(response_json) == 1
+    states = [state["state"] for state in response_json[0]]
+    assert len(states) <= 11
+    assert "500" in states
+
+
+@pytest.mark.parametrize("max_points", ["0", "-1", "cats"])
+async def test_fetch_period_api_with_invalid_max_points(hass, hass_client, max_points):
+    """Test the fetch period view rejects an invalid max_points."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{dt_util.utcnow().isoformat()}?max_points={max_points}"
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
+async def test_history_during_period(hass, hass_ws_client):
+    """Test history_during_period."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = await _async_record_power_states(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]["sensor.power"]) == 100
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "max_points": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    states = [state["state"] for state in response["result"]["sensor.power"]]
+    assert len(states) <= 11
+    assert "500" in states
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": "cats",
+            "entity_ids": ["sensor.power"],
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 POWER_SENSOR_ATTRIBUTES = {
     "device_class": "power",
     "state_class": "measurement",
@@ -0,0 +1,164 @@
+"""The tests for static file handling of the HTTP component."""
+from http import HTTPStatus
+from unittest.mock import patch
+
+from aiohttp import web
+import pytest
+
+from homeassistant.components.http import static
+from homeassistant.components.http.static import CachingStaticResource
+
+
+@pytest.fixture(name="static_client")
+async def static_client_fixture(tmp_path, aiohttp_client):
+    """Return a client for a static resource with pre-compressed files."""
+    tmp_path.joinpath("app.js").write_bytes(b"plain")
+    tmp_path.joinpath("app.js.gz").write_bytes(b"gzipped")
+    tmp_path.joinpath("app.js.br").write_bytes(b"brotli")
+    tmp_path.joinpath("other.js").write_bytes(b"other")
+    tmp_path.joinpath("sub").mkdir()
+    tmp_path.joinpath("sub", "nested.js").write_bytes(b"nested")
+
+    app = web.Application()
+    resource = CachingStaticResource("/static", str(tmp_path))
+    app.router.register_resource(resource)
+    # The variants are not really compressed
+    client = await aiohttp_client(app, auto_decompress=False)
+    client.resource = resource
+    return client
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,content_encoding,body",
+    [
+        ("gzip, deflate, br", "br", b"brotli"),
+        ("gzip", "gzip", b"gzipped"),
+        ("br;q=0, gzip;q=0.5", "gzip", b"gzipped"),
+        ("identity", None, b"plain"),
+    ],
+)
+@pytest.mark.parametrize("hot", [True, False])
+async def test_serve_precompressed(
+    static_client, accept_encoding, content_encoding, body, hot
+):
+    """Test the pre-compressed variant accepted by the client is served."""
+    with patch(
+        "homeassistant.components.http.static.MAX_HOT_FILE_SIZE", 100 if hot else 0
+    ):
+        resp = await static_client.get(
+            "/static/app.js",
+            headers={"Accept-Encoding": accept_encoding},
+        )
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == body
+    assert resp.headers.get("Content-Encoding") == content_encoding
+    assert resp.headers["Content-Type"].endswith("/javascript")
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert "public" in resp.headers["Cache-Control"]
+    assert len(static_client.resource._hot_files) == (1 if hot else 0)
+
+
+async def test_etag(static_client):
+    """Test files have a strong etag per encoding and support revalidation."""
+    resp = await static_client.get(
+        "/static/app.js", headers={"Accept-Encoding": "gzip"}
+    )
+    gzip_etag = resp.headers["ETag"]
+    resp = await static_client.get("/static/app.js", headers={"Accept-Encoding": ""})
+    etag = resp.headers["ETag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+    assert gzip_etag != etag
+
+    resp = await static_client.get(
+        "/static/app.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": f"{etag}, {gzip_etag}"},
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers["ETag"] == gzip_etag
+
+    resp = await static_client.get(
+        "/static/app.js", headers={"Accept-Encoding": "", "If-None-Match": gzip_etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == b"plain"
+
+
+async def test_changed_siblings(static_client, tmp_path):
+    """Test changed or removed pre-compressed siblings are noticed."""
+    resp = await static_client.get(
+        "/static/app.js", headers={"Accept-Encoding": "gzip, br"}
+    )
+    assert await resp.read() == b"brotli"
+    etag = resp.headers["ETag"]
+
+    tmp_path.joinpath("app.js.br").write_bytes(b"new brotli")
+    resp = await static_client.get(
+        "/static/app.js", headers={"Accept-Encoding": "gzip, br"}
+    )
+    assert await resp.read() == b"new brotli"
+    assert resp.headers["ETag"] != etag
+
+    tmp_path.joinpath("app.js.br").unlink()
+    resp = await static_client.get(
+        "/static/app.js", headers={"Accept-Encoding": "gzip, br"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == b"gzipped"
+    assert resp.headers["Content-Encoding"] == "gzip"
+
+
+async def test_path_spellings(static_client):
+    """Test spellings of a path share the file and are remembered up to a limit."""
+    with patch(
+        "homeassistant.components.http.static._load_static_file",
+        wraps=static._load_static_file,
+    ) as mock_load, patch("homeassistant.components.http.static.MAX_CACHED_PATHS", 2):
+        for path in ("/static/sub/nested.js", "/static/sub//nested.js"):
+            resp = await static_client.get(path)
+            assert await resp.read() == b"nested"
+        assert mock_load.call_count == 1
+        assert len(static_client.resource._files) == 1
+        assert len(static_client.resource._paths) == 2
+
+        resp = await static_client.get("/static/other.js")
+        assert len(static_client.resource._paths) == 2
+        assert len(static_client.resource._files) == 2
+
+
+async def test_hot_files(static_client, tmp_path):
+    """Test small files are kept in memory until they change."""
+    with patch("homeassistant.components.http.static.HOT_CACHE_SIZE", 10):
+        resp = await static_client.get("/static/other.js")
+        etag = resp.headers["ETag"]
+        with patch(
+            "homeassistant.components.http.static.Path.read_bytes"
+        ) as mock_read_bytes:
+            resp = await static_client.get("/static/other.js")
+            assert await resp.read() == b"other"
+        assert not mock_read_bytes.called
+
+        tmp_path.joinpath("other.js").write_bytes(b"changed")
+        resp = await static_client.get("/static/other.js")
+        assert await resp.read() == b"changed"
+        assert resp.headers["ETag"] != etag
+        assert "Vary" not in resp.headers
+
+    # The old version was evicted to stay within the cache size
+    assert list(static_client.resource._hot_files.values()) == [b"changed"]
+
+
+async def test_range_request(static_client):
+    """Test range requests are served from the file."""
+    resp = await static_client.get(
+        "/static/other.js", headers={"Accept-Encoding": "", "Range": "bytes=1-2"}
+    )
+    assert resp.status == HTTPStatus.PARTIAL_CONTENT
+    assert await resp.read() == b"th"
+
+
+async def test_not_found(static_client):
+    """Test missing files and paths outside the directory are not found."""
+    resp = await static_client.get("/static/missing.js")
+    assert resp.status == HTTPStatus.NOT_FOUND
+    resp = await static_client.get("/static/..%2F..%2Fetc%2Fpasswd")
+    assert resp.status == HTTPStatus.NOT_FOUND
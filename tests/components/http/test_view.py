@@ -34,9 +34,16 @@ async def test_invalid_json(caplog):
     view = HomeAssistantView()
 
     with pytest.raises(HTTPInternalServerError):
-        view.json(float("NaN"))
+        view.json(object)
 
-    assert str(float("NaN")) in caplog.text
+    assert str(object) in caplog.text
+
+
+async def test_nan_serialized_as_null():
+    """Test NaN floats are returned as null."""
+    view = HomeAssistantView()
+
+    assert view.json([float("NaN")]).body == b"[null]"
 
 
 async def test_handling_unauthorized(mock_request):
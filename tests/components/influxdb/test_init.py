@@ -1793,3 +1793,151 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+def _line_protocol_call(api_version, lines, precision=None):
+    """Return the expected write call for lines of line protocol."""
+    if api_version == influxdb.API_VERSION_2:
+        if precision is None:
+            return call(bucket=DEFAULT_BUCKET, record=lines)
+        return call(bucket=DEFAULT_BUCKET, record=lines, write_precision=precision)
+    return call(lines, time_precision=precision, protocol="line")
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api",
+    [
+        (influxdb.DEFAULT_API_VERSION, BASE_V1_CONFIG, _get_write_api_mock_v1),
+        (influxdb.API_VERSION_2, BASE_V2_CONFIG, _get_write_api_mock_v2),
+    ],
+    indirect=["mock_client"],
+)
+async def test_event_listener_line_protocol(
+    hass, mock_client, config_ext, get_write_api
+):
+    """Test events are written as line protocol."""
+    config = {"line_protocol": True, "tags_attributes": ["room"]}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+
+    state = MagicMock(
+        state="on",
+        domain="fake",
+        entity_id="fake.entity",
+        object_id="entity",
+        attributes={
+            "unit_of_measurement": "foo bar",
+            "friendly_name": 'Say "hi"',
+            "room": "living room",
+            "level": 3,
+        },
+    )
+    event = MagicMock(
+        data={"new_state": state},
+        time_fired=datetime.datetime(
+            2021, 11, 1, 0, 0, 1, 5, tzinfo=datetime.timezone.utc
+        ),
+    )
+    handler_method(event)
+    hass.data[influxdb.DOMAIN].block_till_done()
+
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 1
+    assert write_api.call_args == _line_protocol_call(
+        config_ext.get("api_version"),
+        [
+            "foo\\ bar,domain=fake,entity_id=entity,room=living\\ room "
+            'state="on",value=1.0,friendly_name_str="Say \\"hi\\"",level=3.0 '
+            "1635724801000005000"
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api",
+    [
+        (influxdb.DEFAULT_API_VERSION, BASE_V1_CONFIG, _get_write_api_mock_v1),
+        (influxdb.API_VERSION_2, BASE_V2_CONFIG, _get_write_api_mock_v2),
+    ],
+    indirect=["mock_client"],
+)
+async def test_event_listener_line_protocol_spool(
+    hass, tmp_path, mock_client, config_ext, get_write_api
+):
+    """Test lines are buffered on disk during an outage and replayed after."""
+    hass.config.config_dir = str(tmp_path)
+    config = {"line_protocol": True, "precision": "s"}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+    api_version = config_ext.get("api_version")
+
+    def send_event(value):
+        """Send a state change event for a value."""
+        state = MagicMock(
+            state=value,
+            domain="fake",
+            entity_id="fake.entity",
+            object_id="entity",
+            attributes={},
+        )
+        handler_method(
+            MagicMock(
+                data={"new_state": state},
+                time_fired=datetime.datetime(2021, 11, 1, tzinfo=datetime.timezone.utc),
+            )
+        )
+        hass.data[influxdb.DOMAIN].block_till_done()
+        return (
+            "fake.entity,domain=fake,entity_id=entity "
+            f"value={float(value)} 1635724800"
+        )
+
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = OSError("foo")
+
+    # The first failing write starts buffering, later batches are buffered
+    # without trying to write until the retry delay passed.
+    with patch.object(influxdb.time, "sleep") as mock_sleep:
+        buffered = [send_event(1), send_event(2)]
+        assert not mock_sleep.called
+    assert write_api.call_count == 1
+    assert list((tmp_path / influxdb.SPOOL_DIRECTORY).iterdir())
+
+    write_api.side_effect = None
+    write_api.reset_mock()
+    with patch.object(
+        influxdb.time,
+        "monotonic",
+        return_value=influxdb.time.monotonic() + influxdb.RETRY_DELAY,
+    ):
+        line = send_event(3)
+
+    assert write_api.call_args_list == [
+        _line_protocol_call(api_version, [line], "s"),
+        _line_protocol_call(api_version, buffered, "s"),
+    ]
+    assert not hass.data[influxdb.DOMAIN].spool
+    assert not list((tmp_path / influxdb.SPOOL_DIRECTORY).iterdir())
+
+
+def test_line_protocol_spool_size(tmp_path):
+    """Test the disk buffer drops the oldest segments when full."""
+    path = str(tmp_path / "spool")
+    line = "measurement value=1.0 1635724800"
+    with patch(f"{INFLUX_PATH}.SPOOL_SEGMENT_BYTES", len(line) * 2):
+        spool = influxdb.LineProtocolSpool(path, (len(line) + 1) * 4)
+        for value in range(6):
+            spool.append([f"measurement value={value}.0 1635724800"] * 2)
+
+    assert len(list(tmp_path.joinpath("spool").iterdir())) == 2
+
+    # Segments left behind are picked up again
+    spool = influxdb.LineProtocolSpool(path, (len(line) + 1) * 4)
+    sequence, lines = spool.oldest()
+    assert lines == ["measurement value=4.0 1635724800"] * 2
+    spool.remove(sequence)
+    sequence, lines = spool.oldest()
+    assert lines == ["measurement value=5.0 1635724800"] * 2
+    spool.remove(sequence)
+    assert not spool
+    assert spool.oldest() is None
@@ -296,6 +296,7 @@ def create_state_changed_event_from_old_new(
     row.event_type = EVENT_STATE_CHANGED
     row.event_data = "{}"
     row.attributes = attributes_json
+    row.shared_attrs = attributes_json
     row.time_fired = event_time_fired
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
@@ -1874,6 +1875,73 @@ async def test_context_filter(hass, hass_client):
     assert response.status == HTTPStatus.BAD_REQUEST
 
 
+async def test_logbook_pagination(hass, hass_client):
+    """Test paging through the logbook with a cursor."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await async_setup_component(hass, "automation", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    automation_context = ha.Context()
+    service_context = ha.Context()
+    point = dt_util.utcnow() - timedelta(hours=4)
+    for idx in range(8):
+        with patch("homeassistant.util.dt.utcnow", return_value=point):
+            hass.bus.async_fire(
+                EVENT_AUTOMATION_TRIGGERED,
+                {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+                context=automation_context,
+            )
+            hass.bus.async_fire(
+                EVENT_CALL_SERVICE,
+                {
+                    ATTR_DOMAIN: "light",
+                    ATTR_SERVICE: "turn_on",
+                    ATTR_ENTITY_ID: "light.kitchen",
+                },
+                context=service_context,
+            )
+            hass.states.async_set("light.kitchen", STATE_ON if idx % 2 else STATE_OFF)
+            hass.states.async_set(
+                "switch.porch",
+                STATE_ON if idx % 2 else STATE_OFF,
+                context=automation_context if idx < 4 else service_context,
+            )
+            await hass.async_block_till_done()
+        point += timedelta(minutes=20)
+
+    await _async_commit_and_wait(hass)
+    client = await hass_client()
+
+    for params in ({}, {"entity": "switch.porch"}):
+        entries = await _async_fetch_logbook(client, dict(params))
+        assert len(entries) == (7 if params else 22)
+
+        for limit in (1, 3, 50):
+            pages = []
+            cursor = None
+            while True:
+                page_params = {**params, "limit": limit}
+                if cursor:
+                    page_params["cursor"] = cursor
+                page = await _async_fetch_logbook(client, page_params)
+                pages.append(page["entries"])
+                if (cursor := page["next_cursor"]) is None:
+                    break
+
+            assert [entry for page in pages for entry in page] == entries
+            if limit < 50:
+                assert len(pages) > 1
+                assert all(len(page) >= limit for page in pages[:-1])
+
+    response = await client.get("/api/logbook", params={"limit": 0})
+    assert response.status == HTTPStatus.BAD_REQUEST
+    response = await client.get("/api/logbook", params={"limit": 1, "cursor": "x"})
+    assert response.status == HTTPStatus.BAD_REQUEST
+    response = await client.get("/api/logbook", params={"cursor": cursor or "x"})
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
 async def _async_fetch_logbook(client, params=None):
     if params is None:
         params = {}
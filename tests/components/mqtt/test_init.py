@@ -11,6 +11,7 @@ import voluptuous as vol
 from homeassistant.components import mqtt, websocket_api
 from homeassistant.components.mqtt import debug_info
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
+from homeassistant.components.mqtt.models import ReceiveMessage
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
@@ -385,6 +386,101 @@ async def test_all_subscriptions_run_when_decode_fails(
     assert len(calls) == 1
 
 
+@pytest.mark.parametrize(
+    "mqtt_config",
+    [{mqtt.CONF_BROKER: "mock-broker", mqtt.CONF_MESSAGE_BATCH_SIZE: 2}],
+)
+async def test_received_messages_are_batched(hass, mqtt_mock, calls, record_calls):
+    """Test messages received by the paho thread are processed in batches."""
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    def receive_messages():
+        for idx in range(5):
+            mqtt_mock._mqtt_on_message(
+                None, None, ReceiveMessage(f"test-topic/{idx}", b"on", 0, False)
+            )
+
+    with patch.object(
+        hass.loop, "call_soon", wraps=hass.loop.call_soon
+    ) as mock_call_soon, patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as mock_call_soon_threadsafe:
+        await hass.async_add_executor_job(receive_messages)
+        await hass.async_block_till_done()
+        # Each following batch runs in a later iteration of the event loop
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+    assert [args[0].topic for args in calls] == [
+        f"test-topic/{idx}" for idx in range(5)
+    ]
+    assert not mqtt_mock()._received_messages
+
+    def process_calls(mock):
+        return [
+            mock_call
+            for mock_call in mock.mock_calls
+            if getattr(mock_call.args[0], "__name__", None) == "_async_process_messages"
+        ]
+
+    # A single wake up of the event loop, the other batches follow on the loop
+    assert len(process_calls(mock_call_soon_threadsafe)) == 1
+    assert len(process_calls(mock_call_soon)) == 2
+
+
+@pytest.mark.parametrize(
+    "mqtt_config",
+    [{mqtt.CONF_BROKER: "mock-broker", mqtt.CONF_MESSAGE_BATCH_LATENCY: 1e-9}],
+)
+async def test_received_message_batch_latency(hass, mqtt_mock, calls, record_calls):
+    """Test a batch of received messages ends when exceeding the latency bound."""
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+
+    for _ in range(3):
+        mqtt_mock._mqtt_on_message(
+            None, None, ReceiveMessage("test-topic", b"on", 0, False)
+        )
+
+    with patch.object(hass.loop, "call_soon", wraps=hass.loop.call_soon) as mock:
+        await hass.async_block_till_done()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+    assert len(calls) == 3
+    assert not mqtt_mock()._received_messages
+    # Every message exceeds the latency bound and ends its batch
+    assert (
+        len(
+            [
+                mock_call
+                for mock_call in mock.mock_calls
+                if getattr(mock_call.args[0], "__name__", None)
+                == "_async_process_messages"
+            ]
+        )
+        == 2
+    )
+
+
+@pytest.mark.no_fail_on_log_exception
+async def test_received_message_batch_continues_after_error(hass, mqtt_mock, caplog):
+    """Test the remaining messages are processed when processing one fails."""
+    for _ in range(2):
+        mqtt_mock._mqtt_on_message(
+            None, None, ReceiveMessage("test-topic", b"on", 0, False)
+        )
+
+    with patch(
+        "homeassistant.components.mqtt.MQTT._mqtt_handle_message",
+        side_effect=[Exception("Boom"), None],
+    ) as mock_handle_message:
+        await hass.async_block_till_done()
+
+    assert len(mock_handle_message.mock_calls) == 2
+    assert "Error processing MQTT message on test-topic" in caplog.text
+    assert not mqtt_mock()._received_messages
+
+
 async def test_subscribe_topic(hass, mqtt_mock, calls, record_calls):
     """Test the subscription of a topic."""
     unsub = await mqtt.async_subscribe(hass, "test-topic", record_calls)
@@ -946,13 +1042,9 @@ async def test_delayed_birth_message(hass, mqtt_client_mock, mqtt_config):
     assert result
     await hass.async_block_till_done()
 
-    # Workaround: asynctest==0.13 fails on @functools.lru_cache
-    spec = dir(hass.data["mqtt"])
-    spec.remove("_matching_subscriptions")
-
     mqtt_component_mock = MagicMock(
         return_value=hass.data["mqtt"],
-        spec_set=spec,
+        spec_set=dir(hass.data["mqtt"]),
         wraps=hass.data["mqtt"],
     )
     mqtt_component_mock._mqttc = mqtt_client_mock
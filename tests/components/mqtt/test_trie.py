@@ -0,0 +1,72 @@
+"""Test the MQTT topic trie."""
+import pytest
+
+from homeassistant.components.mqtt.trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    "topic_filter,topic,matches",
+    [
+        ("sport/tennis", "sport/tennis", True),
+        ("sport/tennis", "sport/tennis/player1", False),
+        ("sport/+", "sport/tennis", True),
+        ("sport/+", "sport/", True),
+        ("sport/+", "sport", False),
+        ("sport/+", "sport/tennis/player1", False),
+        ("sport/+/player1", "sport/tennis/player1", True),
+        ("+/+", "/finance", True),
+        ("sport/#", "sport", True),
+        ("sport/#", "sport/tennis/player1/ranking", True),
+        ("sport/#", "sports/tennis", False),
+        ("#", "sport/tennis", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_match(topic_filter, topic, matches):
+    """Test matching topics against a topic filter."""
+    trie = TopicTrie()
+    trie.add(topic_filter, "value")
+
+    assert trie.match(topic) == (["value"] if matches else [])
+
+
+def test_match_in_insertion_order():
+    """Test all matching values are returned in the order they were added."""
+    trie = TopicTrie()
+    trie.add("home/#", 1)
+    trie.add("home/+/state", 2)
+    trie.add("home/kitchen/state", 3)
+    trie.add("home/kitchen/state", 4)
+    trie.add("home/+/+", 5)
+    trie.add("home/kitchen/command", 6)
+
+    assert trie.match("home/kitchen/state") == [1, 2, 3, 4, 5]
+
+
+def test_remove():
+    """Test removing values and topic filters."""
+    trie = TopicTrie()
+    first = object()
+    second = object()
+    trie.add("home/+/state", first)
+    trie.add("home/+/state", second)
+    assert trie.has_filter("home/+/state")
+
+    trie.remove("home/+/state", first)
+    assert trie.match("home/kitchen/state") == [second]
+    assert trie.has_filter("home/+/state")
+
+    with pytest.raises(KeyError):
+        trie.remove("home/+/state", first)
+    with pytest.raises(KeyError):
+        trie.remove("home/+/other", second)
+
+    trie.remove("home/+/state", second)
+    assert trie.match("home/kitchen/state") == []
+    assert not trie.has_filter("home/+/state")
+    assert not trie.has_filter("home/+")
+    # pylint: disable=protected-access
+    assert not trie._root.children
@@ -7,6 +7,7 @@ from homeassistant.components.profiler import (
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_TEMPLATE_CACHE_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_MEMORY,
     SERVICE_START,
@@ -185,3 +186,25 @@ async def test_log_scheduled(hass, caplog):
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_log_template_cache_stats(hass, caplog):
+    """Test we can log the compiled template cache statistics."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_TEMPLATE_CACHE_STATS)
+
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_TEMPLATE_CACHE_STATS, {})
+    await hass.async_block_till_done()
+
+    assert "Compiled template cache" in caplog.text
+    assert "'hits'" in caplog.text
+    caplog.clear()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
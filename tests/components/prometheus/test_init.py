@@ -15,6 +15,7 @@ from homeassistant.const import (
     DEGREE,
     DEVICE_CLASS_POWER,
     ENERGY_KILO_WATT_HOUR,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
 )
 from homeassistant.core import split_entity_id
@@ -32,9 +33,9 @@ class FilterTest:
     should_pass: bool
 
 
-async def prometheus_client(hass, hass_client, namespace):
+async def prometheus_client(hass, hass_client, namespace, collect_on_scrape=False):
     """Initialize an hass_client with Prometheus component."""
-    config = {}
+    config = {prometheus.CONF_COLLECT_ON_SCRAPE: collect_on_scrape}
     if namespace is not None:
         config[prometheus.CONF_PROM_NAMESPACE] = namespace
     await async_setup_component(hass, prometheus.DOMAIN, {prometheus.DOMAIN: config})
@@ -255,6 +256,81 @@ async def test_view_default_namespace(hass, hass_client):
     )
 
 
+async def test_view_collect_on_scrape(hass, hass_client):
+    """Test gauges are collected from the states when Prometheus scrapes."""
+    client = await prometheus_client(hass, hass_client, "scraped", True)
+
+    async def scrape():
+        resp = await client.get(prometheus.API_ENDPOINT)
+        assert resp.status == HTTPStatus.OK
+        return (await resp.text()).split("\n")
+
+    body = await scrape()
+
+    assert (
+        'scraped_sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 15.6' in body
+    )
+    assert (
+        'scraped_battery_level_percent{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 12.0' in body
+    )
+    assert (
+        'scraped_humidifier_mode{domain="humidifier",'
+        'entity="humidifier.hygrostat",'
+        'friendly_name="Hygrostat",'
+        'mode="home"} 1.0' in body
+    )
+    assert (
+        'scraped_last_updated_time_seconds{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 86400.0' in body
+    )
+    assert (
+        'scraped_state_change_total{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in body
+    )
+
+    hass.states.async_set(
+        "sensor.radio_energy",
+        "unavailable",
+        {"friendly_name": "Radio Energy"},
+    )
+    hass.states.async_set("automation.alarm", "on", {"friendly_name": "Alarm"})
+    await hass.async_block_till_done()
+    body = await scrape()
+
+    assert (
+        'scraped_entity_available{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 0.0' in body
+    )
+    assert not any(
+        line.startswith("scraped_sensor_power_kwh{") for line in body
+    ), "Unavailable states have no value"
+    assert (
+        'scraped_state_change_total{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 2.0' in body
+    )
+    assert (
+        'scraped_automation_triggered_count_total{domain="automation",'
+        'entity="automation.alarm",'
+        'friendly_name="Alarm"} 1.0' in body
+    )
+
+    # A stopped instance is no longer collected
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert (
+        b"scraped_entity_available"
+        not in prometheus.prometheus_client.generate_latest()
+    )
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
     """Mock the prometheus client."""
@@ -5,8 +5,11 @@ from datetime import timedelta
 import json
 from unittest.mock import patch, sentinel
 
+import pytest
+
 from homeassistant.components.recorder import history
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -141,6 +144,36 @@ def test_get_last_state_changes(hass_recorder):
     assert states == hist[entity_id]
 
 
+def test_numeric_state(hass_recorder):
+    """Test the history has the numeric value of states that are numbers."""
+    hass = hass_recorder()
+
+    start = dt_util.utcnow()
+    point = start + timedelta(seconds=1)
+    end = point + timedelta(seconds=1)
+
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=start):
+        hass.states.set("sensor.power", "100")
+        wait_recording_done(hass)
+
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=point):
+        for state in ("10", "unavailable", "20", "60"):
+            hass.states.set("sensor.power", state)
+            wait_recording_done(hass)
+
+    with patch("homeassistant.components.recorder.dt_util.utcnow", return_value=end):
+        hass.states.set("sensor.power", "1000")
+        wait_recording_done(hass)
+
+    hist = history.get_significant_states(hass, start, end, ["sensor.power"])
+    assert [state.numeric_state for state in hist["sensor.power"]] == [
+        10.0,
+        None,
+        20.0,
+        60.0,
+    ]
+
+
 def test_ensure_state_can_be_copied(hass_recorder):
     """Ensure a state can pass though copy().
 
@@ -184,6 +217,73 @@ def test_get_significant_states(hass_recorder):
     assert states == hist
 
 
+@pytest.mark.parametrize("minimal_response", [False, True])
+def test_iter_significant_states(hass_recorder, minimal_response):
+    """Test the streamed significant states match the significant states."""
+    hass = hass_recorder()
+    zero, four, _ = record_states(hass)
+    hist = history.get_significant_states(
+        hass, zero, four, minimal_response=minimal_response
+    )
+
+    with session_scope(hass=hass) as session:
+        streamed = list(
+            history.iter_significant_states_with_session(
+                hass, session, zero, four, minimal_response=minimal_response
+            )
+        )
+
+    assert sorted(streamed, key=lambda item: item[0]) == sorted(hist.items())
+
+
+@pytest.mark.parametrize("minimal_response", [False, True])
+def test_get_significant_states_max_points(hass_recorder, minimal_response):
+    """Test numeric states are reduced to the min and max of each bucket."""
+    hass = hass_recorder()
+    entity_id = "sensor.power"
+
+    start = dt_util.utcnow()
+    for i in range(200):
+        if i == 100:
+            state = "unavailable"
+        elif i == 150:
+            state = "1000"
+        else:
+            state = str(i % 10)
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=start + timedelta(seconds=i),
+        ):
+            hass.states.set(entity_id, state)
+    hass.states.set("sensor.mode", "eco")
+    wait_recording_done(hass)
+    end = start + timedelta(seconds=200)
+
+    hist = history.get_significant_states(
+        hass, start - timedelta(seconds=1), end, minimal_response=minimal_response
+    )
+    assert len(hist[entity_id]) == 200
+
+    hist = history.get_significant_states(
+        hass,
+        start - timedelta(seconds=1),
+        end,
+        minimal_response=minimal_response,
+        max_points=20,
+    )
+    states = [
+        state["state"] if isinstance(state, dict) else state.state
+        for state in hist[entity_id]
+    ]
+    # 10 buckets with a min and a max, the last row and the unavailable state
+    assert len(states) <= 22
+    assert states[0] == "0"
+    assert states[-1] == "9"
+    assert "unavailable" in states
+    assert "1000" in states
+    assert len(hist["sensor.mode"]) == 1
+
+
 def test_get_significant_states_minimal_response(hass_recorder):
     """Test that only significant states are returned.
 
@@ -1,13 +1,14 @@
 """The tests for the Recorder component."""
 # pylint: disable=protected-access
+import asyncio
 from datetime import datetime, timedelta
 import sqlite3
+import threading
 from unittest.mock import patch
 
 import pytest
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
-from homeassistant.components import recorder
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_DB_URL,
@@ -28,6 +29,7 @@ from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -37,6 +39,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     MATCH_ALL,
     STATE_LOCKED,
     STATE_UNLOCKED,
@@ -147,30 +150,109 @@ async def test_saving_state(
     assert state == _state_empty_context(hass, entity_id)
 
 
+async def test_saving_states_shares_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test identical attributes are stored once and shared between states."""
+    instance = await async_setup_recorder_instance(hass)
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    attributes2 = {"test_attr": 10, "test_attr_10": "mean"}
+
+    hass.states.async_set("test.recorder", "on", attributes)
+    hass.states.async_set("test.recorder2", "on", attributes)
+    await async_wait_recording_done(hass, instance)
+    # Served from the attributes id cache
+    hass.states.async_set("test.recorder", "off", attributes)
+    hass.states.async_set("test.recorder2", "off", attributes2)
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert len(db_states) == 4
+        assert {db_state.attributes for db_state in db_states} == {None}
+        assert (
+            db_states[0].attributes_id
+            == db_states[1].attributes_id
+            == db_states[2].attributes_id
+        )
+        assert db_states[3].attributes_id != db_states[0].attributes_id
+        assert session.query(StateAttributes).count() == 2
+        assert db_states[3].to_native().attributes == attributes2
+
+    # The cache is lost when the event session is reopened
+    # and the attributes are found in the database
+    instance._state_attributes_ids.clear()
+    hass.states.async_set("test.recorder3", "on", attributes2)
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 2
+
+
 async def test_saving_many_states(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
-    """Test we expire after many commits."""
+    """Test many states are linked to their event and the previous state."""
     instance = await async_setup_recorder_instance(hass)
 
     entity_id = "test.recorder"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    with patch.object(
-        hass.data[DATA_INSTANCE].event_session, "expire_all"
-    ) as expire_all, patch.object(recorder, "EXPIRE_AFTER_COMMITS", 2):
-        for _ in range(3):
-            hass.states.async_set(entity_id, "on", attributes)
-            await async_wait_recording_done(hass, instance)
-            hass.states.async_set(entity_id, "off", attributes)
-            await async_wait_recording_done(hass, instance)
-
-    assert expire_all.called
+    for i in range(3):
+        hass.states.async_set(entity_id, "on", attributes)
+        await async_wait_recording_done(hass, instance)
+        hass.states.async_set(entity_id, "off", attributes)
+        hass.states.async_set("test.other", str(i), attributes)
+        await async_wait_recording_done(hass, instance)
 
     with session_scope(hass=hass) as session:
-        db_states = list(session.query(States))
+        db_states = list(
+            session.query(States)
+            .filter(States.entity_id == entity_id)
+            .order_by(States.state_id)
+        )
         assert len(db_states) == 6
-        assert db_states[0].event_id > 0
+        assert db_states[0].old_state_id is None
+        for old_state, new_state in zip(db_states, db_states[1:]):
+            assert new_state.old_state_id == old_state.state_id
+        for db_state in db_states:
+            assert db_state.event.event_type == EVENT_STATE_CHANGED
+        assert session.query(States).count() == 9
+        assert session.query(StateAttributes).count() == 1
+
+
+async def test_saving_states_of_one_entity_in_one_commit(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test states of one entity in one commit are linked to the previous state."""
+    instance = await async_setup_recorder_instance(hass)
+
+    entity_id = "test.recorder"
+    for state in ("on", "off", "on"):
+        hass.states.async_set(entity_id, state)
+    hass.states.async_remove(entity_id)
+    hass.states.async_set(entity_id, "off")
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.state for db_state in db_states] == [
+            "on",
+            "off",
+            "on",
+            None,
+            "off",
+        ]
+        assert [db_state.old_state_id for db_state in db_states] == [
+            None,
+            db_states[0].state_id,
+            db_states[1].state_id,
+            db_states[2].state_id,
+            None,
+        ]
+        for db_state in db_states:
+            assert db_state.event.event_type == EVENT_STATE_CHANGED
 
 
 async def test_saving_state_with_intermixed_time_changes(
@@ -207,17 +289,18 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    event_session = hass.data[DATA_INSTANCE].event_session
+    bulk_insert_mappings = event_session.bulk_insert_mappings
+
+    def _throw_if_inserting_states(mapper, *args, **kwargs):
+        if mapper is States:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        return bulk_insert_mappings(mapper, *args, **kwargs)
 
     with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        event_session,
+        "bulk_insert_mappings",
+        side_effect=_throw_if_inserting_states,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -245,17 +328,18 @@ def test_saving_state_with_sqlalchemy_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    event_session = hass.data[DATA_INSTANCE].event_session
+    bulk_insert_mappings = event_session.bulk_insert_mappings
+
+    def _throw_if_inserting_states(mapper, *args, **kwargs):
+        if mapper is States:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
+        return bulk_insert_mappings(mapper, *args, **kwargs)
 
     with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        event_session,
+        "bulk_insert_mappings",
+        side_effect=_throw_if_inserting_states,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -1035,6 +1119,39 @@ def test_service_disable_run_information_recorded(tmpdir):
     hass.stop()
 
 
+def test_read_only_sessions(tmpdir):
+    """Test reads use their own connections and executor."""
+    test_db_file = tmpdir.mkdir("sqlite").join("test_read_only.db")
+    dburl = f"{SQLITE_URL_PREFIX}//{test_db_file}"
+
+    hass = get_test_home_assistant()
+    setup_component(hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl}})
+    hass.start()
+    wait_recording_done(hass)
+    instance = hass.data[DATA_INSTANCE]
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.bind is not instance.engine
+        assert len(list(session.query(RecorderRuns))) == 1
+
+    with pytest.raises(OperationalError), session_scope(
+        hass=hass, read_only=True
+    ) as session:
+        session.add(RecorderRuns(start=dt_util.utcnow()))
+
+    async def _async_thread_name():
+        return await instance.async_add_executor_job(
+            lambda: threading.current_thread().name
+        )
+
+    thread_name = asyncio.run_coroutine_threadsafe(
+        _async_thread_name(), hass.loop
+    ).result()
+    assert thread_name.startswith("RecorderRead")
+
+    hass.stop()
+
+
 class CannotSerializeMe:
     """A class that the JSONEncoder cannot serialize."""
 
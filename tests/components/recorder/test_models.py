@@ -1,5 +1,7 @@
 """The tests for the Recorder component."""
 from datetime import datetime
+import json
+from unittest.mock import Mock
 
 import pytest
 from sqlalchemy import create_engine
@@ -8,6 +10,7 @@ from sqlalchemy.orm import scoped_session, sessionmaker
 from homeassistant.components.recorder.models import (
     Base,
     Events,
+    LazyState,
     RecorderRuns,
     States,
     process_timestamp,
@@ -59,6 +62,39 @@ def test_from_event_to_delete_state():
     assert db_state.last_updated == event.time_fired
 
 
+@pytest.mark.parametrize(
+    "state, numeric_state",
+    [
+        ("18", 18.0),
+        ("-1.5", -1.5),
+        ("on", None),
+        ("", None),
+        (None, None),
+        ("nan", None),
+        ("inf", None),
+    ],
+)
+def test_parse_numeric_state(state, numeric_state):
+    """Test only finite numbers are stored as numeric state."""
+    assert States.parse_numeric_state(state) == numeric_state
+
+
+def test_from_event_to_db_state_numeric_state():
+    """Test the numeric state is set when converting event to db state."""
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": "sensor.temperature",
+            "old_state": None,
+            "new_state": ha.State("sensor.temperature", "18.5"),
+        },
+    )
+    assert States.from_event(event).numeric_state == 18.5
+
+    event.data["new_state"] = ha.State("sensor.temperature", "unavailable")
+    assert States.from_event(event).numeric_state is None
+
+
 def test_entity_ids():
     """Test if entity ids helper method works."""
     engine = create_engine("sqlite://")
@@ -215,3 +251,25 @@ async def test_event_to_db_model():
     native = Events.from_event(event, event_data="{}").to_native()
     event.data = {}
     assert native == event
+
+
+async def test_lazy_state_json():
+    """Test a lazy state from a database row is serialized to JSON."""
+    now = dt_util.utcnow()
+    row = Mock(
+        entity_id="sensor.power",
+        state="10",
+        shared_attrs='{"unit_of_measurement": "W"}',
+        last_changed=now,
+        last_updated=now,
+    )
+    state = LazyState(row)
+
+    assert json.loads(state.attributes_json) == {"unit_of_measurement": "W"}
+    assert json.loads(state.as_dict_json) == {
+        "entity_id": "sensor.power",
+        "state": "10",
+        "attributes": {"unit_of_measurement": "W"},
+        "last_changed": now.isoformat(),
+        "last_updated": now.isoformat(),
+    }
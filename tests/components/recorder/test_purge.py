@@ -9,15 +9,20 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import PurgeTask
-from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
+from homeassistant.components.recorder.const import (
+    MAX_ROWS_TO_PURGE,
+    MIN_ROWS_TO_PURGE,
+    PURGE_PASS_TIME_BUDGET,
+)
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     StatisticsShortTerm,
 )
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import PurgeProgress, purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import HomeAssistant
@@ -52,6 +57,9 @@ async def test_purge_old_states(
         assert events.count() == 6
         assert "test.recorder2" in instance._old_states
 
+        state_attributes = session.query(StateAttributes)
+        assert state_attributes.count() == 1
+
         purge_before = dt_util.utcnow() - timedelta(days=4)
 
         # run purge_old_data()
@@ -67,6 +75,7 @@ async def test_purge_old_states(
         finished = purge_old_data(instance, purge_before, repack=False)
         assert finished
         assert states.count() == 2
+        assert state_attributes.count() == 1
         assert "test.recorder2" in instance._old_states
 
         # run purge_old_data again
@@ -74,7 +83,9 @@ async def test_purge_old_states(
         finished = purge_old_data(instance, purge_before, repack=False)
         assert not finished
         assert states.count() == 0
+        assert state_attributes.count() == 0
         assert "test.recorder2" not in instance._old_states
+        assert len(instance._state_attributes_ids) == 0
 
     # Add some more states
     await _add_test_states(hass, instance)
@@ -91,6 +102,66 @@ async def test_purge_old_states(
         assert "test.recorder2" in instance._old_states
 
 
+async def test_purge_progress(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test progress and throughput of purging old data are tracked."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass, instance)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    # Don't let a slow pass shrink the number of rows per pass
+    with patch("homeassistant.components.recorder.purge.PURGE_PASS_TIME_BUDGET", 3600):
+        assert not purge_old_data(instance, purge_before, repack=False)
+    progress = instance.purge_progress.as_dict()
+    assert progress["purge_before"] == purge_before.isoformat()
+    assert progress["finished"] is None
+    assert 0 < progress["progress"] < 1
+    assert progress["passes"] == 1
+    assert progress["events"] == 4
+    assert progress["states"] == 4
+    assert progress["rows_per_pass"] == MAX_ROWS_TO_PURGE
+
+    assert purge_old_data(instance, purge_before, repack=False)
+    progress = instance.purge_progress.as_dict()
+    assert progress["finished"] is not None
+    assert progress["progress"] == 1.0
+    assert progress["passes"] == 2
+    assert progress["events"] == 4
+    assert progress["states"] == 4
+
+    # A new purge starts over
+    purge_before = dt_util.utcnow()
+    assert not purge_old_data(instance, purge_before, repack=False)
+    progress = instance.purge_progress.as_dict()
+    assert progress["finished"] is None
+    assert progress["passes"] == 1
+    assert progress["states"] == 2
+
+
+def test_purge_progress_rows_per_pass():
+    """Test the number of rows purged per pass follows the time budget."""
+    progress = PurgeProgress()
+    assert progress.rows_per_pass == MAX_ROWS_TO_PURGE
+
+    # Slow passes purge less rows
+    progress.add_pass(MAX_ROWS_TO_PURGE, 0, PURGE_PASS_TIME_BUDGET * 4, None)
+    assert progress.rows_per_pass == MAX_ROWS_TO_PURGE // 4
+    progress.add_pass(10, 0, PURGE_PASS_TIME_BUDGET * 1000, None)
+    assert progress.rows_per_pass == MIN_ROWS_TO_PURGE
+
+    # Incomplete fast passes don't tell how many rows fit in the budget
+    progress.add_pass(10, 0, PURGE_PASS_TIME_BUDGET / 4, None)
+    assert progress.rows_per_pass == MIN_ROWS_TO_PURGE
+
+    # Complete fast passes purge more rows
+    progress.add_pass(MIN_ROWS_TO_PURGE, 0, PURGE_PASS_TIME_BUDGET / 2, None)
+    assert progress.rows_per_pass == MIN_ROWS_TO_PURGE * 2
+    progress.add_pass(MIN_ROWS_TO_PURGE * 2, 0, PURGE_PASS_TIME_BUDGET / 1000, None)
+    assert progress.rows_per_pass == MAX_ROWS_TO_PURGE
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -341,6 +412,12 @@ async def test_purge_method(
         await async_wait_purge_done(hass, instance)
         assert "Vacuuming SQL DB to free space" in caplog.text
 
+        # the first repack switched the database to incremental vacuuming
+        await hass.services.async_call("recorder", "purge", service_data=service_data)
+        await hass.async_block_till_done()
+        await async_wait_purge_done(hass, instance)
+        assert "Incrementally vacuuming SQL DB to free space" in caplog.text
+
 
 async def test_purge_edge_case(
     hass: HomeAssistant,
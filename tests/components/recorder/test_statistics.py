@@ -1,6 +1,8 @@
 """The tests for sensor recorder platform."""
 # pylint: disable=protected-access,invalid-name
 from datetime import timedelta
+from itertools import groupby
+from statistics import mean
 from unittest.mock import patch, sentinel
 
 import pytest
@@ -9,16 +11,20 @@ from pytest import approx
 from homeassistant.components.recorder import history
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
+    StatisticsDaily,
+    StatisticsMonthly,
     StatisticsShortTerm,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
+    compile_missing_period_statistics,
     get_last_statistics,
     get_metadata,
     list_statistic_ids,
     statistics_during_period,
 )
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import TEMP_CELSIUS
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import setup_component
@@ -544,6 +550,140 @@ def test_external_statistics_errors(hass_recorder, caplog):
     assert get_metadata(hass, statistic_ids=("test:total_energy_import",)) == {}
 
 
+def _reduce_hourly_statistics(hourly, start_time, end_time, period):
+    """Reduce hourly statistics to daily or monthly statistics in Python."""
+    stats = [
+        stat
+        for stat in hourly
+        if stat["start"] >= start_time
+        and (end_time is None or stat["start"] < end_time)
+    ]
+    if stats[0]["start"] > start_time:
+        stats.insert(0, [stat for stat in hourly if stat["start"] < start_time][-1])
+
+    def period_start(time):
+        start = dt_util.as_local(time).replace(hour=0)
+        if period == "month":
+            start = start.replace(day=1)
+        return dt_util.as_utc(start)
+
+    result = []
+    for start, group in groupby(stats, lambda stat: period_start(stat["start"])):
+        group = list(group)
+        if period == "day":
+            end = start + timedelta(days=1)
+        else:
+            end = (start + timedelta(days=31)).replace(day=1)
+        result.append(
+            {
+                "statistic_id": "test:total_energy_import",
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "mean": approx(mean(stat["mean"] for stat in group)),
+                "min": approx(min(stat["min"] for stat in group)),
+                "max": approx(max(stat["max"] for stat in group)),
+                "last_reset": None,
+                "state": approx(group[-1]["state"]),
+                "sum": approx(group[-1]["sum"]),
+            }
+        )
+    return {"test:total_energy_import": result}
+
+
+def test_daily_and_monthly_statistics(hass_recorder):
+    """Test daily and monthly statistics are compiled and aggregated."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    original_tz = dt_util.DEFAULT_TIME_ZONE
+    dt_util.set_default_time_zone(dt_util.get_time_zone("US/Pacific"))
+    wait_recording_done(hass)
+
+    # Hourly statistics starting in the morning and spanning a DST change
+    zero = dt_util.as_utc(dt_util.parse_datetime("2021-10-20T05:00:00-07:00"))
+    hourly = [
+        {
+            "start": zero + timedelta(hours=i),
+            "mean": i % 24,
+            "min": i % 24 - i % 5,
+            "max": i % 24 + i % 7,
+            "last_reset": None,
+            "state": i % 13,
+            "sum": i * 2,
+        }
+        for i in range(45 * 24)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, hourly)
+    wait_recording_done(hass)
+
+    def assert_statistics():
+        for start_time, end_time in (
+            (zero, None),
+            (zero - timedelta(days=1), None),
+            (zero + timedelta(days=10, minutes=30), zero + timedelta(days=30)),
+            (dt_util.as_utc(dt_util.parse_datetime("2021-11-01T00:00-07:00")), None),
+        ):
+            for period in ("day", "month"):
+                stats = statistics_during_period(
+                    hass, start_time, end_time, period=period
+                )
+                assert stats == _reduce_hourly_statistics(
+                    hourly, max(start_time, zero), end_time, period
+                )
+
+    # Nothing compiled yet, all periods are aggregated from hourly statistics
+    assert_statistics()
+
+    def assert_period_statistics(daily_count, monthly_count):
+        with session_scope(hass=hass) as session:
+            assert session.query(StatisticsDaily).count() == daily_count
+            assert session.query(StatisticsMonthly).count() == monthly_count
+        assert_statistics()
+
+    # Each task compiles at most MAX_PERIODS_PER_TASK days or months, the
+    # compiled statistics are the progress for the next task
+    end = dt_util.utcnow()
+    assert not compile_missing_period_statistics(recorder, end)
+    assert_period_statistics(31, 3)
+    assert compile_missing_period_statistics(recorder, end)
+    assert_period_statistics(46, 3)
+
+    # Compiled periods are updated when hourly statistics are changed
+    hourly[30] = {**hourly[30], "mean": 100, "min": -100, "max": 200, "sum": 1000}
+    hourly.append({**hourly[-1], "start": hourly[-1]["start"] + timedelta(hours=1)})
+    async_add_external_statistics(
+        hass, external_metadata, (dict(hourly[30]), dict(hourly[-1]))
+    )
+    wait_recording_done(hass)
+    assert_statistics()
+
+    # Compiled periods are ignored, deleted and compiled again after a time zone
+    # change
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Amsterdam"))
+    assert_statistics()
+    with patch("homeassistant.components.recorder.statistics.MAX_ROWS_TO_PURGE", 40):
+        for daily_count, monthly_count in ((6, 0), (0, 3), (31, 3)):
+            assert not compile_missing_period_statistics(recorder, end)
+            assert_period_statistics(daily_count, monthly_count)
+
+    # The tasks are queued after the hourly statistics until all are compiled
+    recorder.do_adhoc_statistics(
+        start=dt_util.utcnow().replace(minute=55) - timedelta(hours=1)
+    )
+    for _ in range(3):
+        wait_recording_done(hass)
+    assert_period_statistics(46, 3)
+
+    dt_util.set_default_time_zone(original_tz)
+
+
 def record_states(hass):
     """Record some test states.
 
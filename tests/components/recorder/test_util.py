@@ -207,6 +207,34 @@ def test_setup_connection_for_dialect_sqlite(sqlite_version, db_supports_row_num
     assert instance_mock._db_supports_row_number == db_supports_row_number
 
 
+@pytest.mark.parametrize(
+    "dialect,statement,commit",
+    [
+        ("sqlite", "PRAGMA query_only = ON", False),
+        ("mysql", "SET SESSION TRANSACTION READ ONLY", True),
+        (
+            "postgresql",
+            "SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY",
+            True,
+        ),
+    ],
+)
+def test_setup_read_connection_for_dialect(dialect, statement, commit):
+    """Test setting up a connection used for reading only."""
+    execute_args = []
+
+    def execute_mock(statement):
+        execute_args.append(statement)
+
+    dbapi_connection = MagicMock()
+    dbapi_connection.cursor.return_value.execute = execute_mock
+
+    util.setup_read_connection_for_dialect(MagicMock(), dialect, dbapi_connection)
+
+    assert execute_args[-1] == statement
+    assert dbapi_connection.commit.called == commit
+
+
 @pytest.mark.parametrize(
     "mysql_version,message",
     [
@@ -237,3 +237,26 @@ async def test_update_statistics_metadata(hass, hass_ws_client, new_unit):
             "unit_of_measurement": new_unit,
         }
     ]
+
+
+async def test_purge_progress(hass, hass_ws_client):
+    """Test purge progress can be fetched."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    client = await hass_ws_client()
+
+    await client.send_json({"id": 1, "type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "purge_before": None,
+        "started": None,
+        "finished": None,
+        "progress": None,
+        "passes": 0,
+        "events": 0,
+        "states": 0,
+        "duration": 0.0,
+        "rows_per_second": None,
+        "rows_per_pass": 998,
+    }
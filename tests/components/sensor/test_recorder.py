@@ -21,6 +21,7 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.sensor import recorder as sensor_recorder
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
@@ -138,6 +139,142 @@ def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+@pytest.mark.parametrize(
+    "device_class,unit,native_unit,mean,min,max,ten",
+    [
+        (None, "%", "%", 13.050847, -10, 30, 10),
+        ("battery", "%", "%", 13.050847, -10, 30, 10),
+        ("pressure", "hPa", "Pa", 1305.0847, -1000, 3000, 1000),
+        ("temperature", "°F", "°C", -10.52731, -23.33333, -1.111111, -12.222222),
+    ],
+)
+def test_compile_hourly_statistics_running(
+    hass_recorder, caplog, device_class, unit, native_unit, mean, min, max, ten
+):
+    """Test compiling statistics of sensors which have been tracked during a period."""
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    zero -= timedelta(hours=1)
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    attributes = {
+        "device_class": device_class,
+        "state_class": "measurement",
+        "unit_of_measurement": unit,
+    }
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=zero - timedelta(minutes=1),
+    ):
+        sensor_recorder._get_running_statistics(hass)
+        hass.block_till_done()
+
+    four, _ = record_states(hass, zero, "sensor.test1", attributes)
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=four,
+    ):
+        hass.states.set("sensor.test1", STATE_UNAVAILABLE, attributes=attributes)
+        wait_recording_done(hass)
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=zero + timedelta(minutes=7),
+    ):
+        hass.states.set("sensor.test1", "10", attributes=attributes)
+        wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_significant_states_with_session",
+        wraps=history.get_significant_states_with_session,
+    ) as mock_significant_states:
+        recorder.do_adhoc_statistics(start=zero)
+        wait_recording_done(hass)
+        recorder.do_adhoc_statistics(start=zero + timedelta(minutes=5))
+        wait_recording_done(hass)
+        recorder.do_adhoc_statistics(start=zero + timedelta(minutes=10))
+        wait_recording_done(hass)
+    assert not mock_significant_states.called
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(zero),
+                "end": process_timestamp_to_utc_isoformat(zero + timedelta(minutes=5)),
+                "mean": approx(mean),
+                "min": approx(min),
+                "max": approx(max),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=5)
+                ),
+                "end": process_timestamp_to_utc_isoformat(zero + timedelta(minutes=10)),
+                # The last valid state is used while the sensor is unavailable
+                "mean": approx(max * 0.4 + ten * 0.6),
+                "min": approx(ten),
+                "max": approx(max),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(
+                    zero + timedelta(minutes=10)
+                ),
+                "end": process_timestamp_to_utc_isoformat(zero + timedelta(minutes=15)),
+                "mean": approx(ten),
+                "min": approx(ten),
+                "max": approx(ten),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+        ]
+    }
+    assert list_statistic_ids(hass)[0]["unit_of_measurement"] == native_unit
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
+def test_compile_hourly_statistics_running_restart(hass_recorder):
+    """Test statistics of periods which were not fully tracked are read from the database."""
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    zero -= timedelta(hours=1)
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    four, _ = record_states(hass, zero, "sensor.test1", TEMPERATURE_SENSOR_ATTRIBUTES)
+
+    # Start tracking in the middle of the period
+    with patch(
+        "homeassistant.components.recorder.dt_util.utcnow",
+        return_value=four,
+    ):
+        sensor_recorder._get_running_statistics(hass)
+        hass.block_till_done()
+
+    with patch.object(
+        history,
+        "get_significant_states_with_session",
+        wraps=history.get_significant_states_with_session,
+    ) as mock_significant_states:
+        recorder.do_adhoc_statistics(start=zero)
+        wait_recording_done(hass)
+    assert mock_significant_states.called
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats["sensor.test1"][0]["mean"] == approx(13.050847)
+    assert stats["sensor.test1"][0]["min"] == approx(-10)
+    assert stats["sensor.test1"][0]["max"] == approx(30)
+
+
 @pytest.mark.parametrize(
     "device_class,unit,native_unit",
     [
@@ -897,6 +1034,35 @@ def test_compile_hourly_sum_statistics_total_no_reset(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_sum_statistics_with_recorder_session(hass_recorder):
+    """Test the sum is continued from the last statistics in the compile session."""
+    period0 = dt_util.utcnow()
+    period1 = period0 + timedelta(minutes=5)
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    attributes = {
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit_of_measurement": "kWh",
+    }
+    seq = [10, 15, 20, 10, 30, 40, 50, 60, 70]
+    record_meter_states(hass, period0, "sensor.test1", attributes, seq)
+
+    # The compile must not read through the read only connections
+    with patch.object(recorder, "get_read_session", side_effect=AssertionError):
+        recorder.do_adhoc_statistics(start=period0)
+        wait_recording_done(hass)
+        recorder.do_adhoc_statistics(start=period1)
+        wait_recording_done(hass)
+
+    stats = statistics_during_period(hass, period0, period="5minute")
+    assert [stat["sum"] for stat in stats["sensor.test1"]] == [
+        approx(10.0),
+        approx(50.0),
+    ]
+
+
 @pytest.mark.parametrize(
     "device_class,unit,native_unit,factor",
     [
@@ -1,6 +1,6 @@
 """Tests for WebSocket API commands."""
 import datetime
-from unittest.mock import ANY, patch
+from unittest.mock import ANY, AsyncMock, patch
 
 from async_timeout import timeout
 import pytest
@@ -14,9 +14,9 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import URL
-from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity
+from homeassistant.helpers import entity, polling
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
@@ -412,6 +412,18 @@ async def test_get_states(hass, websocket_client):
     assert msg["result"] == states
 
 
+async def test_get_states_unserializable(hass, websocket_client, caplog):
+    """Test get_states command with a state that can not be serialized."""
+    hass.states.async_set("greeting.hello", "world", {"hello": object()})
+
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNKNOWN_ERROR
+    assert "Unable to serialize to JSON" in caplog.text
+
+
 async def test_get_services(hass, websocket_client):
     """Test get_services command."""
     await websocket_client.send_json({"id": 5, "type": "get_services"})
@@ -528,15 +540,15 @@ async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
     assert msg["result"][0]["entity_id"] == "test.entity"
 
 
-async def test_get_states_not_allows_nan(hass, websocket_client):
-    """Test get_states command not allows NaN floats."""
+async def test_get_states_serializes_nan_as_null(hass, websocket_client):
+    """Test get_states command serializes NaN floats as null."""
     hass.states.async_set("greeting.hello", "world", {"hello": float("NaN")})
 
     await websocket_client.send_json({"id": 5, "type": "get_states"})
 
     msg = await websocket_client.receive_json()
-    assert not msg["success"]
-    assert msg["error"]["code"] == const.ERR_UNKNOWN_ERROR
+    assert msg["success"]
+    assert msg["result"][0]["attributes"] == {"hello": None}
 
 
 async def test_subscribe_unsubscribe_events_whitelist(
@@ -602,6 +614,137 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_unsubscribe_entities(hass, websocket_client, hass_admin_user):
+    """Test subscribe/unsubscribe entities."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    original_state = hass.states.get("light.permitted")
+    assert isinstance(original_state, State)
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    hass.states.async_set("light.not_permitted", "off")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "a": {"color": "red"},
+                "c": original_state.context.id,
+                "lc": original_state.last_changed.timestamp(),
+                "s": "off",
+            }
+        }
+    }
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    hass.states.async_set(
+        "light.permitted", "on", {"effect": "help"}, context=Context(user_id="user")
+    )
+    hass.states.async_remove("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    state = hass.states.get("light.permitted")
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"color": "blue"},
+                    "c": ANY,
+                    "lc": ANY,
+                    "s": "on",
+                }
+            }
+        }
+    }
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"effect": "help"},
+                    "c": {"id": ANY, "parent_id": None, "user_id": "user"},
+                    "lu": ANY,
+                },
+                "-": {"a": ["color"]},
+            }
+        }
+    }
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+    assert state is None
+
+
+async def test_subscribe_entities_with_entity_ids(hass, websocket_client):
+    """Test subscribe entities with an entity_ids filter."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.bedroom", "off")
+    kitchen = hass.states.get("light.kitchen")
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.kitchen", "light.garage"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {
+            "light.kitchen": {
+                "a": {},
+                "c": kitchen.context.id,
+                "lc": kitchen.last_changed.timestamp(),
+                "s": "off",
+            }
+        }
+    }
+
+    hass.states.async_set("light.bedroom", "on")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.garage", "on")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {
+            "light.garage": {
+                "a": {},
+                "c": ANY,
+                "lc": ANY,
+                "s": "on",
+            }
+        }
+    }
+
+
 async def test_render_template_renders_template(hass, websocket_client):
     """Test simple template is rendered and updated."""
     hass.states.async_set("light.test", "on")
@@ -1197,3 +1340,22 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         {"domain": "august", "seconds": 12.5},
         {"domain": "isy994", "seconds": 12.8},
     ]
+
+
+async def test_poll_stats(hass, websocket_client):
+    """Test the poll stats of the entity platforms."""
+    scheduler = polling.async_get_poll_scheduler(hass)
+    await scheduler.async_poll(
+        "sensor.test", datetime.timedelta(seconds=30), AsyncMock()
+    )
+
+    await websocket_client.send_json({"id": 7, "type": "entity_platform/poll_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {"platform": "sensor.test", **scheduler.async_get_stats()["sensor.test"]}
+    ]
+    assert msg["result"][0]["count"] == 1
@@ -13,6 +13,7 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_platform,
     entity_registry as er,
+    polling,
 )
 from homeassistant.helpers.entity import async_generate_entity_id
 from homeassistant.helpers.entity_component import (
@@ -57,6 +58,120 @@ async def test_polling_only_updates_entities_it_should_poll(hass):
     assert poll_ent.async_update.called
 
 
+async def test_polling_through_scheduler(hass):
+    """Test platforms poll through the scheduler with a shared budget."""
+    entity_platform = MockEntityPlatform(hass)
+    entity_platform.config_entry = MockConfigEntry(
+        entry_id="abc", data={"host": "1.2.3.4"}
+    )
+    other_platform = MockEntityPlatform(hass, domain="switch")
+    other_platform.config_entry = MockConfigEntry(entry_id="def")
+
+    poll_ent = MockEntity(should_poll=True)
+    poll_ent.async_update = Mock()
+    other_ent = MockEntity(should_poll=True)
+    other_ent.async_update = Mock()
+    await entity_platform.async_add_entities([poll_ent])
+    await other_platform.async_add_entities([other_ent])
+
+    with patch(
+        "homeassistant.helpers.polling.PollScheduler.async_poll",
+        wraps=polling.async_get_poll_scheduler(hass).async_poll,
+    ) as mock_poll:
+        async_fire_time_changed(hass, dt_util.utcnow() + DEFAULT_SCAN_INTERVAL)
+        await hass.async_block_till_done()
+
+    assert poll_ent.async_update.called
+    assert other_ent.async_update.called
+    assert sorted(
+        (poll_call.args[0], poll_call.args[3]) for poll_call in mock_poll.call_args_list
+    ) == [
+        ("switch.test_platform.def", "config_entry:def"),
+        ("test_domain.test_platform.abc", "host:1.2.3.4"),
+    ]
+    stats = polling.async_get_poll_scheduler(hass).async_get_stats()
+    assert stats["test_domain.test_platform.abc"]["count"] == 1
+
+    await entity_platform.async_reset()
+    assert "test_domain.test_platform.abc" not in (
+        polling.async_get_poll_scheduler(hass).async_get_stats()
+    )
+
+
+async def test_polling_yaml_platforms_separately(hass):
+    """Test YAML platforms with their own interval or namespace poll separately."""
+    platforms = [
+        MockEntityPlatform(hass),
+        MockEntityPlatform(hass, scan_interval=timedelta(seconds=30)),
+        MockEntityPlatform(hass, entity_namespace="garden"),
+    ]
+    for platform in platforms:
+        poll_ent = MockEntity(should_poll=True)
+        poll_ent.async_update = Mock()
+        await platform.async_add_entities([poll_ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+
+    stats = polling.async_get_poll_scheduler(hass).async_get_stats()
+    assert sorted(stats) == [
+        "test_domain.test_platform.garden@15s",
+        "test_domain.test_platform@15s",
+        "test_domain.test_platform@30s",
+    ]
+
+    await platforms[0].async_reset()
+    assert sorted(polling.async_get_poll_scheduler(hass).async_get_stats()) == [
+        "test_domain.test_platform.garden@15s",
+        "test_domain.test_platform@30s",
+    ]
+
+
+async def test_polling_waits_for_budget_without_lock(hass, caplog):
+    """Test a platform waiting for its poll budget is not reported as slow."""
+    polling.async_get_poll_scheduler(hass).async_set_budget("host:1.2.3.4", 1)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_update():
+        started.set()
+        await release.wait()
+
+    platforms = []
+    entities = []
+    for entry_id, update in (("abc", slow_update), ("def", None)):
+        platform = MockEntityPlatform(hass)
+        platform.config_entry = MockConfigEntry(
+            entry_id=entry_id, data={"host": "1.2.3.4"}
+        )
+        poll_ent = MockEntity(should_poll=True)
+        poll_ent.async_update = Mock(side_effect=update)
+        await platform.async_add_entities([poll_ent])
+        platforms.append(platform)
+        entities.append(poll_ent)
+
+    slow_poll = hass.async_create_task(
+        platforms[0]._update_entity_states(dt_util.utcnow())
+    )
+    await started.wait()
+    waiting_poll = hass.async_create_task(
+        platforms[1]._update_entity_states(dt_util.utcnow())
+    )
+    try:
+        await asyncio.sleep(0)
+        assert not entities[1].async_update.called
+
+        # The waiting platform skips the tick without a warning
+        await platforms[1]._update_entity_states(dt_util.utcnow())
+        assert "took longer than the scheduled update interval" not in caplog.text
+    finally:
+        release.set()
+
+    await slow_poll
+    await waiting_poll
+    assert entities[1].async_update.call_count == 1
+
+
 async def test_polling_disabled_by_config_entry(hass):
     """Test the polling of only updated entities."""
     entity_platform = MockEntityPlatform(hass)
@@ -1,10 +1,17 @@
 """Test Home Assistant remote methods and classes."""
 import datetime
+import json
 
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers.json import (
+    ExtendedJSONEncoder,
+    JSONEncoder,
+    _stdlib_json_dumps,
+    json_bytes,
+    json_dumps,
+)
 from homeassistant.util import dt as dt_util
 
 
@@ -64,3 +71,39 @@ def test_extended_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+def test_json_dumps(hass):
+    """Test the fast JSON serializer matches the JSON encoder."""
+    state = core.State("test.test", "hello", {"list": {"beer"}, "int": 1})
+    data = {"state": state, "now": dt_util.utcnow(), 1: "integer key"}
+
+    assert json.loads(json_dumps(data)) == json.loads(json.dumps(data, cls=JSONEncoder))
+    assert json_bytes(data) == json_dumps(data).encode("utf-8")
+
+
+def test_json_dumps_big_int(hass):
+    """Test the fast JSON serializer handles integers larger than 64 bits."""
+    assert json_dumps({"big": 2 ** 70}) == '{"big":1180591620717411303424}'
+
+
+def test_json_dumps_raises(hass):
+    """Test the fast JSON serializer raises on unsupported types."""
+    with pytest.raises(TypeError):
+        json_dumps({"object": object()})
+
+
+def test_json_dumps_nan(hass):
+    """Test NaN and infinite floats are serialized as null with and without orjson."""
+    state = core.State("test.test", "hello", {"nan": float("nan")})
+    data = {"state": state, "inf": [float("inf")]}
+
+    assert json_dumps(data) == _stdlib_json_dumps(data)
+    assert json.loads(json_dumps(data)) == {
+        "state": {**json.loads(json_dumps(state)), "attributes": {"nan": None}},
+        "inf": [None],
+    }
+    # Integers larger than 64 bits are handed to the standard library
+    assert json_dumps({"big": 2 ** 70, "nan": float("nan")}) == (
+        '{"big":1180591620717411303424,"nan":null}'
+    )
@@ -0,0 +1,121 @@
+"""Tests for the poll scheduler helper."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.helpers import polling
+
+INTERVAL = timedelta(seconds=30)
+
+
+async def test_poll_jitter(hass):
+    """Test every platform polls at its own fixed offset."""
+    scheduler = polling.PollScheduler(hass)
+    poll = AsyncMock()
+
+    with patch(
+        "homeassistant.helpers.polling.uniform", return_value=4
+    ) as mock_uniform, patch(
+        "homeassistant.helpers.polling.asyncio.sleep"
+    ) as mock_sleep:
+        await scheduler.async_poll("sensor.test", INTERVAL, poll)
+        await scheduler.async_poll("sensor.test", INTERVAL, poll)
+
+    assert poll.call_count == 2
+    mock_uniform.assert_called_once_with(0, 6)
+    assert mock_sleep.call_args_list == [((4,),), ((4,),)]
+
+    with patch("homeassistant.helpers.polling.asyncio.sleep") as mock_sleep:
+        await scheduler.async_poll("sensor.long", timedelta(minutes=10), poll)
+    assert 0 <= mock_sleep.call_args[0][0] <= polling.MAX_POLL_JITTER
+
+
+async def test_poll_budget(hass):
+    """Test platforms sharing a budget key are limited in concurrent polls."""
+    scheduler = polling.PollScheduler(hass, max_jitter=0)
+    scheduler.async_set_budget("host:1.2.3.4", 1)
+    running = 0
+    max_running = 0
+
+    async def poll():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    await asyncio.gather(
+        scheduler.async_poll("sensor.test", INTERVAL, poll, "host:1.2.3.4"),
+        scheduler.async_poll("switch.test", INTERVAL, poll, "host:1.2.3.4"),
+    )
+    assert max_running == 1
+
+    await asyncio.gather(
+        scheduler.async_poll("sensor.other", INTERVAL, poll, "config_entry:abc"),
+        scheduler.async_poll("switch.other", INTERVAL, poll, "config_entry:abc"),
+        scheduler.async_poll("light.other", INTERVAL, poll),
+    )
+    # Without a budget, polls are not limited
+    assert max_running == 3
+
+    # The budget is removed with the last platform using it
+    scheduler.async_remove("sensor.test", "host:1.2.3.4")
+    assert "host:1.2.3.4" in scheduler._budgets
+    scheduler.async_remove("switch.test", "host:1.2.3.4")
+    assert "host:1.2.3.4" not in scheduler._budgets
+    assert "host:1.2.3.4" not in scheduler._budget_users
+
+    max_running = 0
+    await asyncio.gather(
+        scheduler.async_poll("sensor.test", INTERVAL, poll, "host:1.2.3.4"),
+        scheduler.async_poll("switch.test", INTERVAL, poll, "host:1.2.3.4"),
+    )
+    assert max_running == 2
+
+
+async def test_poll_backoff_and_stats(hass):
+    """Test slow polls skip intervals and polls are recorded in a histogram."""
+    scheduler = polling.PollScheduler(hass, max_jitter=0)
+    poll = AsyncMock()
+
+    async def async_poll(duration):
+        """Poll taking a duration."""
+
+        async def timed_poll(poll):
+            await poll()
+            return duration
+
+        with patch("homeassistant.helpers.polling._async_timed", new=timed_poll):
+            await scheduler.async_poll("sensor.test", INTERVAL, poll)
+
+    await async_poll(40)
+    assert poll.call_count == 1
+    # The next interval is skipped
+    await async_poll(0.2)
+    assert poll.call_count == 1
+    await async_poll(40)
+    assert poll.call_count == 2
+    # Still slow, skip three intervals
+    for _ in range(3):
+        await async_poll(0.2)
+    assert poll.call_count == 2
+    # Fast again, skip one interval less each time
+    await async_poll(0.2)
+    assert poll.call_count == 3
+    await async_poll(0.2)
+    assert poll.call_count == 3
+    await async_poll(0.2)
+    assert poll.call_count == 4
+
+    stats = scheduler.async_get_stats()["sensor.test"]
+    assert stats["count"] == 4
+    assert stats["sum"] == 80.4
+    assert stats["backoff"] == 1
+    assert stats["buckets"]["0.1"] == 0
+    assert stats["buckets"]["0.25"] == 2
+    assert stats["buckets"]["30"] == 2
+    assert stats["buckets"]["60"] == 4
+    assert stats["buckets"]["+Inf"] == 4
+
+    scheduler.async_remove("sensor.test")
+    assert scheduler.async_get_stats() == {}
@@ -21,6 +21,7 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import device_registry as dr, template
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.lru import LRU
 from homeassistant.util.unit_system import UnitSystem
 
 from tests.common import (
@@ -2792,6 +2793,17 @@ def test_state_with_unit(hass):
     assert tpl.async_render() == ""
 
 
+def test_template_state_json(hass):
+    """Test the JSON properties of a template state are wrapped."""
+    hass.states.async_set("sensor.test", "23", {ATTR_UNIT_OF_MEASUREMENT: "beers"})
+    state = hass.states.get("sensor.test")
+
+    template_state = template.TemplateState(hass, state)
+
+    assert template_state.attributes_json == state.attributes_json
+    assert template_state.as_dict_json == state.as_dict_json
+
+
 def test_length_of_states(hass):
     """Test fetching the length of states."""
     hass.states.async_set("sensor.test", "23")
@@ -2826,35 +2838,42 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_template_cache(hass):
+    """Test compiled templates are shared by templates with the same source."""
     template_string = (
-        "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
-    )
-    tpl = template.Template(
-        (template_string),
+        "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }} cache"
     )
+    info = template.compiled_template_cache_info()
+
+    tpl = template.Template(template_string)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template.compiled_template_cache_info()["misses"] == info["misses"] + 1
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string, hass)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    # pylint: disable=protected-access
+    assert tpl2._compiled_code is tpl._compiled_code
+    assert template.compiled_template_cache_info()["hits"] == info["hits"] + 1
+
+    # The compiled code outlives the templates using it
+    del tpl, tpl2
+    tpl3 = template.Template(template_string)
+    tpl3.ensure_valid()
+    assert template.compiled_template_cache_info()["hits"] == info["hits"] + 2
+
+    info = template.compiled_template_cache_info()
+    assert info["size"] <= info["maxsize"] == template.COMPILED_TEMPLATE_CACHE_SIZE
+
+
+async def test_compiled_template_cache_size_bounded(hass):
+    """Test the compiled template cache evicts the least recently used code."""
+    with patch.object(template, "_COMPILED_TEMPLATE_CACHE", LRU(2)):
+        for idx in range(3):
+            template.Template(f"{{{{ {idx} }}}}", hass).ensure_valid()
+
+        info = template.compiled_template_cache_info()
+        assert info["size"] == 2
+        assert info["misses"] == 3
 
 
 def test_is_template_string():
@@ -719,3 +719,79 @@ async def test_warning_logged_on_wrap_up_timeout(hass, caplog):
         await hass.async_block_till_done()
 
     assert "Setup timed out for bootstrap - moving forward" in caplog.text
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_timeline_critical_path(hass):
+    """Test reporting the setups that gated the end of bootstrap."""
+    integrations = {
+        domain: mock_integration(hass, MockModule(domain, dependencies))
+        for domain, dependencies in (
+            ("logger", []),
+            ("http", []),
+            ("frontend", ["http"]),
+            ("recorder", []),
+            ("group", []),
+            ("light", ["group"]),
+            ("zone", []),
+        )
+    }
+    timeline = bootstrap.SetupTimeline(integrations)
+    now = 0
+
+    async def _async_setup(end):
+        nonlocal now
+        now = end
+        return True
+
+    with patch("homeassistant.bootstrap.monotonic", side_effect=lambda: now):
+        for domain, start, end in (
+            ("logger", 0, 1),
+            ("http", 1, 3),
+            ("frontend", 1, 4),
+            ("recorder", 1, 2),
+            ("group", 4, 6),
+            ("light", 4, 7),
+            ("zone", 4, 4.5),
+        ):
+            now = start
+            assert await timeline.async_track(domain, _async_setup(end))
+
+    assert timeline.critical_path() == [
+        ("logger", 1),
+        ("http", 2),
+        ("frontend", 1),
+        ("group", 2),
+        ("light", 1),
+    ]
+    assert bootstrap.SetupTimeline({}).critical_path() == []
+
+
+async def test_preload_components_requirements_not_installed(hass):
+    """Test components are only preloaded once their requirements are installed."""
+    hass.config.skip_pip = False
+    integrations = {
+        domain: mock_integration(
+            hass, MockModule(domain, dependencies, requirements=requirements)
+        )
+        for domain, dependencies, requirements in (
+            ("installed", [], ["installed==1.0"]),
+            ("no_requirements", [], []),
+            ("missing", [], ["missing==1.0"]),
+            ("missing_dependency", ["missing"], []),
+        )
+    }
+    for integration in integrations.values():
+        assert await integration.resolve_dependencies()
+
+    with patch(
+        "homeassistant.bootstrap.is_installed",
+        side_effect=lambda req: req == "installed==1.0",
+    ), patch(
+        "homeassistant.loader.Integration.async_get_component"
+    ) as mock_get_component:
+        await bootstrap._async_preload_components(
+            hass, integrations.values(), integrations
+        )
+
+    assert len(mock_get_component.mock_calls) == 2
@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -38,6 +39,7 @@ from homeassistant.exceptions import (
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -383,6 +385,28 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_dict_json():
+    """Test a State serialized to JSON."""
+    state = ha.State("happy.happy", "on", {"pig": "dog", "pigs": {"pig"}})
+
+    assert json.loads(state.as_dict_json) == json.loads(
+        json.dumps(state.as_dict(), cls=JSONEncoder)
+    )
+    assert state.as_dict_json is state.as_dict_json
+    assert json.loads(state.attributes_json) == {"pig": "dog", "pigs": ["pig"]}
+    assert state.attributes_json is state.attributes_json
+
+
+def test_state_as_dict_json_unserializable():
+    """Test serializing a State with attributes that are not serializable."""
+    state = ha.State("happy.happy", "on", {"pig": object()})
+
+    with pytest.raises(TypeError):
+        state.as_dict_json
+    with pytest.raises(TypeError):
+        state.attributes_json
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -431,6 +455,107 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass):
+    """Test listening for events by entity_id and domain."""
+    entity_calls = []
+    domain_calls = []
+
+    @ha.callback
+    def entity_listener(event):
+        """Mock entity listener."""
+        entity_calls.append(event)
+
+    @ha.callback
+    def domain_listener(event):
+        """Mock domain listener."""
+        domain_calls.append(event)
+
+    unsub_entity = hass.bus.async_listen_keyed(
+        "test", ["light.kitchen", "light.bedroom"], entity_listener
+    )
+    unsub_domain = hass.bus.async_listen_keyed("test", "switch", domain_listener)
+    assert hass.bus.async_listeners()["test"] == 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test", {"entity_id": "light.garage"})
+    hass.bus.async_fire("test", {"entity_id": "switch.garage"})
+    hass.bus.async_fire("test", {"entity_id": "switch"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in entity_calls] == [
+        "light.kitchen",
+        "light.bedroom",
+    ]
+    assert [event.data["entity_id"] for event in domain_calls] == [
+        "switch.garage",
+        "switch",
+    ]
+
+    unsub_entity()
+    assert hass.bus.async_listeners()["test"] == 1
+    unsub_domain()
+    assert "test" not in hass.bus.async_listeners()
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "switch.garage"})
+    await hass.async_block_till_done()
+
+    assert len(entity_calls) == 2
+    assert len(domain_calls) == 2
+
+
+async def test_eventbus_keyed_listener_overlapping_keys(hass):
+    """Test a keyed listener runs once when several of its keys match."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", ["light.kitchen", "light", "light.kitchen"], listener
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.bedroom",
+    ]
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_keyed_and_filtered_listeners(hass):
+    """Test keyed listeners run next to the other listeners of an event."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub_keyed = hass.bus.async_listen_keyed("test", "light.kitchen", listener)
+    unsub = hass.bus.async_listen("test", listener)
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert hass.bus.async_listeners()["test"] == 2
+
+    unsub_keyed()
+    unsub()
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -1270,6 +1395,20 @@ def test_context():
     assert c.parent_id == 100
     assert c.id is not None
 
+    assert ha.Context(id=None).id is None
+
+
+def test_context_eq_hash():
+    """Test context comparison and hashing."""
+    context = ha.Context(user_id="user", parent_id="parent")
+    same = ha.Context(user_id="user", parent_id="parent", id=context.id)
+
+    assert context == same
+    assert hash(context) == hash(same)
+    assert context != ha.Context(user_id="user", parent_id="parent")
+    assert context != context.as_dict()
+    assert {context: 1}[same] == 1
+
 
 async def test_async_functions_with_callback(hass):
     """Test we deal with async functions accidentally marked as callback."""
@@ -1,4 +1,7 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import json
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -6,8 +9,9 @@ import pytest
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+import homeassistant.util.dt as dt_util
 
-from tests.common import MockModule, mock_integration
+from tests.common import MockModule, async_fire_time_changed, mock_integration
 
 
 async def test_component_dependencies(hass):
@@ -171,6 +175,99 @@ async def test_get_integration_custom_component(hass, enable_custom_integrations
     assert integration.name == "Test Package"
 
 
+async def test_async_get_component_imports_in_executor(
+    hass, enable_custom_integrations
+):
+    """Test components that are not loaded yet are imported in the executor."""
+    integration = await loader.async_get_integration(hass, "test_package")
+
+    with patch.dict(sys.modules), patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor_job:
+        sys.modules.pop(integration.pkg_path, None)
+        component = await integration.async_get_component()
+        assert mock_executor_job.call_count == 1
+
+        assert component.DOMAIN == "test_package"
+
+        # A loaded component is returned right away
+        assert await integration.async_get_component() is component
+        assert mock_executor_job.call_count == 1
+
+
+async def test_manifest_index(hass, hass_storage, tmp_path):
+    """Test manifests are served from the index until their file changes."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps({"domain": "test", "name": "Test"}))
+    stat = manifest_path.stat()
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY] = {
+        "version": loader.MANIFEST_INDEX_STORAGE_VERSION,
+        "key": loader.MANIFEST_INDEX_STORAGE_KEY,
+        "data": {
+            "manifests": {
+                str(manifest_path): {
+                    "mtime": stat.st_mtime,
+                    "size": stat.st_size,
+                    "manifest": {"domain": "test", "name": "Indexed"},
+                }
+            }
+        },
+    }
+    hass.data.pop(loader.DATA_MANIFEST_INDEX, None)
+    index = await loader.async_get_manifest_index(hass)
+    assert await loader.async_get_manifest_index(hass) is index
+
+    def read_manifest():
+        return index.read_manifest(manifest_path)
+
+    assert await hass.async_add_executor_job(read_manifest) == {
+        "domain": "test",
+        "name": "Indexed",
+    }
+
+    manifest_path.write_text(json.dumps({"domain": "test", "name": "Changed"}))
+    assert await hass.async_add_executor_job(read_manifest) == {
+        "domain": "test",
+        "name": "Changed",
+    }
+    with patch("pathlib.Path.read_text", side_effect=AssertionError):
+        assert await hass.async_add_executor_job(read_manifest) == {
+            "domain": "test",
+            "name": "Changed",
+        }
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]["manifests"]
+    assert stored[str(manifest_path)]["manifest"]["name"] == "Changed"
+
+    # The index is saved once Home Assistant has started
+    hass.state = core.CoreState.not_running
+    manifest_path.unlink()
+    assert await hass.async_add_executor_job(read_manifest) is None
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY * 2),
+    )
+    await hass.async_block_till_done()
+    assert (
+        str(manifest_path)
+        in hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]["manifests"]
+    )
+
+    await hass.async_start()
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY * 3),
+    )
+    await hass.async_block_till_done()
+    assert hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]["manifests"] == {}
+
+
 def test_integration_properties(hass):
     """Test integration properties."""
     integration = loader.Integration(
@@ -1,4 +1,5 @@
 """Test Home Assistant json utility functions."""
+import dataclasses
 from datetime import datetime
 from functools import partial
 from json import JSONEncoder, dumps
@@ -7,7 +8,7 @@ import os
 import sys
 from tempfile import mkdtemp
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -76,6 +77,47 @@ def test_overwrite_and_reload():
     assert data == TEST_JSON_B
 
 
+def test_save_same_without_orjson():
+    """Test the standard library writes the same file as orjson."""
+    data = {"a": [1, float("nan")], "b": {"c": float("inf")}}
+    fname = _path_for("test_orjson")
+    save_json(fname, data)
+    with open(fname) as fh:
+        orjson_data = fh.read()
+    with patch("homeassistant.util.json.orjson", None):
+        save_json(fname, data)
+    with open(fname) as fh:
+        assert fh.read() == orjson_data
+    assert load_json(fname) == {"a": [1, None], "b": {"c": None}}
+
+
+def test_save_indented_with_4_spaces():
+    """Test files are indented with 4 spaces with and without orjson."""
+    data = {"a": [1, {"b": "two\n  three"}], "c": {}}
+    expected = dumps(data, indent=4)
+    fname = _path_for("test_indent")
+    save_json(fname, data)
+    with open(fname) as fh:
+        assert fh.read() == expected
+    with patch("homeassistant.util.json.orjson", None):
+        save_json(fname, data)
+    with open(fname) as fh:
+        assert fh.read() == expected
+
+
+@pytest.mark.parametrize(
+    "bad_data", [datetime(2021, 11, 1, 12, 0), dataclasses.make_dataclass("A", [])()]
+)
+def test_save_rejects_like_stdlib(bad_data):
+    """Test orjson does not serialize types the standard library rejects."""
+    with pytest.raises(SerializationError):
+        save_json("test_rejects", {"bad": bad_data})
+    with patch("homeassistant.util.json.orjson", None), pytest.raises(
+        SerializationError
+    ):
+        save_json("test_rejects", {"bad": bad_data})
+
+
 def test_save_bad_data():
     """Test error from trying to save unserialisable data."""
     with pytest.raises(SerializationError) as excinfo:
@@ -0,0 +1,55 @@
+"""Test Home Assistant lru utility functions."""
+import pytest
+
+from homeassistant.util.lru import LRU
+
+
+def test_lru_evicts_least_recently_used():
+    """Test the least recently used key is evicted when full."""
+    lru = LRU(2)
+    lru["a"] = 1
+    lru["b"] = 2
+    assert lru.get("a") == 1
+    lru["c"] = 3
+
+    assert "b" not in lru
+    assert lru.keys() == ["a", "c"]
+    assert len(lru) == 2
+
+
+def test_lru_hits_and_misses():
+    """Test the hit and miss counters."""
+    lru = LRU(4)
+    lru["a"] = 1
+
+    assert lru.get("a") == 1
+    assert lru.get("b") is None
+    assert lru.get("b", 5) == 5
+    assert lru.hits == 1
+    assert lru.misses == 2
+
+    lru.clear()
+    assert len(lru) == 0
+    assert lru.hits == 0
+    assert lru.misses == 0
+
+
+def test_lru_pop_and_delete():
+    """Test removing keys."""
+    lru = LRU(4)
+    lru["a"] = 1
+    lru["b"] = 2
+
+    assert lru.pop("a") == 1
+    assert lru.pop("a") is None
+    del lru["b"]
+    assert lru.items() == []
+
+    with pytest.raises(KeyError):
+        lru["b"]
+
+
+def test_lru_invalid_size():
+    """Test the size must be positive."""
+    with pytest.raises(ValueError):
+        LRU(0)